@@ -0,0 +1,215 @@
+"""Micro-benchmark helper database (get_user, inventori, daily usage)
+
+Jalankan: python benchmarks/bench_db.py [--sizes 1000,100000,1000000] [--output results.json]
+                                        [--compare baseline.json --threshold 0.25]
+
+Tiap helper dari bot.py diukur terhadap tabel berisi 1k/100k/1M baris
+(users, inventory dan daily_usage masing-masing N baris) dalam dua kondisi:
+
+- warm: key yang sama berulang, koneksi dari pool dan file DB sudah ada
+  di page cache OS
+- cold: key acak di seluruh tabel; pool koneksi ditutup (cache halaman
+  SQLite ikut hilang) dan page cache OS untuk file DB dibuang
+  (posix_fadvise DONTNEED) sebelum tiap panggilan
+
+Hasil disimpan sebagai JSON (median/mean/min/stddev per benchmark). Dengan
+--compare, benchmark yang median-nya lebih lambat dari baseline melebihi
+--threshold (0.25 = 25%) dianggap regresi dan exit code menjadi 1.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ITEMS = [
+    ("Botol Plastik", "recyclable", 10),
+    ("Kaleng Bekas", "recyclable", 15),
+    ("HP Rusak", "electronics", 80),
+    ("Kalung Emas", "legendary", 500),
+]
+
+HELPERS = ['get_user', 'add_to_inventory', 'remove_from_inventory',
+           'get_inventory_count', 'get_daily_usage', 'increment_daily_usage']
+
+
+def load_bot():
+    os.environ.setdefault('OWNER_ID', '0')
+    os.environ.pop('IPC_SOCKET', None)
+    sys.path.insert(0, ROOT)
+    import bot
+    return bot
+
+
+def populate(path, rows):
+    """Isi users, inventory dan daily_usage masing-masing `rows` baris"""
+    db = sqlite3.connect(path)
+    with db:
+        db.executemany("INSERT INTO users (user_id, balance, vip) VALUES (?, ?, ?)",
+                       ((user_id, 100 + user_id % 1000, user_id % 2) for user_id in range(rows)))
+        db.executemany(
+            "INSERT INTO inventory (user_id, item_name, item_category, item_value, quantity) VALUES (?, ?, ?, ?, ?)",
+            ((user_id, *ITEMS[user_id % len(ITEMS)], 1) for user_id in range(rows)))
+        db.executemany("INSERT INTO daily_usage (user_id, cari_count, last_reset) VALUES (?, ?, date('now'))",
+                       ((user_id, user_id % 10) for user_id in range(rows)))
+    db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    db.close()
+
+
+def drop_os_cache(path):
+    """Buang page cache OS untuk file DB (no-op kalau platform tidak mendukung)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            fd = os.open(path + suffix, os.O_RDONLY)
+        except FileNotFoundError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def make_call(bot, name, user_id):
+    """Coroutine satu panggilan helper untuk user tertentu"""
+    if name == 'get_user':
+        return bot.get_user(user_id)
+    if name == 'add_to_inventory':
+        return bot.add_to_inventory(user_id, *ITEMS[0])
+    if name == 'remove_from_inventory':
+        return bot.remove_from_inventory(user_id, ITEMS[0][0])
+    if name == 'get_inventory_count':
+        return bot.get_inventory_count(user_id)
+    if name == 'get_daily_usage':
+        return bot.get_daily_usage(user_id)
+    if name == 'increment_daily_usage':
+        return bot.increment_daily_usage(user_id)
+    raise ValueError(name)
+
+
+async def measure(bot, name, db_path, rows, cold, min_time, max_rounds, rng):
+    samples = []
+    warm_user = rows // 2
+    budget_end = time.perf_counter() + min_time
+    while len(samples) < max_rounds and (len(samples) < 5 or time.perf_counter() < budget_end):
+        user_id = rng.randrange(rows) if cold else warm_user
+        if name == 'remove_from_inventory':
+            # Pastikan ada barang untuk dihapus (tidak ikut diukur)
+            await bot.add_to_inventory(user_id, *ITEMS[0])
+        if cold:
+            await bot.storage.close()
+            drop_os_cache(db_path)
+        start = time.perf_counter()
+        await make_call(bot, name, user_id)
+        samples.append(time.perf_counter() - start)
+    return {
+        'rounds': len(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'min': min(samples),
+        'stddev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+async def run_size(bot, rows, args, rng):
+    from storage import SQLiteStorage
+
+    workdir = tempfile.mkdtemp(prefix='alphad-bench-')
+    db_path = os.path.join(workdir, 'userdata.db')
+    bot.set_storage(SQLiteStorage(db_path, busy_timeout=bot.DB_BUSY_TIMEOUT))
+    await bot.init_db()
+    started = time.perf_counter()
+    populate(db_path, rows)
+    print(f"populated {rows} rows in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    results = {}
+    for name in HELPERS:
+        for cold in (False, True):
+            key = f"{name}[{rows}-{'cold' if cold else 'warm'}]"
+            results[key] = await measure(bot, name, db_path, rows, cold,
+                                         args.min_time, args.max_rounds, rng)
+            print(f"{key:45s} median {results[key]['median'] * 1000:8.3f} ms", file=sys.stderr)
+    await bot.storage.close()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.unlink(db_path + suffix)
+    os.rmdir(workdir)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Bandingkan median dengan baseline; kembalikan list regresi"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get('results', {}).get(key)
+        if previous is None:
+            continue
+        ratio = current['median'] / previous['median']
+        if ratio > 1 + threshold:
+            regressions.append({'benchmark': key, 'baseline_median': previous['median'],
+                                'median': current['median'], 'ratio': round(ratio, 3)})
+    return regressions
+
+
+async def main_async(args):
+    bot = load_bot()
+    rng = random.Random(args.seed)
+    results = {}
+    for rows in args.sizes:
+        results.update(await run_size(bot, rows, args, rng))
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        },
+        'results': results,
+    }
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        report['regressions'] = compare(results, baseline, args.threshold)
+        for regression in report['regressions']:
+            print(f"REGRESSION {regression['benchmark']}: {regression['ratio']}x slower than baseline",
+                  file=sys.stderr)
+        status = 1 if report['regressions'] else 0
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1000,100000,1000000',
+                        type=lambda value: [int(size) for size in value.split(',')])
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help="waktu minimum per benchmark (detik)")
+    parser.add_argument('--max-rounds', type=int, default=200)
+    parser.add_argument('--output', help="simpan hasil JSON ke file")
+    parser.add_argument('--compare', help="file JSON baseline untuk deteksi regresi")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="batas perlambatan median terhadap baseline (0.25 = 25%%)")
+    parser.add_argument('--seed', type=int, default=0)
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark startup time dan RSS web server keep-alive: Flask thread vs asyncio
+
+Jalankan: python benchmarks/bench_keepalive.py [--runs 5]
+
+Setiap pengukuran dijalankan di proses baru supaya waktu import dan RSS
+tidak tercampur. Backend Flask dilewati kalau Flask tidak terinstall.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_kb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def wait_for_port(port, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2) as s:
+                s.sendall(b"GET / HTTP/1.0\r\n\r\n")
+                if s.recv(64).startswith(b"HTTP/"):
+                    return True
+        except OSError:
+            time.sleep(0.005)
+    return False
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def child(backend):
+    start = time.perf_counter()
+    port = free_port()
+    baseline_rss = rss_kb()
+    if backend == 'flask':
+        from threading import Thread
+        from flask import Flask
+
+        app = Flask('')
+
+        @app.route('/')
+        def home():
+            return "Bot is alive!"
+
+        Thread(target=app.run, kwargs={'host': '127.0.0.1', 'port': port}, daemon=True).start()
+        ok = wait_for_port(port)
+    else:
+        import asyncio
+        import threading
+        sys.path.insert(0, ROOT)
+        from webserver import WebServer
+
+        server = WebServer('127.0.0.1', port)
+        server.route('/')(lambda: "Bot is alive!")
+        ready = threading.Event()
+
+        async def main():
+            await server.start()
+            ready.set()
+            await asyncio.Event().wait()
+
+        # Loop di thread lain hanya supaya proses ini bisa polling port
+        threading.Thread(target=asyncio.run, args=(main(),), daemon=True).start()
+        ready.wait(10)
+        ok = wait_for_port(port)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'ok': ok, 'startup_s': elapsed,
+                      'rss_kb': rss_kb(), 'rss_delta_kb': rss_kb() - baseline_rss}))
+
+
+def measure(backend, runs):
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, __file__, '--child', backend],
+                             capture_output=True, text=True, timeout=60)
+        if out.returncode != 0:
+            return {'error': out.stderr.strip().splitlines()[-1]}
+        # Flask dev server mencetak banner, hasil ada di baris terakhir
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {
+        'startup_ms_median': round(statistics.median(r['startup_s'] for r in results) * 1000, 2),
+        'rss_kb_median': statistics.median(r['rss_kb'] for r in results),
+        'rss_delta_kb_median': statistics.median(r['rss_delta_kb'] for r in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--child', choices=['flask', 'asyncio'])
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    report = {backend: measure(backend, args.runs) for backend in ('flask', 'asyncio')}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
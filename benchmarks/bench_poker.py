@@ -0,0 +1,85 @@
+"""Benchmark evaluator poker dan house edge mode /gambling poker
+
+Jalankan: python benchmarks/bench_poker.py [--hands 1000000] [--simulate 200000]
+                                           [--qualify high-K] [--output results.json]
+
+- throughput evaluate() untuk tangan 5 dan 7 kartu acak (sudah dibuat
+  sebelum pengukuran, jadi yang diukur hanya evaluator)
+- house edge tiap varian dari simulasi headless dengan aturan kualifikasi
+  dealer (default poker.DEFAULT_QUALIFY), beserta standard error-nya
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import poker  # noqa: E402
+
+
+def bench_evaluate(size, hands, rng):
+    deck = list(range(52))
+    samples = [rng.sample(deck, size) for _ in range(hands)]
+    evaluate = poker.evaluate
+    start = time.perf_counter()
+    for hand in samples:
+        evaluate(hand)
+    elapsed = time.perf_counter() - start
+    return {'hands': hands, 'seconds': round(elapsed, 3), 'hands_per_second': round(hands / elapsed)}
+
+
+def bench_edge(variant, hands, min_dealer, rng):
+    outcomes = {'win': 0, 'lose': 0, 'push': 0}
+    start = time.perf_counter()
+    for _ in range(hands):
+        outcomes[poker.play(variant, min_dealer, rng)['outcome']] += 1
+    elapsed = time.perf_counter() - start
+    mean = (outcomes['win'] - outcomes['lose']) / hands
+    variance = (outcomes['win'] + outcomes['lose']) / hands - mean ** 2
+    return {
+        'hands': hands,
+        'outcomes': outcomes,
+        'house_edge': round(-mean, 5),
+        'stderr': round(math.sqrt(variance / hands), 5),
+        'hands_per_second': round(hands / elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hands', type=int, default=1000000, help="tangan per benchmark evaluator")
+    parser.add_argument('--simulate', type=int, default=200000, help="tangan per simulasi house edge")
+    parser.add_argument('--qualify', help="aturan kualifikasi dealer untuk semua varian")
+    parser.add_argument('--output', help="simpan hasil JSON ke file")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    start = time.perf_counter()
+    poker.build_tables()
+    report = {'build_seconds': round(time.perf_counter() - start, 3), 'evaluate': {}, 'house_edge': {}}
+    for size in (5, 7):
+        report['evaluate'][f'{size}-card'] = result = bench_evaluate(size, args.hands, rng)
+        print(f"evaluate {size}-card: {result['hands_per_second']:,} hands/s", file=sys.stderr)
+    for variant in poker.VARIANTS:
+        rule = args.qualify or poker.DEFAULT_QUALIFY[variant]
+        report['house_edge'][variant] = result = bench_edge(variant, args.simulate, poker.qualifier(rule), rng)
+        result['qualify'] = rule
+        print(f"{variant} ({rule}): house edge {result['house_edge'] * 100:.2f}% "
+              f"± {result['stderr'] * 100:.2f}%", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,442 @@
+"""Load test offline: jalankan callback command asli dari ribuan user simulasi
+
+Jalankan: python benchmarks/loadtest.py [--users 2000] [--actions 5] [--concurrency 200]
+                                        [--backend sqlite|memory] [--game-delay 0]
+
+Context, Member dan Interaction diganti objek tiruan ringan; tidak ada
+koneksi ke Discord. Callback command (cari, /cari, sell, give, jualall, gamble,
+transfer_slash, roulette beserta tombolnya, duel pvp) dipanggil langsung secara
+concurrent terhadap DB sementara. Laporan berisi throughput, latency p50/p95/p99 per command,
+waktu helper DB (termasuk menunggu lock) dan pelanggaran invariant:
+
+- total saldo harus sama dengan saldo awal + semua delta yang tercatat
+- jumlah barang di inventori harus sama dengan barang masuk - keluar
+- tidak ada inventori melebihi kapasitas dan tidak ada saldo negatif
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples):
+    return {
+        'count': len(samples),
+        'p50_ms': round(percentile(samples, 50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 95) * 1000, 3),
+        'p99_ms': round(percentile(samples, 99) * 1000, 3),
+        'max_ms': round(max(samples) * 1000, 3),
+    }
+
+
+# Objek tiruan discord.py
+
+class FakeMessage:
+    def __init__(self, content):
+        self.content = content
+
+    async def edit(self, content=None, **kwargs):
+        self.content = content
+
+
+class FakeChannel:
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.sent = 0
+        self.system_errors = 0
+
+    async def send(self, content=None, **kwargs):
+        self.sent += 1
+        # "Error sistem" berarti state DB berubah di tengah command
+        if content and "Error sistem" in content:
+            self.system_errors += 1
+        return FakeMessage(content)
+
+
+class FakeGuild:
+    def __init__(self, guild_id):
+        self.id = guild_id
+
+
+class FakeMember:
+    def __init__(self, user_id, bot=False):
+        self.id = user_id
+        self.name = f"user{user_id}"
+        self.display_name = self.name
+        self.mention = f"<@{user_id}>"
+        self.bot = bot
+
+    def __str__(self):
+        return self.name
+
+
+class FakeContext:
+    def __init__(self, author, channel, command_name):
+        self.author = author
+        self.channel = channel
+        self.guild = None
+        self.command = type('FakeCommand', (), {'qualified_name': command_name})()
+        self.messages = []
+
+    async def send(self, content=None, **kwargs):
+        self.messages.append(content)
+        return await self.channel.send(content)
+
+    async def reply(self, content=None, **kwargs):
+        return await self.send(content, **kwargs)
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self._done = False
+
+    def is_done(self):
+        return self._done
+
+    async def send_message(self, content=None, **kwargs):
+        self._done = True
+        self.interaction.messages.append(content)
+
+    async def defer(self, **kwargs):
+        self._done = True
+
+    async def edit_message(self, content=None, **kwargs):
+        self._done = True
+        self.interaction.messages.append(content)
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        self.interaction.messages.append(content)
+        return FakeMessage(content)
+
+
+class FakeInteraction:
+    def __init__(self, user, channel):
+        self.user = user
+        self.channel = channel
+        self.channel_id = channel.id
+        self.guild = None
+        self.guild_id = None
+        self.extras = {}
+        self.messages = []
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+
+
+# Storage yang mencatat ledger untuk cek invariant
+
+class Ledger:
+    def __init__(self):
+        self.users_created = set()
+        self.balance_delta = 0
+        self.items_in = 0
+        self.items_out = 0
+        self.db_time = defaultdict(list)
+        self.lock_errors = 0
+
+
+def wrap_storage(storage, ledger):
+    """Bungkus repo storage untuk mencatat delta saldo/barang dan waktu DB"""
+
+    def timed(name, func):
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if 'locked' in str(e):
+                    ledger.lock_errors += 1
+                raise
+            finally:
+                ledger.db_time[name].append(time.perf_counter() - start)
+        return wrapper
+
+    users, inventory = storage.users, storage.inventory
+    orig = {
+        'get': users.get, 'get_profile': users.get_profile, 'adjust': users.adjust_balance, 'transfer': users.transfer,
+        'adjust_many': users.adjust_many,
+        'add': inventory.add, 'remove': inventory.remove, 'clear': inventory.clear,
+    }
+
+    async def get(user_id):
+        ledger.users_created.add(user_id)
+        return await orig['get'](user_id)
+
+    async def get_profile(user_id):
+        ledger.users_created.add(user_id)
+        return await orig['get_profile'](user_id)
+
+    async def adjust_balance(user_id, delta, allow_negative=True):
+        result = await orig['adjust'](user_id, delta, allow_negative)
+        if result is not None:
+            ledger.balance_delta += delta
+        return result
+
+    async def adjust_many(deltas, allow_negative=False, once=None):
+        result = await orig['adjust_many'](deltas, allow_negative, once)
+        if result:  # {}: key `once` sudah pernah diterapkan
+            ledger.balance_delta += sum(delta for _, delta in deltas)
+        return result
+
+    async def add(user_id, item_name, item_category, item_value, quantity=1):
+        await orig['add'](user_id, item_name, item_category, item_value, quantity)
+        ledger.items_in += quantity
+
+    async def remove(user_id, item_name, quantity=1):
+        ok = await orig['remove'](user_id, item_name, quantity)
+        if ok:
+            ledger.items_out += quantity
+        return ok
+
+    async def clear(user_id):
+        rows = await orig['clear'](user_id)
+        ledger.items_out += sum(row[3] for row in rows)
+        return rows
+
+    users.get = timed('users.get', get)
+    users.get_profile = timed('users.get_profile', get_profile)
+    users.adjust_balance = timed('users.adjust_balance', adjust_balance)
+    users.transfer = timed('users.transfer', orig['transfer'])
+    users.adjust_many = timed('users.adjust_many', adjust_many)
+    inventory.add = timed('inventory.add', add)
+    inventory.remove = timed('inventory.remove', remove)
+    inventory.clear = timed('inventory.clear', clear)
+    inventory.list = timed('inventory.list', inventory.list)
+    inventory.count = timed('inventory.count', inventory.count)
+    storage.usage.get = timed('usage.get', storage.usage.get)
+    storage.usage.increment = timed('usage.increment', storage.usage.increment)
+    return storage
+
+
+def load_bot(args):
+    os.environ.setdefault('OWNER_ID', '0')
+    os.environ.pop('IPC_SOCKET', None)
+    sys.path.insert(0, ROOT)
+    import bot
+    import tracing
+    import storage as storage_module
+
+    if args.backend == 'memory':
+        storage = storage_module.MemoryStorage()
+    else:
+        db_path = os.path.join(tempfile.mkdtemp(prefix='alphad-load-'), 'userdata.db')
+        storage = storage_module.SQLiteStorage(db_path, busy_timeout=bot.DB_BUSY_TIMEOUT)
+
+    # Delay animasi roulette diskalakan supaya load test tidak menunggu berdetik-detik
+    real_sleep = asyncio.sleep
+
+    async def scaled_sleep(seconds):
+        await real_sleep(seconds * args.game_delay)
+
+    tracing.sleep = scaled_sleep
+    return bot, storage
+
+
+class LoadTest:
+    def __init__(self, bot, args):
+        self.bot = bot
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.members = [FakeMember(1000 + i) for i in range(args.users)]
+        self.channel = FakeChannel(1)
+        self.guild = FakeGuild(1)
+        self.latency = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.error_samples = {}
+        self.actions = 0
+
+    async def call(self, name, coro):
+        start = time.perf_counter()
+        try:
+            await coro
+        except Exception as e:
+            self.errors[name] += 1
+            self.error_samples.setdefault(name, repr(e))
+        finally:
+            self.latency[name].append(time.perf_counter() - start)
+            self.actions += 1
+
+    def ctx(self, member, name):
+        return FakeContext(member, self.channel, name)
+
+    async def pick_item(self, member):
+        inventory = await self.bot.storage.inventory.list(member.id)
+        return self.rng.choice(inventory)[0] if inventory else "Botol Plastik"
+
+    async def action(self, member):
+        bot = self.bot
+        other = self.rng.choice(self.members)
+        roll = self.rng.random()
+        if roll < 0.25:
+            await self.call('cari', bot.cari.callback(self.ctx(member, 'cari')))
+        elif roll < 0.40:
+            interaction = FakeInteraction(member, self.channel)
+            await self.call('cari_slash', bot.cari_slash.callback(interaction))
+        elif roll < 0.55:
+            item = await self.pick_item(member)
+            await self.call('sell', bot.sell.callback(self.ctx(member, 'sell'), item_name=item))
+        elif roll < 0.65:
+            item = await self.pick_item(member)
+            await self.call('give', bot.give.callback(self.ctx(member, 'give'), other, item_name=item))
+        elif roll < 0.70:
+            await self.call('jualall', bot.jualall.callback(self.ctx(member, 'jualall')))
+        elif roll < 0.80:
+            await self.call('gamble', bot.gamble.callback(self.ctx(member, 'gamble'), self.rng.randint(1, 30)))
+        elif roll < 0.94:
+            interaction = FakeInteraction(member, self.channel)
+            await self.call('transfer_slash', bot.transfer_slash.callback(
+                interaction, other, self.rng.randint(1, 20)))
+        elif roll < 0.97:
+            await self.call('pvp', self.play_pvp(member))
+        else:
+            await self.call('roulette', self.play_roulette(member))
+
+    async def play_roulette(self, member):
+        bot = self.bot
+        ctx = self.ctx(member, 'roulette')
+        await bot.roulette.callback(ctx, self.rng.randint(1, 20))
+        # Pilih lewat tombol atau !kepala / !lawan sampai game selesai
+        for _ in range(200):
+            state = bot.active_games.get(member.id)
+            if state is None:
+                return
+            command = self.rng.choice([bot.kepala, bot.lawan])
+            if not (state['waiting_for_choice'] and state['turn_player']):
+                await asyncio.sleep(0)
+            elif self.rng.random() < 0.5:
+                await bot.roulette_button(FakeInteraction(member, self.channel), state['game_id'], command.name)
+            else:
+                await command.callback(self.ctx(member, command.name))
+        await bot.surrender.callback(self.ctx(member, 'surrender'))
+
+    async def play_pvp(self, member):
+        bot = self.bot
+        ctx = self.ctx(member, 'pvp')
+        ctx.guild = self.guild
+        await bot.pvp_.callback(ctx, str(self.rng.randint(5, 25)))
+        # Lawan yang menunggu di antrean tidak punya sesi aktif, jadi
+        # user yang melengkapi match memainkan kedua sisi duel
+        for _ in range(200):
+            duel = bot.duels.for_player(member.id)
+            if duel is None or duel.players[1] != member.id:
+                return
+            player = FakeMember(duel.turn)
+            command = self.rng.choice([bot.kepala, bot.lawan])
+            if self.rng.random() < 0.5:
+                await bot.duel_button(FakeInteraction(player, self.channel), duel.game_id, command.name)
+            else:
+                await command.callback(self.ctx(player, command.name))
+            await asyncio.sleep(0)
+
+    async def user_session(self, member, semaphore):
+        async with semaphore:
+            await self.bot.get_user(member.id)
+            if self.rng.random() < self.args.vip_ratio:
+                await self.bot.update_user(member.id, vip=True)
+            for _ in range(self.args.actions):
+                await self.action(member)
+
+    async def run(self):
+        semaphore = asyncio.Semaphore(self.args.concurrency)
+        started = time.perf_counter()
+        await asyncio.gather(*(self.user_session(m, semaphore) for m in self.members))
+        return time.perf_counter() - started
+
+
+async def check_invariants(bot, storage, ledger):
+    violations = []
+    total_balance = 0
+    total_items = 0
+    for user_id in ledger.users_created:
+        balance, vip = await bot.get_user(user_id)
+        total_balance += balance
+        count = await storage.inventory.count(user_id)
+        total_items += count
+        if balance < 0:
+            violations.append(f"negative balance: user {user_id} = {balance}")
+        capacity = 25 if vip else 15
+        if count > capacity:
+            violations.append(f"over capacity: user {user_id} has {count}/{capacity}")
+
+    expected_balance = len(ledger.users_created) * 100 + ledger.balance_delta
+    if total_balance != expected_balance:
+        violations.append(f"money mismatch: total {total_balance} != ledger {expected_balance} "
+                          f"(diff {total_balance - expected_balance})")
+    for user_id, stored, actual in await storage.inventory.check_counts():
+        violations.append(f"item_count drift: user {user_id} has {stored}, inventory holds {actual}")
+    expected_items = ledger.items_in - ledger.items_out
+    if total_items != expected_items:
+        violations.append(f"item mismatch: inventories hold {total_items} != ledger {expected_items}")
+    return violations
+
+
+async def main_async(args):
+    bot, storage = load_bot(args)
+    ledger = Ledger()
+    bot.set_storage(wrap_storage(storage, ledger))
+    await bot.init_db()
+
+    test = LoadTest(bot, args)
+    bot.bus.start()
+    elapsed = await test.run()
+    await bot.close_duels()  # duel yang belum selesai: taruhan di-escrow dikembalikan
+    await bot.bus.stop()
+    violations = await check_invariants(bot, storage, ledger)
+    await storage.close()
+
+    report = {
+        'backend': args.backend,
+        'users': args.users,
+        'actions': test.actions,
+        'seconds': round(elapsed, 3),
+        'throughput_per_sec': round(test.actions / elapsed, 1),
+        'commands': {name: summarize(samples) for name, samples in sorted(test.latency.items())},
+        'command_errors': dict(test.errors),
+        'command_error_samples': test.error_samples,
+        'db': {name: dict(summarize(samples), total_s=round(sum(samples), 3))
+               for name, samples in sorted(ledger.db_time.items())},
+        'db_lock_errors': ledger.lock_errors,
+        'system_error_replies': test.channel.system_errors,
+        'events_published': sum(value for _, _, value in bot.bus.published.samples()),
+        'events_dropped': sum(value for _, _, value in bot.bus.dropped.samples()),
+        'invariant_violations': violations,
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 1 if violations else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--actions', type=int, default=5, help="aksi per user")
+    parser.add_argument('--concurrency', type=int, default=200, help="user aktif bersamaan")
+    parser.add_argument('--backend', choices=['sqlite', 'memory'], default='sqlite')
+    parser.add_argument('--vip-ratio', type=float, default=0.5)
+    parser.add_argument('--game-delay', type=float, default=0.0,
+                        help="skala delay animasi roulette (1 = seperti produksi)")
+    parser.add_argument('--seed', type=int, default=None)
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
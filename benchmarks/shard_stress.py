@@ -0,0 +1,129 @@
+"""Stress test lokal multi-proses terhadap satu userdata.db bersama
+
+Jalankan: python benchmarks/shard_stress.py [--procs 1,2,4] [--users 50] [--ops 20]
+
+Setiap proses meniru satu proses shard: mengimpor helper database dari
+bot.py dan menjalankan alur cari/sell dari banyak user secara concurrent
+terhadap file SQLite sementara (WAL). Hasilnya throughput (operasi/detik)
+per jumlah proses, plus jumlah error lock dan cek konsistensi saldo.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_bot(db_path):
+    os.environ.setdefault('OWNER_ID', '0')
+    os.environ['DB_PATH'] = db_path
+    sys.path.insert(0, ROOT)
+    import bot
+    from storage import SQLiteStorage
+    # Modul bisa sudah terimpor (fork) dengan path run sebelumnya
+    bot.set_storage(SQLiteStorage(db_path, busy_timeout=bot.DB_BUSY_TIMEOUT))
+    return bot
+
+
+async def simulate_user(bot, user_id, ops, stats):
+    for _ in range(ops):
+        try:
+            await bot.get_user(user_id)
+            await bot.get_daily_usage(user_id)
+            if await bot.get_inventory_count(user_id) < 15:
+                await bot.increment_daily_usage(user_id)
+                await bot.add_to_inventory(user_id, "Botol Plastik", "recyclable", 10)
+            if await bot.remove_from_inventory(user_id, "Botol Plastik", 1):
+                await bot.adjust_balance(user_id, 10)
+                stats['credited'] += 10
+            stats['ops'] += 1
+        except Exception as e:
+            stats['errors'] += 1
+            stats['last_error'] = repr(e)
+
+
+def worker(index, db_path, users, ops, start_barrier, queue):
+    bot = load_bot(db_path)
+    stats = {'ops': 0, 'errors': 0, 'credited': 0, 'last_error': None}
+
+    async def main():
+        start_barrier.wait()
+        started = time.perf_counter()
+        base = index * users
+        await asyncio.gather(*(simulate_user(bot, base + i, ops, stats) for i in range(users)))
+        stats['seconds'] = time.perf_counter() - started
+        await bot.storage.close()
+
+    asyncio.run(main())
+    queue.put(stats)
+
+
+def run(procs, users, ops):
+    db_path = os.path.join(tempfile.mkdtemp(prefix='alphad-stress-'), 'userdata.db')
+    bot = load_bot(db_path)
+
+    async def init():
+        await bot.init_db()
+        # Koneksi pool milik proses ini jangan ikut ter-fork ke worker
+        await bot.storage.close()
+
+    asyncio.run(init())
+
+    queue = multiprocessing.Queue()
+    barrier = multiprocessing.Barrier(procs + 1)
+    workers = [multiprocessing.Process(target=worker, args=(i, db_path, users, ops, barrier, queue))
+               for i in range(procs)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    started = time.perf_counter()
+    results = [queue.get() for _ in workers]
+    elapsed = time.perf_counter() - started
+    for w in workers:
+        w.join()
+
+    # Invariant: saldo total = saldo awal + semua kredit yang dilaporkan worker
+    import sqlite3
+    with sqlite3.connect(db_path) as conn:
+        total, count = conn.execute("SELECT SUM(balance), COUNT(*) FROM users").fetchone()
+    expected = count * 100 + sum(r['credited'] for r in results)
+    total_ops = sum(r['ops'] for r in results)
+    return {
+        'procs': procs,
+        'ops': total_ops,
+        'seconds': round(elapsed, 3),
+        'ops_per_sec': round(total_ops / elapsed, 1),
+        'errors': sum(r['errors'] for r in results),
+        'last_error': next((r['last_error'] for r in results if r['last_error']), None),
+        'balance_consistent': total == expected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--procs', default=None,
+                        help="daftar jumlah proses, mis. 1,2,4 (default 1..cpu_count, kelipatan 2)")
+    parser.add_argument('--users', type=int, default=50, help="user simulasi per proses")
+    parser.add_argument('--ops', type=int, default=20, help="operasi per user")
+    args = parser.parse_args()
+
+    if args.procs:
+        proc_counts = [int(p) for p in args.procs.split(',')]
+    else:
+        proc_counts = [1]
+        while proc_counts[-1] * 2 <= (os.cpu_count() or 1):
+            proc_counts.append(proc_counts[-1] * 2)
+
+    results = [run(p, args.users, args.ops) for p in proc_counts]
+    for r in results:
+        r['speedup'] = round(r['ops_per_sec'] / results[0]['ops_per_sec'], 2)
+    print(json.dumps({'cpu_count': os.cpu_count(), 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Simulasi headless blackjack: EV basic strategy untuk aturan tertentu
+
+Jalankan: python benchmarks/sim_blackjack.py [--hands 1000000] [--decks 6] [--h17]
+                                             [--penetration 0.75] [--output results.json]
+
+Memakai engine yang sama dengan /gambling blackjack (shoe, aturan dealer dan
+saran basic strategy), tanpa Discord dan tanpa database.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import blackjack  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hands', type=int, default=1000000)
+    parser.add_argument('--decks', type=int, default=6)
+    parser.add_argument('--penetration', type=float, default=0.75)
+    parser.add_argument('--h17', action='store_true', help="dealer hit soft 17")
+    parser.add_argument('--output', help="simpan hasil JSON ke file")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rules = blackjack.Rules(decks=args.decks, penetration=args.penetration,
+                            dealer_hits_soft17=args.h17)
+    start = time.perf_counter()
+    result = blackjack.simulate(args.hands, rules, random.Random(args.seed))
+    elapsed = time.perf_counter() - start
+    result.update({
+        'decks': args.decks,
+        'penetration': args.penetration,
+        'dealer_hits_soft17': args.h17,
+        'hands_per_second': round(args.hands / elapsed),
+    })
+    print(f"EV {result['ev'] * 100:+.3f}% ± {result['stderr'] * 100:.3f}% "
+          f"({result['hands_per_second']:,} hands/s)", file=sys.stderr)
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
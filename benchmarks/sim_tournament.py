@@ -0,0 +1,58 @@
+"""Simulasi headless turnamen roulette: satu bracket penuh tanpa Discord
+
+Jalankan: python benchmarks/sim_tournament.py [--players 128] [--runs 10]
+                                              [--entry-fee 100] [--output results.json]
+
+Memakai engine yang sama dengan !turnamen (bracket, duel pvp.Duel, hadiah)
+dan satu Scheduler bersama dengan clock virtual untuk semua match.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import tournament  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=128)
+    parser.add_argument('--runs', type=int, default=10, help="jumlah bracket yang disimulasikan")
+    parser.add_argument('--entry-fee', type=int, default=100)
+    parser.add_argument('--output', help="simpan hasil JSON ke file")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    timings, result = [], None
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        result = tournament.simulate(args.players, args.entry_fee, rng)
+        timings.append(time.perf_counter() - start)
+        if sum(result['prizes'].values()) != args.players * args.entry_fee:
+            raise SystemExit(f"Hadiah tidak sama dengan pot: {result['prizes']}")
+    result['prizes'] = {str(user_id): amount for user_id, amount in result['prizes'].items()}
+    result.update({
+        'runs': args.runs,
+        'seconds_per_bracket': round(sum(timings) / len(timings), 4),
+        'worst_seconds': round(max(timings), 4),
+    })
+    print(f"{args.players} peserta: {result['matches']} match, {result['turns']} giliran, "
+          f"{result['seconds_per_bracket'] * 1000:.1f} ms/bracket (terburuk {result['worst_seconds'] * 1000:.1f} ms)",
+          file=sys.stderr)
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""Engine blackjack: shoe multi-deck, aturan dealer dan saran basic strategy
+
+Kartu memakai encoding poker.py (`rank * 4 + suit`). Shoe disimpan sebagai
+array byte berisi `decks * 52` kartu dengan cut card: setelah posisi cut
+tercapai, shoe dikocok ulang sebelum tangan berikutnya.
+
+Saran basic strategy dihitung dengan dynamic programming (di-cache)
+pada deck tak hingga (EV stand/hit/double per total pemain dan kartu atas
+dealer, dengan dealer sudah dipastikan tidak blackjack). Split tidak
+didukung.
+
+`Hand` tidak melakukan I/O; bot.py yang memegang taruhan (escrow) dan
+`simulate()` memainkan ribuan tangan headless dengan basic strategy untuk
+menghitung EV.
+"""
+import functools
+import math
+import random
+import time
+from array import array
+from collections import OrderedDict
+
+from poker import card_str
+
+# Nilai kartu per rank: 2..9, T/J/Q/K = 10, As = 1 (dihitung 11 kalau tidak bust)
+CARD_VALUES = [2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1]
+ACTION_NAMES = {'H': "Hit", 'S': "Stand", 'D': "Double"}
+
+
+def card_value(card):
+    return CARD_VALUES[card >> 2]
+
+
+def total(cards):
+    """(total terbaik, soft) untuk kartu di tangan"""
+    hard = sum(CARD_VALUES[card >> 2] for card in cards)
+    if hard <= 11 and any(card >> 2 == 12 for card in cards):
+        return hard + 10, True
+    return hard, False
+
+
+def is_blackjack(cards):
+    return len(cards) == 2 and total(cards)[0] == 21
+
+
+def hand_str(cards):
+    value, soft = total(cards)
+    return f"{' '.join(card_str(card) for card in cards)} ({'soft ' if soft else ''}{value})"
+
+
+class Rules:
+    def __init__(self, decks=6, penetration=0.75, dealer_hits_soft17=False, blackjack_pays=1.5):
+        self.decks = decks
+        self.penetration = penetration
+        self.dealer_hits_soft17 = dealer_hits_soft17
+        self.blackjack_pays = blackjack_pays
+
+
+class Shoe:
+    def __init__(self, decks=6, penetration=0.75, rng=None):
+        self.rng = rng or random.Random()
+        self.cards = array('B', range(52)) * decks
+        self.cut = int(len(self.cards) * penetration)
+        self.shuffle()
+
+    def __len__(self):
+        return len(self.cards) - self.position
+
+    def shuffle(self):
+        self.rng.shuffle(self.cards)
+        self.position = 0
+
+    def needs_shuffle(self):
+        return self.position >= self.cut
+
+    def draw(self):
+        card = self.cards[self.position]
+        self.position += 1
+        return card
+
+
+def dealer_should_hit(cards, hits_soft17=False):
+    value, soft = total(cards)
+    return value < 17 or (value == 17 and soft and hits_soft17)
+
+
+# Basic strategy (deck tak hingga)
+
+_DRAWS = [(value, (4 if value == 10 else 1) / 13) for value in range(1, 11)]
+
+
+def _best(hard, ace):
+    return hard + 10 if ace and hard <= 11 else hard
+
+
+@functools.lru_cache(maxsize=None)
+def _dealer_finals(hard, ace, hits_soft17):
+    """Distribusi total akhir dealer {17..21, 22 = bust} dari posisi (hard, ada As)"""
+    value = _best(hard, ace)
+    soft = value != hard
+    if value > 21:
+        return {22: 1.0}
+    if value > 17 or (value == 17 and not (soft and hits_soft17)):
+        return {value: 1.0}
+    finals = {}
+    for card, p in _DRAWS:
+        for final, q in _dealer_finals(hard + card, ace or card == 1, hits_soft17).items():
+            finals[final] = finals.get(final, 0.0) + p * q
+    return finals
+
+
+@functools.lru_cache(maxsize=None)
+def dealer_distribution(up, hits_soft17=False):
+    """Distribusi total akhir dealer untuk kartu atas `up` (1 = As), tanpa blackjack dealer"""
+    finals, weight = {}, 0.0
+    for hole, p in _DRAWS:
+        if up + hole == 11 and 1 in (up, hole):
+            continue  # blackjack dealer langsung diselesaikan sebelum pemain beraksi
+        weight += p
+        for final, q in _dealer_finals(up + hole, up == 1 or hole == 1, hits_soft17).items():
+            finals[final] = finals.get(final, 0.0) + p * q
+    return {final: p / weight for final, p in finals.items()}
+
+
+def _stand_ev(value, dealer):
+    if value > 21:
+        return -1.0
+    return sum(p if final == 22 or final < value else (0.0 if final == value else -p)
+               for final, p in dealer.items())
+
+
+@functools.lru_cache(maxsize=None)
+def _evs(hard, ace, up, hits_soft17):
+    """(stand, hit, double) EV per unit taruhan untuk posisi pemain"""
+    dealer = dealer_distribution(up, hits_soft17)
+    stand = _stand_ev(_best(hard, ace), dealer)
+    hit = double = 0.0
+    for card, p in _DRAWS:
+        next_hard, next_ace = hard + card, ace or card == 1
+        if next_hard > 21:
+            hit -= p
+            double -= 2 * p
+            continue
+        hit += p * max(_evs(next_hard, next_ace, up, hits_soft17)[:2])
+        double += 2 * p * _stand_ev(_best(next_hard, next_ace), dealer)
+    return stand, hit, double
+
+
+def hint(cards, up_card, can_double=True, hits_soft17=False):
+    """Aksi basic strategy: 'H', 'S' atau 'D'"""
+    hard = sum(CARD_VALUES[card >> 2] for card in cards)
+    if hard >= 21:
+        return 'S'
+    ace = any(card >> 2 == 12 for card in cards)
+    stand, hit, double = _evs(hard, ace, card_value(up_card), hits_soft17)
+    if can_double and double > max(stand, hit):
+        return 'D'
+    return 'H' if hit > stand else 'S'
+
+
+# Satu tangan
+
+class Hand:
+    def __init__(self, shoe, bet, rules=None):
+        self.rules = rules or Rules()
+        self.shoe = shoe
+        self.bet = bet  # total taruhan, termasuk double
+        self.doubled = False
+        self.outcome = None
+        if shoe.needs_shuffle():
+            shoe.shuffle()
+        self.player = [shoe.draw(), shoe.draw()]
+        self.dealer = [shoe.draw(), shoe.draw()]
+        if is_blackjack(self.player) or is_blackjack(self.dealer):
+            self._settle()
+
+    @property
+    def finished(self):
+        return self.outcome is not None
+
+    @property
+    def can_double(self):
+        return not self.finished and len(self.player) == 2
+
+    @property
+    def payout(self):
+        """Perubahan saldo bersih setelah tangan selesai"""
+        if self.outcome == 'blackjack':
+            return int(self.bet * self.rules.blackjack_pays)
+        return {'win': self.bet, 'push': 0, 'lose': -self.bet}.get(self.outcome, 0)
+
+    def hint(self):
+        return hint(self.player, self.dealer[0], self.can_double, self.rules.dealer_hits_soft17)
+
+    def hit(self):
+        self.player.append(self.shoe.draw())
+        if total(self.player)[0] >= 21:
+            self.stand()
+
+    def stand(self):
+        if self.finished:
+            return
+        if total(self.player)[0] <= 21:
+            while dealer_should_hit(self.dealer, self.rules.dealer_hits_soft17):
+                self.dealer.append(self.shoe.draw())
+        self._settle()
+
+    def double(self):
+        """Gandakan taruhan, ambil tepat satu kartu lalu stand"""
+        self.bet *= 2
+        self.doubled = True
+        self.player.append(self.shoe.draw())
+        self.stand()
+
+    def _settle(self):
+        player, _ = total(self.player)
+        dealer, _ = total(self.dealer)
+        if is_blackjack(self.player) or is_blackjack(self.dealer):
+            if is_blackjack(self.player) and is_blackjack(self.dealer):
+                self.outcome = 'push'
+            else:
+                self.outcome = 'blackjack' if is_blackjack(self.player) else 'lose'
+        elif player > 21:
+            self.outcome = 'lose'
+        elif dealer > 21 or player > dealer:
+            self.outcome = 'win'
+        else:
+            self.outcome = 'push' if player == dealer else 'lose'
+
+
+def play_basic(hand):
+    """Mainkan tangan sampai selesai mengikuti basic strategy"""
+    while not hand.finished:
+        action = hand.hint()
+        if action == 'D':
+            hand.double()
+        elif action == 'H':
+            hand.hit()
+        else:
+            hand.stand()
+    return hand
+
+
+def simulate(hands, rules=None, rng=None):
+    """Mode headless: EV per unit taruhan awal dengan basic strategy, beserta standard error"""
+    rules = rules or Rules()
+    shoe = Shoe(rules.decks, rules.penetration, rng or random.Random())
+    total_payout = total_squares = 0.0
+    for _ in range(hands):
+        # Taruhan 2 supaya bayaran blackjack 3:2 tidak terpotong pembulatan int
+        payout = play_basic(Hand(shoe, 2, rules)).payout / 2
+        total_payout += payout
+        total_squares += payout * payout
+    mean = total_payout / hands
+    variance = total_squares / hands - mean * mean
+    return {'hands': hands, 'ev': mean, 'stderr': math.sqrt(variance / hands)}
+
+
+class SessionStore:
+    """Tangan yang sedang berjalan per user, dibatasi `max_sessions`
+
+    Session yang tidak disentuh selama `ttl` detik dianggap idle; pemanggil
+    menyelesaikannya (auto-stand) lewat `expired()`.
+    """
+
+    def __init__(self, max_sessions=1000, ttl=120.0, clock=time.monotonic):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.clock = clock
+        self._sessions = OrderedDict()  # user_id -> (last_touch, session)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, user_id):
+        return user_id in self._sessions
+
+    def add(self, user_id, session):
+        """False kalau user sudah punya tangan atau store penuh"""
+        if user_id in self._sessions or len(self._sessions) >= self.max_sessions:
+            return False
+        self._sessions[user_id] = (self.clock(), session)
+        return True
+
+    def get(self, user_id):
+        """Ambil session dan perbarui waktu aksi terakhir"""
+        entry = self._sessions.get(user_id)
+        if entry is None:
+            return None
+        self._sessions[user_id] = (self.clock(), entry[1])
+        self._sessions.move_to_end(user_id)
+        return entry[1]
+
+    def deadline(self, user_id):
+        """Waktu (clock store) session ini dianggap idle"""
+        return self._sessions[user_id][0] + self.ttl
+
+    def pop(self, user_id):
+        entry = self._sessions.pop(user_id, None)
+        return entry[1] if entry else None
+
+    def expired(self):
+        """Keluarkan semua session idle (terlama dulu)"""
+        now, idle = self.clock(), []
+        for user_id, (touched, session) in list(self._sessions.items()):
+            if now - touched < self.ttl:
+                break
+            del self._sessions[user_id]
+            idle.append((user_id, session))
+        return idle
+
+    def values(self):
+        return [session for _, session in self._sessions.values()]
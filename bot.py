@@ -1,1497 +1,3442 @@
-import os
-import discord
-from discord.ext import commands
-from dotenv import load_dotenv
-import random
-import aiosqlite
-import asyncio
-import datetime
-from discord import app_commands
-from threading import Thread
-from flask import Flask
-
-load_dotenv()  # load .env
-
-# Game state tracking for interactive Russian Roulette
-active_games = {}
-
-TOKEN = os.getenv('DISCORD_TOKEN')
-OWNER_ID_STR = os.getenv('OWNER_ID')
-if OWNER_ID_STR is None:
-    print("Error: OWNER_ID environment variable not found!")
-    exit(1)
-OWNER_ID = int(OWNER_ID_STR)
-
-MUTE_ROLE_NAME = "Muted"
-DB_PATH = "userdata.db"
-
-intents = discord.Intents.none()
-intents.guilds = True
-intents.guild_messages = True
-# Aktifkan setelah enable privileged intents di developer portal
-intents.message_content = True
-
-
-class MyBot(commands.Bot):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # self.tree = discord.app_commands.CommandTree(self)  # HAPUS baris ini
-
-
-bot = MyBot(command_prefix='!', intents=intents, help_command=None)
-
-
-# Inisialisasi database
-async def init_db():
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Users table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY,
-                balance INTEGER NOT NULL DEFAULT 100,
-                vip INTEGER NOT NULL DEFAULT 0
-            )
-        """)
-
-        # Inventory table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS inventory (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                item_name TEXT NOT NULL,
-                item_category TEXT NOT NULL,
-                item_value INTEGER NOT NULL,
-                quantity INTEGER NOT NULL DEFAULT 1,
-                FOREIGN KEY (user_id) REFERENCES users (user_id)
-            )
-        """)
-
-        # Usage tracking table for daily limits
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS daily_usage (
-                user_id INTEGER PRIMARY KEY,
-                cari_count INTEGER NOT NULL DEFAULT 0,
-                last_reset DATE NOT NULL DEFAULT (date('now')),
-                FOREIGN KEY (user_id) REFERENCES users (user_id)
-            )
-        """)
-        await db.commit()
-
-
-async def get_user(user_id):
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute(
-            "SELECT balance, vip FROM users WHERE user_id = ?", (user_id, ))
-        row = await cursor.fetchone()
-        if row is None:
-            await db.execute(
-                "INSERT INTO users (user_id, balance, vip) VALUES (?, 100, 0)",
-                (user_id, ))
-            await db.commit()
-            return 100, False
-        balance, vip = row
-        return balance, bool(vip)
-
-
-async def update_user(user_id, balance=None, vip=None):
-    async with aiosqlite.connect(DB_PATH) as db:
-        if balance is not None and vip is not None:
-            await db.execute(
-                "UPDATE users SET balance = ?, vip = ? WHERE user_id = ?",
-                (balance, int(vip), user_id))
-        elif balance is not None:
-            await db.execute("UPDATE users SET balance = ? WHERE user_id = ?",
-                             (balance, user_id))
-        elif vip is not None:
-            await db.execute("UPDATE users SET vip = ? WHERE user_id = ?",
-                             (int(vip), user_id))
-        await db.commit()
-
-
-# Inventory management functions
-async def add_to_inventory(user_id, item_name, item_category, item_value, quantity=1):
-    """Add item to user's inventory"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Check if item already exists
-        cursor = await db.execute(
-            "SELECT quantity FROM inventory WHERE user_id = ? AND item_name = ?",
-            (user_id, item_name))
-        row = await cursor.fetchone()
-
-        if row:
-            # Update quantity if item exists
-            new_quantity = row[0] + quantity
-            await db.execute(
-                "UPDATE inventory SET quantity = ? WHERE user_id = ? AND item_name = ?",
-                (new_quantity, user_id, item_name))
-        else:
-            # Add new item
-            await db.execute(
-                "INSERT INTO inventory (user_id, item_name, item_category, item_value, quantity) VALUES (?, ?, ?, ?, ?)",
-                (user_id, item_name, item_category, item_value, quantity))
-        await db.commit()
-
-
-async def get_inventory(user_id):
-    """Get user's inventory"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute(
-            "SELECT item_name, item_category, item_value, quantity FROM inventory WHERE user_id = ? ORDER BY item_category, item_name",
-            (user_id,))
-        return await cursor.fetchall()
-
-
-async def get_inventory_count(user_id):
-    """Get total item count in inventory"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute(
-            "SELECT SUM(quantity) FROM inventory WHERE user_id = ?", (user_id,))
-        result = await cursor.fetchone()
-        return result[0] if result[0] else 0
-
-
-async def remove_from_inventory(user_id, item_name, quantity=1):
-    """Remove item from inventory"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute(
-            "SELECT quantity FROM inventory WHERE user_id = ? AND item_name = ?",
-            (user_id, item_name))
-        row = await cursor.fetchone()
-
-        if not row:
-            return False  # Item not found
-
-        current_quantity = row[0]
-        if current_quantity < quantity:
-            return False  # Not enough items
-
-        new_quantity = current_quantity - quantity
-        if new_quantity == 0:
-            # Remove item completely
-            await db.execute(
-                "DELETE FROM inventory WHERE user_id = ? AND item_name = ?",
-                (user_id, item_name))
-        else:
-            # Update quantity
-            await db.execute(
-                "UPDATE inventory SET quantity = ? WHERE user_id = ? AND item_name = ?",
-                (new_quantity, user_id, item_name))
-
-        await db.commit()
-        return True
-
-
-# Daily usage tracking functions
-async def get_daily_usage(user_id):
-    """Get user's daily usage count for !cari"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Check if we need to reset (new day)
-        cursor = await db.execute(
-            "SELECT cari_count, last_reset FROM daily_usage WHERE user_id = ?", (user_id,))
-        row = await cursor.fetchone()
-
-        today = datetime.date.today().isoformat()
-
-        if not row:
-            # Create new record for user
-            await db.execute(
-                "INSERT INTO daily_usage (user_id, cari_count, last_reset) VALUES (?, 0, ?)",
-                (user_id, today))
-            await db.commit()
-            return 0
-
-        cari_count, last_reset = row
-
-        # Reset count if it's a new day
-        if last_reset != today:
-            await db.execute(
-                "UPDATE daily_usage SET cari_count = 0, last_reset = ? WHERE user_id = ?",
-                (today, user_id))
-            await db.commit()
-            return 0
-
-        return cari_count
-
-
-async def increment_daily_usage(user_id):
-    """Increment user's daily !cari usage count"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        today = datetime.date.today().isoformat()
-
-        # Insert or update usage count
-        await db.execute("""
-            INSERT INTO daily_usage (user_id, cari_count, last_reset) 
-            VALUES (?, 1, ?)
-            ON CONFLICT(user_id) DO UPDATE SET 
-            cari_count = cari_count + 1,
-            last_reset = ?
-        """, (user_id, today, today))
-        await db.commit()
-
-
-@bot.event
-async def on_ready():
-    await init_db()
-    print(f'Bot sudah online sebagai {bot.user}')
-
-    # Set bot status to online with activity
-    activity = discord.Game(name="/help untuk bantuan")
-    await bot.change_presence(status=discord.Status.online, activity=activity)
-    await bot.tree.sync()
-    print("Bot status set to online dengan regular commands dan slash commands")
-
-
-# Event on_member_join memerlukan members intent yang privileged
-# Dinonaktifkan untuk sementara
-# @bot.event
-# async def on_member_join(member):
-#     channel = member.guild.system_channel
-#     if channel:
-#         await channel.send(f"Selamat datang di server, {member.mention}!")
-
-
-@bot.command()
-@commands.has_permissions(kick_members=True)
-async def kick(ctx, member: discord.Member, *, reason=None):
-    try:
-        await member.kick(reason=reason)
-        await ctx.send(f"{member} telah di-kick. Alasan: {reason}")
-    except Exception as e:
-        await ctx.send(f"Gagal kick: {e}")
-
-
-@bot.command()
-@commands.has_permissions(ban_members=True)
-async def ban(ctx, member: discord.Member, *, reason=None):
-    try:
-        await member.ban(reason=reason)
-        await ctx.send(f"{member} telah di-ban. Alasan: {reason}")
-    except Exception as e:
-        await ctx.send(f"Gagal ban: {e}")
-
-
-@bot.command()
-@commands.has_permissions(manage_roles=True)
-async def mute(ctx, member: discord.Member, *, reason=None):
-    guild = ctx.guild
-    mute_role = discord.utils.get(guild.roles, name=MUTE_ROLE_NAME)
-    if not mute_role:
-        mute_role = await guild.create_role(name=MUTE_ROLE_NAME)
-        for channel in guild.channels:
-            await channel.set_permissions(mute_role,
-                                          speak=False,
-                                          send_messages=False,
-                                          read_message_history=True,
-                                          read_messages=False)
-    try:
-        await member.add_roles(mute_role, reason=reason)
-        await ctx.send(f"{member} telah di-mute. Alasan: {reason}")
-    except Exception as e:
-        await ctx.send(f"Gagal mute: {e}")
-
-
-@bot.command()
-async def vip(ctx, member: discord.Member = None):
-    """Berikan status VIP (owner only) - !vip @user"""
-    if member is None:
-        await ctx.send(
-            "❌ **Error:** Tag user yang mau dikasih VIP!\n📝 **Contoh:** `!vip @username`"
-        )
-        return
-
-    if ctx.author.id != OWNER_ID:
-        await ctx.send(
-            "🔒 **Akses ditolak!** Hanya owner bot yang bisa menambahkan VIP.")
-        return
-    balance, _ = await get_user(member.id)
-    await update_user(member.id, balance=balance, vip=True)
-    await ctx.send(
-        f"💎 **VIP GRANTED!** {member.mention} sekarang adalah VIP!\n🎉 **Selamat!** Kamu bisa akses semua fitur premium!"
-    )
-
-
-@bot.command()
-async def ping(ctx):
-    """Test bot responsif"""
-    latency = round(bot.latency * 1000)
-    await ctx.send(f"🏓 Pong! Latency: {latency}ms\nBot online dan berfungsi!")
-
-
-@bot.command()
-async def cari(ctx):
-    """Cari barang di tong sampah - !cari"""
-    balance, vip = await get_user(ctx.author.id)
-
-    # Check daily usage limits
-    current_usage = await get_daily_usage(ctx.author.id)
-
-    # Determine usage limit based on user status
-    if ctx.author.id == OWNER_ID:
-        # Owner has unlimited usage
-        daily_limit = float('inf')
-        status_text = "👑 **OWNER** (Unlimited)"
-    elif vip:
-        daily_limit = 50
-        status_text = "💎 **VIP** (50/hari)"  
-    else:
-        daily_limit = 25
-        status_text = "👤 **Regular** (25/hari)"
-
-    # Check if user has reached daily limit
-    if current_usage >= daily_limit:
-        await ctx.send(
-            f"⏰ **Daily limit tercapai!** ({current_usage}/{int(daily_limit)})\n\n"
-            f"📊 **Status:** {status_text}\n"
-            f"🔄 **Reset:** Besok jam 00:00 WIB\n\n"
-            f"💡 **Upgrade ke VIP untuk limit 50x/hari:** `!vip @{ctx.author.name}`"
-        )
-        return
-
-    # Check inventory capacity
-    current_items = await get_inventory_count(ctx.author.id)
-    max_capacity = 25 if vip else 15
-
-    if current_items >= max_capacity:
-        await ctx.send(f"🗑️ **Inventori penuh!** ({current_items}/{max_capacity})\n💡 **Tip:** Gunakan `!sell [barang]` untuk jual barang terlebih dahulu")
-        return
-
-    # Define possible items found in trash with NEW RARITIES
-    trash_items = {
-        # Trash items (auto-deleted, no value)
-        "trash": [
-            ("Makanan Busuk", 0), ("Sayuran Basi", 0), ("Roti Berjamur", 0),
-            ("Daging Busuk", 0), ("Buah Busuk", 0), ("Nasi Basi", 0)
-        ],
-
-        # Recyclable items (5-20 value)
-        "recyclable": [
-            ("Botol Plastik", random.randint(5, 20)), ("Kaleng Soda", random.randint(5, 20)),
-            ("Kardus Bekas", random.randint(5, 20)), ("Koran Lama", random.randint(5, 20)),
-            ("Botol Kaca", random.randint(5, 20)), ("Plastik Kemasan", random.randint(5, 20)),
-            ("Kertas Bekas", random.randint(5, 20)), ("Kantong Plastik", random.randint(5, 20))
-        ],
-
-        # Electronics (50-90 value) - rare
-        "electronics": [
-            ("HP Rusak", random.randint(50, 90)), ("Kabel USB", random.randint(50, 90)),
-            ("Headphone Bekas", random.randint(50, 90)), ("Charger Lama", random.randint(50, 90)),
-            ("Remote Rusak", random.randint(50, 90)), ("Baterai Bekas", random.randint(50, 90)),
-            ("Flashdisk Rusak", random.randint(50, 90))
-        ],
-
-        # NEW: Legendary items (very rare, high value)
-        "legendary": [
-            ("Silver Ring", random.randint(120, 150)), ("Silver Chain", random.randint(120, 150)),
-            ("Gold Coin", random.randint(155, 200)), ("Gold Bracelet", random.randint(155, 200)),
-            ("Diamond Earring", random.randint(210, 260)), ("Diamond Ring", random.randint(210, 260))
-        ],
-
-        # NEW: Mythical meme items (ultra rare, viral content)
-        "mythical": [
-            ("🐸 Pepe Sticker", random.randint(300, 500)), ("😎 Chad Sticker", random.randint(300, 500)),
-            ("🐕 Doge Sticker", random.randint(300, 500)), ("🚀 To The Moon Sticker", random.randint(300, 500)),
-            ("🔥 This is Fine Sticker", random.randint(300, 500)), ("💎 Diamond Hands Sticker", random.randint(300, 500)),
-            ("🌙 Mooning Sticker", random.randint(300, 500)), ("⚡ Sigma Grindset Sticker", random.randint(300, 500)),
-            ("🎮 Among Us Sticker", random.randint(300, 500)), ("🍌 Minion Sticker", random.randint(300, 500))
-        ]
-    }
-
-    # NEW PROBABILITY SYSTEM with all rarities
-    find_chance = random.random() * 100
-
-    if find_chance < 35:  # 35% chance trash (auto-deleted)
-        category = "trash"
-    elif find_chance < 70:  # 35% chance recyclable items
-        category = "recyclable"
-    elif find_chance < 90:  # 20% chance electronics
-        category = "electronics"  
-    elif find_chance < 97:  # 7% chance legendary
-        category = "legendary"
-    else:  # 3% chance mythical (ultra rare!)
-        category = "mythical"
-
-    # Select random item from category
-    item_name, item_value = random.choice(trash_items[category])
-
-    # Handle trash items (auto-deleted)
-    if category == "trash":
-        trash_messages = [
-            f"🗑️ **Yuck!** {ctx.author.mention} menemukan **{item_name}** tapi langsung dibuang lagi! 🤢",
-            f"🤮 **Eww!** {ctx.author.mention} mendapat **{item_name}** - langsung ke tempat sampah!",
-            f"😷 **Gross!** {ctx.author.mention} nemu **{item_name}** tapi tidak bisa diambil (terlalu busuk!)"
-        ]
-        await ctx.send(random.choice(trash_messages))
-        return
-
-    # Increment daily usage counter
-    await increment_daily_usage(ctx.author.id)
-
-    # Add valuable items to inventory
-    await add_to_inventory(ctx.author.id, item_name, category, item_value)
-
-    # Response messages and styling based on category
-    if category == "recyclable":
-        emoji = "♻️"
-        category_name = "barang daur ulang"
-        rarity = "🟢 **UMUM**"
-    elif category == "electronics":
-        emoji = "⚡"
-        category_name = "elektronik bekas"
-        rarity = "🟡 **LANGKA**"
-    elif category == "legendary":
-        emoji = "💎"
-        category_name = "treasure legendary"
-        rarity = "🟠 **LEGENDARY**"
-    else:  # mythical
-        emoji = "🌟"
-        category_name = "meme mythical"
-        rarity = "🔮 **MYTHICAL**"
-
-    # Special messages for rare finds
-    if category == "legendary":
-        success_messages = [
-            f"{emoji} **TREASURE FOUND!** {ctx.author.mention} menggali **{item_name}** yang berharga!",
-            f"{emoji} **LEGENDARY DROP!** {ctx.author.mention} menemukan **{item_name}** di kedalaman sampah!",
-            f"{emoji} **JACKPOT!** {ctx.author.mention} beruntung dapat **{item_name}**!"
-        ]
-    elif category == "mythical":
-        success_messages = [
-            f"{emoji} **MYTHICAL MEME!** {ctx.author.mention} menemukan sticker viral **{item_name}**! 🔥",
-            f"{emoji} **ULTRA RARE!** {ctx.author.mention} dapat meme legendaris **{item_name}**! 🚀",
-            f"{emoji} **VIRAL CONTENT!** {ctx.author.mention} nemu **{item_name}** yang lagi trending! 💫"
-        ]
-    else:
-        success_messages = [
-            f"{emoji} **Nice find!** {ctx.author.mention} mendapat **{item_name}** dari tong sampah!",
-            f"{emoji} **Lucky!** {ctx.author.mention} nemu **{item_name}** yang masih bisa dijual!"
-        ]
-
-    new_count = await get_inventory_count(ctx.author.id)
-    new_usage = await get_daily_usage(ctx.author.id)
-
-    # Special notification for rare items
-    rare_bonus = ""
-    if category in ["legendary", "mythical"]:
-        rare_bonus = f"\n🎉 **RARE ITEM ALERT!** Kamu beruntung banget nih!"
-
-    # Usage counter display
-    if ctx.author.id == OWNER_ID:
-        usage_text = "👑 **Unlimited**"
-    else:
-        limit = 50 if vip else 25
-        usage_text = f"📊 **Usage:** {new_usage}/{limit} hari ini"
-
-    await ctx.send(
-        f"{random.choice(success_messages)}\n\n"
-        f"📦 **Item:** {item_name}\n"
-        f"💰 **Nilai:** {item_value} uang\n"
-        f"🏷️ **Kategori:** {category_name.title()}\n"
-        f"⭐ **Rarity:** {rarity}\n"
-        f"📊 **Inventori:** {new_count}/{max_capacity}\n"
-        f"{usage_text}{rare_bonus}\n\n"
-        f"💡 **Tip:** Gunakan `!sell {item_name}` untuk menjual barang ini!"
-    )
-
-
-@bot.command()
-async def balance(ctx):
-    """Cek saldo kamu"""
-    balance, vip = await get_user(ctx.author.id)
-    vip_status = "💎 VIP" if vip else "👤 Regular"
-    await ctx.send(
-        f"💰 **Saldo {ctx.author.mention}:** {balance} uang\n🏆 **Status:** {vip_status}"
-    )
-
-
-@bot.command(aliases=['inv', 'inventory'])
-async def inventori(ctx):
-    """Cek inventori kamu - !inventori atau !inv"""
-    balance, vip = await get_user(ctx.author.id)
-    inventory = await get_inventory(ctx.author.id)
-
-    if not inventory:
-        await ctx.send(f"📦 **Inventori {ctx.author.mention} kosong!**\n💡 **Tip:** Gunakan `!cari` untuk mencari barang di tong sampah")
-        return
-
-    # Group items by category
-    categories = {}
-    total_value = 0
-    item_count = 0
-
-    for item_name, item_category, item_value, quantity in inventory:
-        if item_category not in categories:
-            categories[item_category] = []
-        categories[item_category].append((item_name, item_value, quantity))
-        total_value += item_value * quantity
-        item_count += quantity
-
-    max_capacity = 25 if vip else 15
-
-    # Build inventory display
-    inventory_text = f"📦 **INVENTORI {ctx.author.name.upper()}**\n"
-    inventory_text += f"📊 **Slot:** {item_count}/{max_capacity}\n"
-    inventory_text += f"💰 **Total Nilai:** {total_value} uang\n\n"
-
-    category_emojis = {
-        "recyclable": "♻️",
-        "electronics": "⚡",
-        "legendary": "💎",
-        "mythical": "🌟"
-    }
-
-    category_names = {
-        "recyclable": "BARANG DAUR ULANG",
-        "electronics": "ELEKTRONIK BEKAS",
-        "legendary": "TREASURE LEGENDARY",
-        "mythical": "MEME MYTHICAL"
-    }
-
-    for category, items in categories.items():
-        emoji = category_emojis.get(category, "📦")
-        category_name = category_names.get(category, category.upper())
-        inventory_text += f"{emoji} **{category_name}:**\n"
-
-        for item_name, item_value, quantity in items:
-            if quantity > 1:
-                inventory_text += f"• **{item_name}** x{quantity} - {item_value} uang each\n"
-            else:
-                inventory_text += f"• **{item_name}** - {item_value} uang\n"
-        inventory_text += "\n"
-
-    inventory_text += "💡 **Tips:**\n"
-    inventory_text += "• `!sell [nama barang]` - Jual barang tertentu\n"
-    inventory_text += "• `!give [user] [barang]` - Beri barang ke user lain\n"
-    inventory_text += "• `!cari` - Cari barang baru di tong sampah"
-
-    await ctx.send(inventory_text)
-
-
-@bot.command()
-async def sell(ctx, *, item_name: str = None):
-    """Jual barang dari inventori - !sell [nama barang]"""
-    if item_name is None:
-        await ctx.send(
-            "❌ **Error:** Masukkan nama barang yang ingin dijual!\n"
-            "📝 **Contoh:** `!sell Botol Plastik`\n"
-            "💡 **Tip:** Gunakan `!inventori` untuk lihat barang yang kamu punya"
-        )
-        return
-
-    balance, vip = await get_user(ctx.author.id)
-    inventory = await get_inventory(ctx.author.id)
-
-    if not inventory:
-        await ctx.send(f"📦 **Inventori kosong!** Gunakan `!cari` untuk mencari barang dulu")
-        return
-
-    # Find the item (case insensitive)
-    item_found = None
-    for inv_item in inventory:
-        if inv_item[0].lower() == item_name.lower():
-            item_found = inv_item
-            break
-
-    if not item_found:
-        # Show available items if item not found
-        available_items = [item[0] for item in inventory]
-        available_text = ", ".join(available_items[:10])  # Show max 10 items
-        if len(available_items) > 10:
-            available_text += f"... (+{len(available_items) - 10} lainnya)"
-
-        await ctx.send(
-            f"❌ **Barang tidak ditemukan:** `{item_name}`\n\n"
-            f"📦 **Barang yang tersedia:**\n{available_text}\n\n"
-            f"💡 **Tip:** Gunakan `!inventori` untuk lihat semua barang"
-        )
-        return
-
-    # Extract item details
-    found_name, found_category, found_value, found_quantity = item_found
-
-    # Remove 1 quantity from inventory
-    success = await remove_from_inventory(ctx.author.id, found_name, 1)
-
-    if not success:
-        await ctx.send("❌ **Error sistem inventori!** Coba lagi.")
-        return
-
-    # Add money to balance (VIP gets 2x bonus!)
-    final_value = found_value * 2 if vip else found_value
-    balance += final_value
-    await update_user(ctx.author.id, balance=balance)
-
-    # Category-specific responses with NEW RARITIES
-    if found_category == "recyclable":
-        emoji = "♻️"
-        sell_messages = [
-            f"{emoji} **Dijual ke pengepul!** {ctx.author.mention} menjual **{found_name}** seharga {found_value} uang!",
-            f"{emoji} **Eco-friendly sale!** {ctx.author.mention} daur ulang **{found_name}** dan dapat {found_value} uang!"
-        ]
-    elif found_category == "electronics":
-        emoji = "⚡"
-        sell_messages = [
-            f"{emoji} **Terjual ke tukang servis!** {ctx.author.mention} jual **{found_name}** seharga {found_value} uang!",
-            f"{emoji} **Spare parts money!** {ctx.author.mention} berhasil jual **{found_name}** ke bengkel!"
-        ]
-    elif found_category == "legendary":
-        emoji = "💎"
-        sell_messages = [
-            f"{emoji} **TREASURE SOLD!** {ctx.author.mention} jual **{found_name}** ke kolektor seharga {found_value} uang!",
-            f"{emoji} **HIGH VALUE SALE!** {ctx.author.mention} berhasil jual **{found_name}** dengan harga premium!"
-        ]
-    else:  # mythical
-        emoji = "🌟"
-        sell_messages = [
-            f"{emoji} **VIRAL MEME SOLD!** {ctx.author.mention} jual **{found_name}** ke meme collector seharga {found_value} uang!",
-            f"{emoji} **LEGENDARY TRADE!** {ctx.author.mention} berhasil jual **{found_name}** dengan harga fantastis!"
-        ]
-
-    # Check remaining quantity for display
-    remaining_quantity = found_quantity - 1
-    quantity_text = f" (masih ada {remaining_quantity}x)" if remaining_quantity > 0 else ""
-
-    vip_bonus_text = f"💎 **VIP BONUS 2x!** ({found_value} → {final_value})" if vip else ""
-
-    await ctx.send(
-        f"{random.choice(sell_messages)}\n\n"
-        f"💰 **Dapat:** {final_value} uang\n"
-        f"{vip_bonus_text}\n" if vip else ""
-        f"💵 **Saldo baru:** {balance}\n"
-        f"📦 **Item:** {found_name}{quantity_text}"
-    )
-
-
-@bot.command()
-async def give(ctx, user: discord.Member = None, *, item_name: str = None):
-    """Beri barang dari inventori ke user lain - !give [user] [nama barang]"""
-    if user is None or item_name is None:
-        await ctx.send(
-            "❌ **Error:** Format tidak lengkap!\n"
-            "📝 **Contoh:** `!give @username Botol Plastik`\n"
-            "💡 **Tip:** Tag user dan masukkan nama barang yang ingin diberikan"
-        )
-        return
-
-    giver_id = ctx.author.id
-    receiver_id = user.id
-
-    # Can't give to yourself
-    if giver_id == receiver_id:
-        await ctx.send("❌ **Error:** Tidak bisa memberi barang ke diri sendiri!")
-        return
-
-    # Can't give to bots
-    if user.bot:
-        await ctx.send("❌ **Error:** Tidak bisa memberi barang ke bot!")
-        return
-
-    # Check giver's inventory
-    giver_inventory = await get_inventory(giver_id)
-    if not giver_inventory:
-        await ctx.send("📦 **Inventori kosong!** Tidak ada barang untuk diberikan.")
-        return
-
-    # Find the item
-    item_found = None
-    for inv_item in giver_inventory:
-        if inv_item[0].lower() == item_name.lower():
-            item_found = inv_item
-            break
-
-    if not item_found:
-        available_items = [item[0] for item in giver_inventory]
-        available_text = ", ".join(available_items[:8])
-        if len(available_items) > 8:
-            available_text += f"... (+{len(available_items) - 8} lainnya)"
-
-        await ctx.send(
-            f"❌ **Barang tidak ditemukan:** `{item_name}`\n\n"
-            f"📦 **Barang yang kamu punya:**\n{available_text}"
-        )
-        return
-
-    found_name, found_category, found_value, found_quantity = item_found
-
-    # Check receiver's inventory capacity
-    receiver_balance, receiver_vip = await get_user(receiver_id)
-    receiver_current_items = await get_inventory_count(receiver_id)
-    receiver_max_capacity = 25 if receiver_vip else 15
-
-    if receiver_current_items >= receiver_max_capacity:
-        vip_status = "💎 VIP" if receiver_vip else "👤 Regular"
-        await ctx.send(
-            f"❌ **{user.mention} inventori penuh!** ({receiver_current_items}/{receiver_max_capacity})\n"
-            f"👤 **Status:** {vip_status}\n"
-            f"💡 **Tip:** User tersebut harus jual barang dulu untuk memberi ruang"
-        )
-        return
-
-    # Remove item from giver
-    success = await remove_from_inventory(giver_id, found_name, 1)
-    if not success:
-        await ctx.send("❌ **Error sistem inventori!** Coba lagi.")
-        return
-
-    # Add item to receiver
-    await add_to_inventory(receiver_id, found_name, found_category, found_value, 1)
-
-    # Category emojis for display
-    category_emojis = {
-        "recyclable": "♻️",
-        "electronics": "⚡", 
-        "legendary": "💎",
-        "mythical": "🌟"
-    }
-
-    emoji = category_emojis.get(found_category, "📦")
-
-    # Special messages for rare items
-    if found_category == "legendary":
-        give_messages = [
-            f"{emoji} **TREASURE GIFT!** {ctx.author.mention} memberikan **{found_name}** kepada {user.mention}!",
-            f"{emoji} **LEGENDARY PRESENT!** {user.mention} dapat hadiah berharga dari {ctx.author.mention}!"
-        ]
-    elif found_category == "mythical":
-        give_messages = [
-            f"{emoji} **MYTHICAL GIFT!** {ctx.author.mention} sharing meme viral **{found_name}** ke {user.mention}! 🔥",
-            f"{emoji} **ULTRA RARE PRESENT!** {user.mention} dapat sticker legendaris dari {ctx.author.mention}! 🚀"
-        ]
-    else:
-        give_messages = [
-            f"{emoji} **Gift delivered!** {ctx.author.mention} memberikan **{found_name}** kepada {user.mention}!",
-            f"{emoji} **Generous act!** {user.mention} dapat hadiah dari {ctx.author.mention}!"
-        ]
-
-    # Check remaining quantity for giver
-    remaining_quantity = found_quantity - 1
-    giver_remaining_text = f" (kamu masih ada {remaining_quantity}x)" if remaining_quantity > 0 else " (barang terakhir kamu!)"
-
-    await ctx.send(
-        f"{random.choice(give_messages)}\n\n"
-        f"🎁 **Item:** {found_name}\n"
-        f"💰 **Nilai:** {found_value} uang\n"
-        f"📦 **Status:** Transfer berhasil{giver_remaining_text}\n"
-        f"🎉 **{user.mention}** sekarang memiliki **{found_name}**!"
-    )
-
-
-@bot.command(aliases=['sellall', 'sell-all'])
-async def jualall(ctx):
-    """Jual semua barang di inventori - !jualall atau !sellall"""
-    balance, vip = await get_user(ctx.author.id)
-    inventory = await get_inventory(ctx.author.id)
-
-    if not inventory:
-        await ctx.send(f"📦 **Inventori kosong!** Tidak ada barang untuk dijual.\n💡 **Tip:** Gunakan `!cari` untuk mencari barang")
-        return
-
-    # Calculate total value and build sell summary
-    total_base_value = 0
-    item_count = 0
-    categories = {"recyclable": [], "electronics": [], "legendary": [], "mythical": []}
-
-    for item_name, item_category, item_value, quantity in inventory:
-        total_base_value += item_value * quantity
-        item_count += quantity
-
-        if item_category in categories:
-            categories[item_category].append((item_name, item_value, quantity))
-
-    # Apply VIP bonus
-    final_total = total_base_value * 2 if vip else total_base_value
-    balance += final_total
-
-    # Clear all inventory
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("DELETE FROM inventory WHERE user_id = ?", (ctx.author.id,))
-        await db.commit()
-
-    # Update user balance
-    await update_user(ctx.author.id, balance=balance)
-
-    # Build response message with special flair for rare items
-    has_rare_items = len(categories["legendary"]) > 0 or len(categories["mythical"]) > 0
-
-    if has_rare_items:
-        sell_messages = [
-            "🌟 **EPIC MASS LIQUIDATION!** Koleksi rare items terjual habis dengan harga fantastis!",
-            "💫 **LEGENDARY GARAGE SALE!** Semua treasure dan meme viral berhasil dijual!",
-            "🔥 **ULTRA BULK SALE!** Kolektor dari seluruh dunia membayar mahal untuk items kamu!"
-        ]
-    else:
-        sell_messages = [
-            "🏪 **MASS LIQUIDATION!** Semua barang terjual habis!",
-            "💸 **GARAGE SALE SUCCESS!** Inventori dikosongkan total!",
-            "🎉 **BULK SALE COMPLETE!** Semua item berhasil dijual!"
-        ]
-
-    response = f"{random.choice(sell_messages)}\n\n"
-    response += f"📦 **Total Items:** {item_count} barang\n"
-    response += f"💰 **Base Value:** {total_base_value} uang\n"
-
-    if vip:
-        response += f"💎 **VIP BONUS 2x!** {total_base_value} → {final_total} uang\n"
-
-    response += f"💵 **Saldo baru:** {balance}\n\n"
-
-    # Show breakdown by category with new rarities
-    category_count = 0
-    if categories["recyclable"]:
-        response += f"♻️ **Barang Daur Ulang:** {len(categories['recyclable'])} jenis\n"
-        category_count += 1
-    if categories["electronics"]:
-        response += f"⚡ **Elektronik Bekas:** {len(categories['electronics'])} jenis\n"
-        category_count += 1
-    if categories["legendary"]:
-        response += f"💎 **Treasure Legendary:** {len(categories['legendary'])} jenis ✨\n"
-        category_count += 1
-    if categories["mythical"]:
-        response += f"🌟 **Meme Mythical:** {len(categories['mythical'])} jenis 🔥\n"
-        category_count += 1
-
-    response += f"\n🎯 **Inventori sekarang:** 0/{'25' if vip else '15'}"
-
-    if has_rare_items:
-        response += f"\n🌟 **RARE COLLECTION BONUS!** Kamu telah menjual {category_count} kategori items yang berbeda!"
-
-    await ctx.send(response)
-
-
-@bot.command()
-async def gamble(ctx, amount: int = None):
-    """Gambling sederhana (VIP only) - !gamble [jumlah]"""
-    if amount is None:
-        await ctx.send(
-            "❌ **Error:** Masukkan jumlah taruhan!\n📝 **Contoh:** `!gamble 50`"
-        )
-        return
-
-    balance, vip = await get_user(ctx.author.id)
-    if not vip:
-        await ctx.send(
-            "🔒 **Maaf,** hanya VIP yang bisa menggunakan fitur gambling.\n💎 **Minta owner untuk VIP:** `!vip @kamu`"
-        )
-        return
-    if amount <= 0:
-        await ctx.send(
-            "❌ **Error:** Masu�kkan jumlah taruhan yang valid (lebih dari 0)!")
-        return
-    if balance < amount:
-        await ctx.send(
-            f"💸 **Saldo tidak cukup!** Kamu butuh {amount} tapi hanya punya {balance} uang.\n💰 **Cari uang dulu:** `!cari`"
-        )
-        return
-
-    menang = random.choice([True, False])
-    if menang:
-        balance += amount
-        await update_user(ctx.author.id, balance=balance)
-        await ctx.send(
-            f"🎉 **MENANG!** {ctx.author.mention} mendapat {amount} uang!\n💰 **Saldo sekarang:** {balance}"
-        )
-    else:
-        balance -= amount
-        await update_user(ctx.author.id, balance=balance)
-        await ctx.send(
-            f"😢 **Kalah!** {ctx.author.mention} kehilangan {amount} uang.\n💰 **Saldo sekarang:** {balance}"
-        )
-
-
-@bot.command()
-async def roulette(ctx, bet: int = None):
-    """🎲 Russian Roulette - Interactive Choice-Based Game!"""
-    if bet is None:
-        await ctx.send(
-            "🎯 **RUSSIAN ROULETTE - CHOICE-BASED!**\n❌ **Error:** Masukkan taruhan!\n📝 **Contoh:** `!roulette 100`\n\n🎮 **Aturan Interactive:**\n🤖 **Bot vs Player** - strategic decisions!\n🎯 **!kepala** - tembak diri sendiri (empty = extra turn!)\n🔫 **!lawan** - tembak lawan (safe play)\n❤️ **3 nyawa per ronde**, reset setiap ronde\n💰 **Menang = taruhan x3**"
-        )
-        return
-
-    # Check if player already has active game
-    if ctx.author.id in active_games:
-        await ctx.send(
-            "❌ **Kamu sudah punya game aktif!**\n🔄 **Selesaikan dulu atau ketik** `!surrender` **untuk menyerah**"
-        )
-        return
-
-    balance, vip = await get_user(ctx.author.id)
-
-    if bet <= 0:
-        await ctx.send("❌ **Error:** Taruhan harus lebih dari 0!")
-        return
-    if balance < bet:
-        await ctx.send(
-            f"💸 **Saldo tidak cukup!** Butuh {bet} tapi hanya punya {balance} uang."
-        )
-        return
-
-    # Initialize game state
-    game_state = {
-        'player_id': ctx.author.id,
-        'channel_id': ctx.channel.id,
-        'bet': bet,
-        'round': 1,
-        'max_rounds': 3,
-        'player_wins': 0,
-        'bot_wins': 0,
-        'player_lives': 3,
-        'bot_lives': 3,
-        'turn_player': True,  # True = player, False = bot
-        'chambers': 0,
-        'bullets': 0,
-        'revolver': [],
-        'current_chamber': 0,
-        'waiting_for_choice': False
-    }
-
-    active_games[ctx.author.id] = game_state
-
-    await ctx.send(
-        f"🎲 **RUSSIAN ROULETTE - STRATEGIC DUEL!**\n\n👤 **Player:** {ctx.author.mention}\n🤖 **Opponent:** 🤖 Alpha D\n💰 **Taruhan:** {bet} uang\n\n🔫 **Mempersiapkan revolver...**"
-    )
-
-    await start_new_round(ctx, game_state)
-
-
-async def start_new_round(ctx, game_state):
-    """Start a new round of Russian Roulette"""
-    round_num = game_state['round']
-
-    await ctx.send(
-        f"\n🔥 **═══ RONDE {round_num} ═══**\n\n🔄 **RESET!** Kedua pemain kembali memiliki 3 nyawa\n🎯 **Player:** <@{game_state['player_id']}> ❤️❤️❤️\n🤖 **Bot:** 🤖 Alpha D ❤️❤️❤️"
-    )
-
-    await asyncio.sleep(2)
-
-    # Reset lives for this round
-    game_state['player_lives'] = 3
-    game_state['bot_lives'] = 3
-
-    # Setup realistic revolver with progressive difficulty
-    chambers = random.randint(6, 9)
-
-    # Progressive difficulty system
-    if round_num == 1:
-        bullets = random.randint(1, 3)  # Round 1: 1-3 bullets (easier)
-    elif round_num == 2:
-        bullets = random.randint(3, 4)  # Round 2: 3-4 bullets (medium)
-    else:  # round 3
-        bullets = random.randint(4, 5)  # Round 3: 4-5 bullets (harder)
-
-    # Ensure bullets don't exceed chambers
-    bullets = min(bullets, chambers - 1)
-
-    # Create revolver with random bullet positions
-    revolver = [False] * chambers
-    bullet_positions = random.sample(range(chambers), bullets)
-    for pos in bullet_positions:
-        revolver[pos] = True
-
-    game_state['chambers'] = chambers
-    game_state['bullets'] = bullets
-    game_state['revolver'] = revolver
-    game_state['current_chamber'] = 0
-
-    # Difficulty indicator
-    if round_num == 1:
-        difficulty = "🟢 **MUDAH**"
-    elif round_num == 2:
-        difficulty = "🟡 **MEDIUM**"
-    else:
-        difficulty = "🔴 **SULIT**"
-
-    await ctx.send(
-        f"🔫 **REVOLVER SETUP:**\n📊 **Chambers:** {chambers}\n💥 **Bullets:** {bullets}\n🎲 **Bullet positions:** *Hidden*\n⚡ **Difficulty:** {difficulty}\n\n🎯 **Starting chamber:** 1/{chambers}"
-    )
-
-    await asyncio.sleep(1)
-
-    # Determine who goes first randomly
-    game_state['turn_player'] = random.choice([True, False])
-
-    if game_state['turn_player']:
-        await ctx.send("🎲 **Koin dilempar...** 🪙\n\n✨ **PLAYER MULAI DULUAN!**"
-                       )
-        await asyncio.sleep(1)
-        await prompt_player_choice(ctx, game_state)
-    else:
-        await ctx.send("🎲 **Koin dilempar...** 🪙\n\n🤖 **BOT MULAI DULUAN!**")
-        await asyncio.sleep(1)
-        await bot_turn(ctx, game_state)
-
-
-async def prompt_player_choice(ctx, game_state):
-    """Prompt player to make a choice"""
-    current_chamber = game_state['current_chamber'] % game_state['chambers']
-
-    await ctx.send(
-        f"\n🎯 **GILIRAN ANDA!**\n\n🔫 **Chamber {current_chamber + 1}/{game_state['chambers']}**\n❤️ **Nyawa Player:** {game_state['player_lives']} | **Bot:** {game_state['bot_lives']}\n\n🤔 **Pilih tindakan:**\n🎯 **!kepala** - Tembak diri sendiri (berisiko, tapi bisa extra turn!)\n🔫 **!lawan** - Tembak lawan (bermain aman)\n\n⏰ **Waktu 30 detik untuk memilih...**"
-    )
-
-    game_state['waiting_for_choice'] = True
-
-
-async def bot_turn(ctx, game_state):
-    """Handle bot's turn with AI decision making"""
-    current_chamber = game_state['current_chamber'] % game_state['chambers']
-
-    await ctx.send(
-        f"\n🤖 **GILIRAN BOT**\n\n🔫 **Chamber {current_chamber + 1}/{game_state['chambers']}**\n❤️ **Nyawa Player:** {game_state['player_lives']} | **Bot:** {game_state['bot_lives']}\n\n🎲 **Bot sedang menganalisis...**"
-    )
-
-    await asyncio.sleep(2)
-
-    # Advanced Bot AI decision making
-    chambers_left = game_state['chambers'] - game_state['current_chamber']
-    bullets_left = sum(game_state['revolver'][game_state['current_chamber']:])
-    bullet_chance = bullets_left / chambers_left if chambers_left > 0 else 0
-
-    # Smart bot strategy based on multiple factors
-    shoot_self = False
-
-    # Factor 1: Life advantage/disadvantage
-    life_advantage = game_state['bot_lives'] - game_state['player_lives']
-
-    # Factor 2: Round progression (more aggressive in later rounds)
-    round_aggression = 0.1 * game_state['round']  # 0.1, 0.2, 0.3
-
-    # Factor 3: Bullet risk assessment
-    safe_threshold = 0.25 + round_aggression  # Gets more aggressive each round
-
-    # Decision matrix
-    if bullet_chance <= safe_threshold:
-        # Relatively safe - consider shooting self for extra turn
-        if life_advantage >= 0:
-            # Bot is ahead or tied - play for extra turns
-            shoot_self = True
-        else:
-            # Bot is behind - 70% chance to risk it for extra turn
-            shoot_self = random.random() < 0.7
-
-    elif game_state['player_lives'] == 1:
-        # Player has 1 life - always go for the kill
-        shoot_self = False
-
-    elif life_advantage > 1:
-        # Bot has significant life advantage - play it safe
-        shoot_self = False
-
-    elif life_advantage < -1:
-        # Bot is significantly behind - take risks
-        if bullet_chance < 0.5:
-            shoot_self = True
-        else:
-            # Even risky, but desperate
-            shoot_self = random.random() < 0.4
-
-    else:
-        # Close game - balanced strategy
-        if bullet_chance < 0.35:
-            shoot_self = random.random(
-            ) < 0.6  # 60% chance to risk for extra turn
-        else:
-            shoot_self = random.random(
-            ) < 0.3  # 30% chance to risk with high danger
-
-    if shoot_self:
-        # Bot shoots self - various strategic reasons
-        if bullet_chance <= 0.2:
-            bot_thoughts = [
-                "🤖 *\"Probabilitas sangat aman, ambil extra turn...\"*",
-                "🤖 *\"Risiko minimal, keuntungan maksimal...\"*",
-                "�🤖 *\"Matematika mendukung keputusan ini...\"*"
-            ]
-        elif life_advantage < 0:
-            bot_thoughts = [
-                "🤖 *\"Situasi sulit, harus ambil risiko...\"*",
-                "🤖 *\"Desperate times, desperate measures...\"*",
-                "🤖 *\"All-in untuk comeback!\"*"
-            ]
-        else:
-            bot_thoughts = [
-                "🤖 *\"Strategi agresif untuk dominasi...\"*",
-                "🤖 *\"Kalkulasi risiko vs reward...\"*",
-                "🤖 *\"Confidence level: optimal...\"*"
-            ]
-
-        await ctx.send(
-            f"{random.choice(bot_thoughts)}\n\n🎯 **Bot memilih: TEMBAK DIRI SENDIRI!**\n📊 **Bullet chance:** {bullet_chance:.1%}"
-        )
-        await asyncio.sleep(1)
-        await execute_shot(ctx, game_state, True,
-                           False)  # shoot_self=True, is_player=False
-    else:
-        # Bot shoots player - offensive strategy
-        if game_state['player_lives'] == 1:
-            bot_thoughts = [
-                "🤖 *\"Target dalam mode critical - eliminasi!\"*",
-                "🤖 *\"Finishing move activated...\"*",
-                "🤖 *\"Saatnya mengakhiri permainan ini...\"*"
-            ]
-        elif bullet_chance > 0.5:
-            bot_thoughts = [
-                "🤖 *\"Terlalu berisiko untuk diri sendiri...\"*",
-                "🤖 *\"Safety first, attack second...\"*",
-                "🤖 *\"Bermain konservatif lebih bijak...\"*"
-            ]
-        else:
-            bot_thoughts = [
-                "🤖 *\"Strategi ofensif langsung...\"*",
-                "🤖 *\"Pressure is the key to victory...\"*",
-                "🤖 *\"Eliminate atau be eliminated...\"*"
-            ]
-
-        await ctx.send(
-            f"{random.choice(bot_thoughts)}\n\n🔫 **Bot memilih: TEMBAK PLAYER!**\n📊 **Bullet chance:** {bullet_chance:.1%}"
-        )
-        await asyncio.sleep(1)
-        await execute_shot(ctx, game_state, False,
-                           False)  # shoot_self=False, is_player=False
-
-
-async def execute_shot(ctx, game_state, shoot_self, is_player):
-    """Execute the shot and handle the consequences"""
-    current_chamber = game_state['current_chamber'] % game_state['chambers']
-    is_bullet = game_state['revolver'][current_chamber]
-
-    await asyncio.sleep(2)
-
-    if is_bullet:
-        # Hit bullet
-        if shoot_self:
-            if is_player:
-                game_state['player_lives'] -= 1
-                await ctx.send(
-                    f"💥 **BANG!** 💀\n\n☠️ **Player menembak diri sendiri dan kena peluru!**\n❤️ **Nyawa tersisa:** {game_state['player_lives']}"
-                )
-            else:
-                game_state['bot_lives'] -= 1
-                await ctx.send(
-                    f"💥 **BANG!** 🔥\n\n🤖 **Bot menembak diri sendiri dan kena peluru!**\n❤️ **Nyawa tersisa:** {game_state['bot_lives']}"
-                )
-        else:
-            if is_player:
-                game_state['bot_lives'] -= 1
-                await ctx.send(
-                    f"💥 **BANG!** 🎯\n\n🔫 **Player menembak bot dan kena sasaran!**\n❤️ **Bot nyawa tersisa:** {game_state['bot_lives']}"
-                )
-            else:
-                game_state['player_lives'] -= 1
-                await ctx.send(
-                    f"💥 **BANG!** 🎯\n\n🤖 **Bot menembak player dan kena sasaran!**\n❤️ **Player nyawa tersisa:** {game_state['player_lives']}"
-                )
-
-        # Switch turns (bullet = end turn)
-        game_state['turn_player'] = not game_state['turn_player']
-
-    else:
-        # Empty chamber
-        if shoot_self:
-            if is_player:
-                await ctx.send(
-                    f"🔫 **KLIK** ✨\n\n😎 **Player berani dan beruntung!** Chamber kosong!\n🎉 **BONUS TURN! Player bisa menembak lagi!**"
-                )
-                # Don't switch turns - player gets extra turn
-            else:
-                await ctx.send(
-                    f"🔫 **KLIK** ⚡\n\n🤖 *\"Perhitungan yang tepat!\"* Chamber kosong!\n🎉 **Bot mendapat giliran tambahan!**"
-                )
-                # Don't switch turns - bot gets extra turn
-        else:
-            if is_player:
-                await ctx.send(
-                    f"🔫 **KLIK** 😤\n\n💔 **Chamber kosong! Bot selamat!**\n🔄 **Giliran berganti ke bot...**"
-                )
-            else:
-                await ctx.send(
-                    f"🔫 **KLIK** 😅\n\n💚 **Chamber kosong! Player selamat!**\n🔄 **Giliran berganti ke player...**"
-                )
-
-            # Switch turns (missed shot = opponent's turn)
-            game_state['turn_player'] = not game_state['turn_player']
-
-    game_state['current_chamber'] += 1
-    await asyncio.sleep(1)
-
-    # Check for round end
-    if game_state['player_lives'] <= 0:
-        await end_round(ctx, game_state, 'bot')
-    elif game_state['bot_lives'] <= 0:
-        await end_round(ctx, game_state, 'player')
-    else:
-        # Continue game
-        if game_state['turn_player']:
-            await prompt_player_choice(ctx, game_state)
-        else:
-            await bot_turn(ctx, game_state)
-
-
-async def end_round(ctx, game_state, winner):
-    """End the current round and start next or end game"""
-    if winner == 'player':
-        game_state['player_wins'] += 1
-        await ctx.send(f"🎉 **PLAYER MENANG RONDE {game_state['round']}!**")
-    else:
-        game_state['bot_wins'] += 1
-        await ctx.send(f"🤖 **BOT MENANG RONDE {game_state['round']}!**")
-
-    await asyncio.sleep(2)
-
-    if game_state['round'] < game_state['max_rounds']:
-        await ctx.send(
-            f"\n📊 **SKOR SEMENTARA:**\n🎯 **Player:** {game_state['player_wins']} ronde\n🤖 **Bot:** {game_state['bot_wins']} ronde\n\n⏭️ **Lanjut ke ronde berikutnya...**"
-        )
-        game_state['round'] += 1
-        await asyncio.sleep(2)
-        await start_new_round(ctx, game_state)
-    else:
-        await end_game(ctx, game_state)
-
-
-async def end_game(ctx, game_state):
-    """End the entire game and distribute rewards"""
-    player_id = game_state['player_id']
-    bet = game_state['bet']
-
-    await ctx.send(
-        f"\n🏁 **═══ HASIL AKHIR ═══**\n\n📊 **SKOR FINAL:**\n🎯 **Player:** {game_state['player_wins']}/{game_state['max_rounds']} ronde\n🤖 **Bot:** {game_state['bot_wins']}/{game_state['max_rounds']} ronde"
-    )
-
-    balance, vip = await get_user(player_id)
-
-    if game_state['player_wins'] > game_state['bot_wins']:
-        # Player wins
-        winnings = bet * 3
-        balance += winnings
-        await update_user(player_id, balance=balance)
-        await ctx.send(
-            f"🏆 **KEMENANGAN STRATEGIC!** 🎉\n\n🎯 **PLAYER MENANG!**\n💰 **Hadiah:** {winnings} uang (3x taruhan!)\n💵 **Saldo baru:** {balance}\n\n🤖 *\"Strategi yang mengesankan, manusia...\"*"
-        )
-    elif game_state['bot_wins'] > game_state['player_wins']:
-        # Bot wins
-        balance -= bet
-        await update_user(player_id, balance=balance)
-        await ctx.send(
-            f"💀 **KEKALAHAN STRATEGIC!** 😱\n\n🤖 **BOT MENANG!**\n💸 **Kehilangan:** {bet} uang\n💵 **Saldo baru:** {balance}\n\n🤖 *\"Artificial Intelligence > Human Intuition!\"*"
-        )
-    else:
-        # Tie
-        await ctx.send(
-            f"🤝 **SERI STRATEGIC!** ⚖️\n\nBattle of minds berakhir seri!\n💰 **Taruhan dikembalikan:** {bet} uang\n\n🤖 *\"Kemampuan strategis yang setara...\"*"
-        )
-
-    # Remove from active games
-    del active_games[player_id]
-
-    await ctx.send(
-        f"\n🎲 **Main lagi?** `!roulette {bet}`\n🔄 **Atau ubah taruhan:** `!roulette [jumlah_baru]`"
-    )
-
-
-@bot.command()
-async def kepala(ctx):
-    """Tembak kepala sendiri - berisiko tapi bisa dapat extra turn!"""
-    if ctx.author.id not in active_games:
-        await ctx.send(
-            "❌ **Tidak ada game aktif!**\n🎲 **Mulai game:** `!roulette [taruhan]`"
-        )
-        return
-
-    game_state = active_games[ctx.author.id]
-
-    if not game_state['waiting_for_choice']:
-        await ctx.send("❌ **Bukan giliran kamu atau sudah memilih!**")
-        return
-
-    if not game_state['turn_player']:
-        await ctx.send("❌ **Ini giliran bot, bukan kamu!**")
-        return
-
-    game_state['waiting_for_choi�ce'] = False
-    await ctx.send("🎯 **PILIHAN BERANI!** Menembak kepala sendiri...")
-    await execute_shot(ctx, game_state, True,
-                       True)  # shoot_self=True, is_player=True
-
-
-@bot.command()
-async def lawan(ctx):
-    """Tembak lawan - bermain aman"""
-    if ctx.author.id not in active_games:
-        await ctx.send(
-            "❌ **Tidak ada game aktif!**\n🎲 **Mulai game:** `!roulette [taruhan]`"
-        )
-        return
-
-    game_state = active_games[ctx.author.id]
-
-    if not game_state['waiting_for_choice']:
-        await ctx.send("❌ **Bukan giliran kamu atau sudah memilih!**")
-        return
-
-    if not game_state['turn_player']:
-        await ctx.send("❌ **Ini giliran bot, bukan kamu!**")
-        return
-
-    game_state['waiting_for_choice'] = False
-    await ctx.send("🔫 **PILIHAN AMAN!** Menembak lawan...")
-    await execute_shot(ctx, game_state, False,
-                       True)  # shoot_self=False, is_player=True
-
-
-@bot.command()
-async def surrender(ctx):
-    """Menyerah dari game aktif"""
-    if ctx.author.id not in active_games:
-        await ctx.send("❌ **Tidak ada game aktif untuk diserahkan!**")
-        return
-
-    game_state = active_games[ctx.author.id]
-    bet = game_state['bet']
-
-    # Lose half the bet when surrendering
-    balance, vip = await get_user(ctx.author.id)
-    penalty = bet // 2
-    balance -= penalty
-    await update_user(ctx.author.id, balance=balance)
-
-    del active_games[ctx.author.id]
-
-    await ctx.send(
-        f"🏳️ **SURRENDER!**\n\n😔 **{ctx.author.mention} menyerah dari Russian Roulette**\n💸 **Penalty:** {penalty} uang (50% taruhan)\n💵 **Saldo baru:** {balance}\n\n🤖 *\"Keputusan yang bijak... atau pengecut?\"*"
-    )
-
-
-@bot.tree.command(name="ping", description="Test bot responsif")
-async def ping_slash(interaction: discord.Interaction):
-    latency = round(bot.latency * 1000)
-    await interaction.response.send_message(f"🏓 Pong! Latency: {latency}ms\nBot online dan berfungsi!")
-
-
-@bot.tree.command(name="balance", description="Cek saldo kamu")
-async def balance_slash(interaction: discord.Interaction):
-    user_id = interaction.user.id
-    balance, vip = await get_user(user_id)
-    vip_status = "💎 VIP" if vip else "👤 Regular"
-    await interaction.response.send_message(
-        f"💰 **Saldo {interaction.user.mention}:** {balance} uang\n🏆 **Status:** {vip_status}")
-
-
-@bot.tree.command(name="help", description="Menampilkan daftar command dan panduan penggunaan bot.")
-async def help_slash(interaction: discord.Interaction):
-    help_text = (
-        "**Panduan Bot Alpha D**\n"
-        "\n"
-        "/ping - Cek respons bot\n"
-        "/cari - Cari barang di tong sampah\n"
-        "/balance - Cek saldo kamu\n"
-        "/inventori - Lihat inventori kamu\n"
-        "/sell [nama barang] - Jual barang tertentu\n"
-        "/give [user] [nama barang] - Beri barang ke user lain\n"
-        "/vip @user - Berikan status VIP (owner only)\n"
-        "/gamble [jumlah] - Gambling sederhana (VIP only)\n"
-        "/roulette [jumlah] - Main Russian Roulette\n"
-        "/jualall - Jual semua barang di inventori\n"
-        "/mute, /kick, /ban - Moderasi server\n"
-        "\n"
-        "💡 Untuk detail tiap command, gunakan /help [nama command]"
-        "\n"
-        "Note : beberapa command mungkin belum tersedia di slash command. Jadi gunakan prefix '!' untuk command tersebut."
-    )
-    await interaction.response.send_message(help_text)
-
-
-@bot.tree.command(name="transfer", description="Transfer uang ke user lain.")
-@app_commands.describe(user="User tujuan", jumlah="Jumlah uang yang akan dikirim")
-async def transfer_slash(interaction: discord.Interaction, user: discord.Member, jumlah: int):
-    if user.bot:
-        await interaction.response.send_message("❌ Tidak bisa transfer ke bot!", ephemeral=True)
-        return
-    if user.id == interaction.user.id:
-        await interaction.response.send_message("❌ Tidak bisa transfer ke diri sendiri!", ephemeral=True)
-        return
-    if jumlah <= 0:
-        await interaction.response.send_message("❌ Jumlah harus lebih dari 0!", ephemeral=True)
-        return
-    balance, _ = await get_user(interaction.user.id)
-    if balance < jumlah:
-        await interaction.response.send_message(f"❌ Saldo tidak cukup! Kamu punya {balance} uang.", ephemeral=True)
-        return
-    receiver_balance, _ = await get_user(user.id)
-    await update_user(interaction.user.id, balance=balance-jumlah)
-    await update_user(user.id, balance=receiver_balance+jumlah)
-    await interaction.response.send_message(f"✅ {interaction.user.mention} mengirim {jumlah} uang ke {user.mention}!", ephemeral=False)
-
-@bot.tree.command(name="gambling", description="Main gambling melawan agen bot.")
-@app_commands.describe(game="Pilih game: rolet, blackjack, poker", jumlah="Jumlah taruhan")
-async def gambling_slash(interaction: discord.Interaction, game: str, jumlah: int):
-    game = game.lower()
-    if game not in ["rolet", "blackjack", "poker"]:
-        await interaction.response.send_message("❌ Game tidak tersedia! Pilih: rolet, blackjack, poker.", ephemeral=True)
-        return
-    if jumlah <= 0:
-        await interaction.response.send_message("❌ Jumlah taruhan harus lebih dari 0!", ephemeral=True)
-        return
-    balance, vip = await get_user(interaction.user.id)
-    if balance < jumlah:
-        await interaction.response.send_message(f"❌ Saldo tidak cukup! Kamu punya {balance} uang.", ephemeral=True)
-        return
-    # Rolet
-    if game == "rolet":
-        menang = random.choice([True, False])
-        if menang:
-            balance += jumlah
-            await update_user(interaction.user.id, balance=balance)
-            await interaction.response.send_message(f"🎲 **ROLET**: Kamu MENANG! +{jumlah} uang. Saldo sekarang: {balance}")
-        else:
-            balance -= jumlah
-            await update_user(interaction.user.id, balance=balance)
-            await interaction.response.send_message(f"🎲 **ROLET**: Kamu KALAH! -{jumlah} uang. Saldo sekarang: {balance}")
-    # Blackjack
-    elif game == "blackjack":
-        player = random.randint(16, 21)
-        dealer = random.randint(16, 21)
-        if player > dealer:
-            balance += jumlah
-            await update_user(interaction.user.id, balance=balance)
-            await interaction.response.send_message(f"🃏 **BLACKJACK**: Kamu {player}, Dealer {dealer}. MENANG! +{jumlah} uang. Saldo: {balance}")
-        elif player < dealer:
-            balance -= jumlah
-            await update_user(interaction.user.id, balance=balance)
-            await interaction.response.send_message(f"🃏 **BLACKJACK**: Kamu {player}, Dealer {dealer}. KALAH! -{jumlah} uang. Saldo: {balance}")
-        else:
-            await interaction.response.send_message(f"🃏 **BLACKJACK**: Seri! Kamu {player}, Dealer {dealer}. Saldo: {balance}")
-    # Poker
-    elif game == "poker":
-        hasil = random.choice(["MENANG", "KALAH", "SERI"])
-        if hasil == "MENANG":
-            balance += jumlah * 2
-            await update_user(interaction.user.id, balance=balance)
-            await interaction.response.send_message(f"♠️ **POKER**: Kamu MENANG! +{jumlah*2} uang. Saldo: {balance}")
-        elif hasil == "KALAH":
-            balance -= jumlah
-            await update_user(interaction.user.id, balance=balance)
-            await interaction.response.send_message(f"♠️ **POKER**: Kamu KALAH! -{jumlah} uang. Saldo: {balance}")
-        else:
-            await interaction.response.send_message(f"♠️ **POKER**: Seri! Saldo: {balance}")
-
-
-if TOKEN is None:
-    print("Error: DISCORD_TOKEN environment variable not found!")
-    print("Please set your Discord bot token.")
-    exit(1)
-
-app = Flask('')
-
-@app.route('/')
-def home():
-    return "Bot is alive!"
-
-def run():
-    app.run(host='0.0.0.0', port=8080)
-
-def keep_alive():
-    t = Thread(target=run)
-    t.start()
-    
-keep_alive()
-
-bot.run(TOKEN)
+import os
+import discord
+from discord.ext import commands
+from dotenv import load_dotenv
+import random
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import functools
+import hashlib
+import time
+from discord import app_commands
+
+import backup
+import blackjack
+import bulk
+import dump
+import events
+import maintenance
+import metrics
+import poker
+import pvp
+import tournament
+import tracing
+from health import HealthMonitor
+from itemcache import ItemNameCache
+from ipc import IPCRegistry, LocalRegistry
+from storage import DEFAULT_BALANCE, PartitionedStorage, make_storage
+from scheduler import Scheduler
+from stats import STAT_EVENTS, StatsRecorder
+from webserver import WebServer, serve_with_flask
+
+load_dotenv()  # load .env
+
+# Game state tracking for interactive Russian Roulette
+active_games = {}
+# game_id -> game_state, untuk tombol pilihan roulette
+roulette_games = {}
+
+TOKEN = os.getenv('DISCORD_TOKEN')
+OWNER_ID_STR = os.getenv('OWNER_ID')
+if OWNER_ID_STR is None:
+    print("Error: OWNER_ID environment variable not found!")
+    exit(1)
+OWNER_ID = int(OWNER_ID_STR)
+
+MUTE_ROLE_NAME = "Muted"
+# Jumlah set_permissions paralel saat menyiapkan role Muted
+MUTE_PROVISION_CONCURRENCY = int(os.getenv('MUTE_PROVISION_CONCURRENCY', '5'))
+MUTE_OVERWRITE = discord.PermissionOverwrite(speak=False,
+                                             send_messages=False,
+                                             read_message_history=True,
+                                             read_messages=False)
+DB_PATH = os.getenv('DB_PATH', 'userdata.db')
+# "sqlite" (default) atau "memory" (tanpa persistensi, untuk load test)
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'sqlite')
+# Sharding multi-proses (diisi oleh launcher.py); kosong = satu proses, shard otomatis
+SHARD_COUNT = int(os.getenv('SHARD_COUNT')) if os.getenv('SHARD_COUNT') else None
+SHARD_IDS = [int(i) for i in os.getenv('SHARD_IDS').split(',')] if os.getenv('SHARD_IDS') else None
+IPC_SOCKET = os.getenv('IPC_SOCKET')
+# Detik menunggu lock writer SQLite sebelum "database is locked"
+DB_BUSY_TIMEOUT = float(os.getenv('DB_BUSY_TIMEOUT', '10'))
+# Koneksi SQLite yang dipakai ulang per file database
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))
+# Ekonomi (saldo, VIP, inventori, limit harian): "global" = satu untuk semua server,
+# "guild" = terpisah per server. ECONOMY_FILES memilih tempat data per server disimpan:
+# "shared" (di DB_PATH), "guild" (satu file per server) atau angka N (server di-hash
+# ke N file), di folder ECONOMY_DIR
+ECONOMY_MODE = os.getenv('ECONOMY_MODE', 'global')
+ECONOMY_FILES = os.getenv('ECONOMY_FILES', 'shared')
+ECONOMY_DIR = os.getenv('ECONOMY_DIR', 'economy')
+WEB_HOST = os.getenv('WEB_HOST', '0.0.0.0')
+WEB_PORT = int(os.getenv('PORT', '8080'))
+# "asyncio" (default) atau "flask" (butuh Flask terinstall)
+WEB_BACKEND = os.getenv('WEB_BACKEND', 'asyncio')
+# Threshold /healthz (detik); di atas ini endpoint membalas 503
+HEALTH_MAX_LOOP_LAG = float(os.getenv('HEALTH_MAX_LOOP_LAG', '1.0'))
+HEALTH_MAX_DB_LATENCY = float(os.getenv('HEALTH_MAX_DB_LATENCY', '0.5'))
+HEALTH_MAX_GATEWAY_LATENCY = float(os.getenv('HEALTH_MAX_GATEWAY_LATENCY', '5.0'))
+# Command lebih lama dari ini (detik) di-log beserta breakdown span-nya
+SLOW_COMMAND_THRESHOLD = float(os.getenv('SLOW_COMMAND_THRESHOLD', '1.0'))
+PROFILE_DEFAULT_SECONDS = 30
+# Autocomplete nama barang: umur cache (detik) dan batas waktu muat saat cache miss
+ITEM_CACHE_TTL = float(os.getenv('ITEM_CACHE_TTL', '60'))
+AUTOCOMPLETE_LOAD_TIMEOUT = 0.5
+# Channel pengumuman rare drop / kemenangan besar / VIP baru (kosong = nonaktif)
+ANNOUNCE_CHANNEL_ID = int(os.getenv('ANNOUNCE_CHANNEL_ID', '0'))
+BIG_WIN_THRESHOLD = int(os.getenv('BIG_WIN_THRESHOLD', '500'))
+# Interval flush statistik user ke database (detik)
+STATS_FLUSH_INTERVAL = float(os.getenv('STATS_FLUSH_INTERVAL', '5'))
+# Backup online userdata.db: interval (detik, 0 = nonaktif), jumlah snapshot yang disimpan,
+# dan halaman per step backup API
+BACKUP_DIR = os.getenv('BACKUP_DIR', 'backups')
+BACKUP_INTERVAL = float(os.getenv('BACKUP_INTERVAL', str(6 * 3600)))
+BACKUP_KEEP = int(os.getenv('BACKUP_KEEP', '7'))
+BACKUP_PAGES = int(os.getenv('BACKUP_PAGES', '256'))
+# Folder hasil !export (JSONL/CSV gzip) dan sumber !import
+EXPORT_DIR = os.getenv('EXPORT_DIR', 'exports')
+# Jeda minimal antar edit pesan progress command owner yang lama (detik)
+PROGRESS_INTERVAL = 2.0
+# Member list (privileged intent) untuk target role di !massal; aktifkan juga di developer portal
+MEMBERS_INTENT = os.getenv('MEMBERS_INTENT', '0') == '1'
+# Maintenance harian (retensi daily_usage, arsip user, incremental vacuum) pada jam lokal
+# yang sepi (-1 = nonaktif), dibatasi anggaran waktu (detik). Arsip user dengan saldo 0
+# yang tidak aktif sekian hari hanya jalan kalau ARCHIVE_AFTER_DAYS > 0
+MAINTENANCE_HOUR = int(os.getenv('MAINTENANCE_HOUR', '4'))
+MAINTENANCE_BUDGET = float(os.getenv('MAINTENANCE_BUDGET', '60'))
+ARCHIVE_AFTER_DAYS = int(os.getenv('ARCHIVE_AFTER_DAYS', '0'))
+# Aturan kualifikasi dealer /gambling poker (hold'em) dan poker5 (5 kartu), mis. "high-K", "pair-4"
+# Blackjack: jumlah deck di shoe, dealer hit soft 17 (1 = ya), batas tangan aktif per proses
+# dan auto-stand setelah idle (detik)
+BLACKJACK_DECKS = int(os.getenv('BLACKJACK_DECKS', '6'))
+BLACKJACK_H17 = os.getenv('BLACKJACK_H17', '0') == '1'
+BLACKJACK_MAX_HANDS = int(os.getenv('BLACKJACK_MAX_HANDS', '1000'))
+BLACKJACK_IDLE_TIMEOUT = float(os.getenv('BLACKJACK_IDLE_TIMEOUT', '120'))
+# Roulette PvP: selisih taruhan maksimal agar dua user dipasangkan (0.2 = 20%)
+# dan batas waktu satu giliran (detik) sebelum pemain dianggap kalah
+PVP_TOLERANCE = float(os.getenv('PVP_TOLERANCE', '0.2'))
+PVP_TURN_TIMEOUT = float(os.getenv('PVP_TURN_TIMEOUT', '60'))
+# Turnamen roulette: batas peserta per turnamen dan lama pendaftaran default (menit)
+TOURNAMENT_MAX_PLAYERS = int(os.getenv('TOURNAMENT_MAX_PLAYERS', '128'))
+TOURNAMENT_SIGNUP_MINUTES = int(os.getenv('TOURNAMENT_SIGNUP_MINUTES', '15'))
+POKER_MIN_DEALER = {
+    'holdem': poker.qualifier(os.getenv('POKER_QUALIFY', poker.DEFAULT_QUALIFY['holdem'])),
+    'stud': poker.qualifier(os.getenv('POKER5_QUALIFY', poker.DEFAULT_QUALIFY['stud'])),
+}
+
+log = logging.getLogger('alphad')
+
+intents = discord.Intents.none()
+intents.guilds = True
+intents.guild_messages = True
+# Aktifkan setelah enable privileged intents di developer portal
+intents.message_content = True
+intents.members = MEMBERS_INTENT
+
+
+class TracedContext(commands.Context):
+    async def send(self, *args, **kwargs):
+        with tracing.span('ctx.send'):
+            return await super().send(*args, **kwargs)
+
+
+class MyCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction):
+        # Catat waktu mulai untuk metrik latency slash command
+        interaction.extras['started'] = time.perf_counter()
+        current_guild.set(interaction.guild_id or 0)
+        if interaction.type == discord.InteractionType.application_command:
+            interaction.extras['in_flight'] = True
+            IN_FLIGHT_COMMANDS.inc()
+            name = interaction.command.qualified_name if interaction.command else "?"
+            interaction.extras['trace'] = tracing.start_trace(f"/{name}")
+        return True
+
+    async def on_error(self, interaction, error):
+        finish_slash_command(interaction, "error")
+        await super().on_error(interaction, error)
+        # Command yang sudah defer akan "thinking" selamanya kalau tidak dibalas
+        if interaction.response.is_done():
+            try:
+                await interaction.followup.send("❌ **Terjadi error!** Coba lagi nanti.", ephemeral=True)
+            except discord.HTTPException:
+                pass
+
+
+class MyBot(commands.AutoShardedBot):
+    def __init__(self, **kwargs):
+        super().__init__(tree_cls=MyCommandTree, **kwargs)
+        # self.tree = discord.app_commands.CommandTree(self)  # HAPUS baris ini
+        self.background_tasks = set()
+
+    def start_background(self, coro):
+        """Task latar yang dibatalkan di close() sebelum storage ditutup"""
+        task = self.loop.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
+
+    async def setup_hook(self):
+        # Dijalankan sekali per proses (bukan tiap reconnect seperti on_ready)
+        await init_db()
+        await asyncio.to_thread(poker.build_tables)
+        self.add_dynamic_items(RouletteChoiceButton, DuelChoiceButton)
+        # Command tree sama di semua shard; cukup satu proses yang sync
+        if is_primary_process():
+            try:
+                await sync_commands()
+            except discord.HTTPException:
+                log.exception("Gagal sync slash commands")
+        # Jadwalkan ulang timed mute yang belum selesai
+        for guild_id, user_id, unmute_at in await get_timed_mutes():
+            if owns_guild(guild_id):
+                schedule_unmute(guild_id, user_id, unmute_at)
+        if BACKUP_INTERVAL > 0 and is_primary_process():
+            schedule_backup()
+        if MAINTENANCE_HOUR >= 0 and is_primary_process():
+            schedule_maintenance()
+        # Turnamen yang belum selesai: lanjutkan pendaftaran atau ronde yang sedang berjalan,
+        # atau bayar hadiah/refund yang belum tercatat kalau sudah selesai/batal
+        for state in await get_active_tournaments():
+            if owns_guild(state['guild_id']):
+                tour = tournament.Tournament.from_dict(state)
+                if tour.status in ('signup', 'running'):
+                    tournaments[tour.guild_id] = tour
+                if tour.status == 'signup':
+                    schedule_tournament_start(tour)
+                else:
+                    self.start_background(resume_tournament(tour))
+        scheduler.start()
+        bus.start()
+        self.start_background(user_stats.run())
+        # Sampler event-loop lag dan probe DB untuk /metrics dan /healthz
+        self.start_background(metrics.monitor_loop_lag(record_loop_lag))
+        self.start_background(health.run())
+        # Web server keep-alive berjalan di event loop bot
+        if WEB_BACKEND == 'flask':
+            serve_with_flask(web, self.loop)
+        else:
+            await web.start()
+
+    async def close(self):
+        # Task latar dihentikan dulu supaya tidak ada yang memakai storage setelah ditutup
+        tasks = list(self.background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await scheduler.stop()
+        await close_blackjack()
+        await close_roulette()
+        await close_duels()
+        await bus.stop()
+        try:
+            await user_stats.flush()
+        except Exception:
+            log.exception("Gagal flush user stats saat shutdown")
+        await game_registry.close()
+        await web.stop()
+        if economies is not None:
+            await economies.close()
+        await storage.close()
+        await super().close()
+
+    async def get_context(self, origin, *, cls=TracedContext):
+        # Dipanggil di task event pesan, jadi berlaku untuk seluruh command ini
+        current_guild.set(origin.guild.id if origin.guild else 0)
+        return await super().get_context(origin, cls=cls)
+
+
+# Status dikirim saat IDENTIFY, jadi tidak perlu change_presence tiap reconnect
+bot = MyBot(command_prefix='!', intents=intents, help_command=None,
+            shard_count=SHARD_COUNT, shard_ids=SHARD_IDS,
+            status=discord.Status.online,
+            activity=discord.Game(name="/help untuk bantuan"))
+
+# Registry klaim lintas shard: satu game roulette per player di semua proses
+game_registry = IPCRegistry(IPC_SOCKET) if IPC_SOCKET else LocalRegistry()
+
+
+def is_primary_process():
+    """Proses yang memegang shard 0 (atau satu-satunya proses) menjalankan job global"""
+    return SHARD_IDS is None or 0 in SHARD_IDS
+
+
+def owns_guild(guild_id):
+    """True kalau guild ditangani oleh shard di proses ini"""
+    if SHARD_COUNT is None or SHARD_IDS is None:
+        return True
+    return (guild_id >> 22) % SHARD_COUNT in SHARD_IDS
+
+
+profiler = tracing.Profiler()
+scheduler = Scheduler()
+# Nama barang per user untuk autocomplete /sell dan /give
+item_names = ItemNameCache(ttl=ITEM_CACHE_TTL)
+# Blackjack: satu shoe untuk semua meja di proses ini, satu tangan aktif per user
+blackjack_rules = blackjack.Rules(decks=BLACKJACK_DECKS, dealer_hits_soft17=BLACKJACK_H17)
+blackjack_shoe = blackjack.Shoe(blackjack_rules.decks, blackjack_rules.penetration)
+blackjack_hands = blackjack.SessionStore(BLACKJACK_MAX_HANDS, BLACKJACK_IDLE_TIMEOUT, clock=time.time)
+# Roulette PvP: antrean matchmaking per guild dan duel aktif (per game_id dan per pemain)
+pvp_queues = {}
+duels = pvp.DuelRegistry()
+# Turnamen roulette aktif per guild (satu per guild)
+tournaments = {}
+
+# Cache role Muted per guild (guild_id -> role_id) dan job provisioning yang berjalan
+mute_roles = {}
+mute_jobs = {}
+
+
+# Metrics untuk endpoint /metrics (format Prometheus)
+registry = metrics.Registry()
+COMMAND_INVOCATIONS = registry.counter(
+    "alphad_command_invocations_total", "Jumlah pemanggilan command",
+    ("command", "type", "status"))
+COMMAND_LATENCY = registry.histogram(
+    "alphad_command_duration_seconds", "Durasi eksekusi command",
+    ("command", "type"))
+DB_QUERIES = registry.counter(
+    "alphad_db_queries_total", "Jumlah pemanggilan helper database", ("helper",))
+DB_LATENCY = registry.histogram(
+    "alphad_db_query_duration_seconds", "Durasi helper database", ("helper",))
+ACTIVE_GAMES = registry.gauge(
+    "alphad_active_games", "Jumlah game roulette aktif",
+    func=lambda: len(active_games))
+ACTIVE_BLACKJACK = registry.gauge(
+    "alphad_active_blackjack_hands", "Jumlah tangan blackjack yang belum selesai",
+    func=lambda: len(blackjack_hands))
+ACTIVE_DUELS = registry.gauge(
+    "alphad_active_duels", "Jumlah duel roulette PvP aktif",
+    func=lambda: len(duels))
+PVP_QUEUED = registry.gauge(
+    "alphad_pvp_queued_players", "Jumlah user di antrean roulette PvP",
+    func=lambda: sum(len(queue) for queue in pvp_queues.values()))
+ACTIVE_TOURNAMENTS = registry.gauge(
+    "alphad_active_tournaments", "Jumlah turnamen roulette yang mendaftar atau berjalan",
+    func=lambda: len(tournaments))
+GATEWAY_LATENCY = registry.gauge(
+    "alphad_gateway_latency_seconds", "Latency heartbeat gateway Discord",
+    func=lambda: bot.latency)
+EVENT_LOOP_LAG = registry.gauge(
+    "alphad_event_loop_lag_seconds", "Keterlambatan event loop terakhir")
+IN_FLIGHT_COMMANDS = registry.gauge(
+    "alphad_in_flight_commands", "Jumlah command yang sedang berjalan")
+IN_FLIGHT_COMMANDS.set(0)
+BACKUP_DURATION = registry.gauge(
+    "alphad_backup_duration_seconds", "Durasi backup terakhir (copy + kompresi)")
+BACKUP_WORST_STEP = registry.gauge(
+    "alphad_backup_worst_step_seconds", "Step backup API terlama di backup terakhir")
+BACKUP_BYTES = registry.gauge(
+    "alphad_backup_bytes", "Ukuran snapshot terakhir (terkompresi)")
+BACKUP_LAST_SUCCESS = registry.gauge(
+    "alphad_backup_last_success_timestamp_seconds", "Waktu backup terakhir yang berhasil")
+BACKUP_FAILURES = registry.counter(
+    "alphad_backup_failures_total", "Jumlah backup yang gagal")
+MAINTENANCE_DURATION = registry.gauge(
+    "alphad_maintenance_duration_seconds", "Durasi maintenance terakhir")
+MAINTENANCE_ROWS = registry.counter(
+    "alphad_maintenance_rows_total", "Baris yang dihapus/diarsipkan maintenance", ("job",))
+DB_PAGES = registry.gauge(
+    "alphad_db_pages", "Jumlah halaman userdata.db setelah maintenance terakhir")
+DB_FREE_PAGES = registry.gauge(
+    "alphad_db_free_pages", "Halaman kosong (freelist) setelah maintenance terakhir")
+
+health = HealthMonitor(lambda: storage.ping(),
+                       max_loop_lag=HEALTH_MAX_LOOP_LAG,
+                       max_db_latency=HEALTH_MAX_DB_LATENCY,
+                       max_gateway_latency=HEALTH_MAX_GATEWAY_LATENCY)
+
+
+def record_loop_lag(lag):
+    EVENT_LOOP_LAG.set(lag)
+    health.record_loop_lag(lag)
+
+
+# Side effect (log, pengumuman, nanti stats/achievement) lewat event bus,
+# bukan di jalur await command
+bus = events.EventBus(registry)
+
+
+async def log_events(batch):
+    for event in batch:
+        log.info("event %s", event)
+
+
+def describe_announcement(event):
+    """Teks pengumuman untuk event yang layak diumumkan, atau None"""
+    if isinstance(event, events.ItemFound) and event.category in ("legendary", "mythical"):
+        return f"🌟 <@{event.user_id}> menemukan **{event.item_name}** ({event.category}, {event.value} uang)!"
+    if isinstance(event, events.BetSettled) and event.payout >= BIG_WIN_THRESHOLD:
+        return f"🏆 <@{event.user_id}> menang **{event.payout}** uang di {event.game}!"
+    if isinstance(event, events.VipGranted):
+        return f"💎 <@{event.user_id}> sekarang VIP!"
+    return None
+
+
+async def announce_events(batch):
+    channel = bot.get_channel(ANNOUNCE_CHANNEL_ID)
+    if channel is None:
+        return
+    # Satu pesan per batch, dipecah supaya tidak lewat batas 2000 karakter
+    messages = [""]
+    for line in filter(None, map(describe_announcement, batch)):
+        if len(messages[-1]) + len(line) + 1 > 1900:
+            messages.append("")
+        messages[-1] += line + "\n"
+    for message in filter(None, messages):
+        await channel.send(message, allowed_mentions=discord.AllowedMentions.none())
+
+
+bus.subscribe("log", (events.ItemFound, events.ItemSold, events.BetSettled,
+                      events.Transfer, events.VipGranted), log_events)
+# Queue stats lebih besar: event yang dibuang berarti statistik hilang
+user_stats = StatsRecorder(lambda rows: add_user_stats(rows),
+                           lambda user_id: get_user_stats(user_id),
+                           interval=STATS_FLUSH_INTERVAL)
+bus.subscribe("stats", STAT_EVENTS, user_stats.record,
+              batch_size=500, max_wait=0.5, maxsize=10000)
+if ANNOUNCE_CHANNEL_ID:
+    bus.subscribe("announce", (events.ItemFound, events.BetSettled, events.VipGranted),
+                  announce_events, max_wait=5.0)
+
+
+def instrumented(func):
+    """Catat jumlah dan durasi pemanggilan helper database"""
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            DB_QUERIES.inc(name)
+            DB_LATENCY.observe(elapsed, name)
+            trace = tracing.current_trace.get()
+            if trace is not None:
+                trace.add(f"db.{name}", elapsed)
+    return wrapper
+
+
+def report_trace(trace):
+    if trace is not None and trace.elapsed() >= SLOW_COMMAND_THRESHOLD:
+        log.warning("Slow command %s", trace.format())
+
+
+def finish_slash_command(interaction, status):
+    if interaction.extras.pop('in_flight', False):
+        IN_FLIGHT_COMMANDS.dec()
+    report_trace(interaction.extras.pop('trace', None))
+    started = interaction.extras.get('started')
+    command = interaction.command
+    if started is None or command is None:
+        return
+    name = command.qualified_name
+    COMMAND_INVOCATIONS.inc(name, "slash", status)
+    COMMAND_LATENCY.observe(time.perf_counter() - started, name, "slash")
+
+
+@bot.before_invoke
+async def before_any_command(ctx):
+    ctx.started = time.perf_counter()
+    ctx.trace = tracing.start_trace(f"!{ctx.command.qualified_name}")
+    IN_FLIGHT_COMMANDS.inc()
+
+
+@bot.after_invoke
+async def after_any_command(ctx):
+    started = getattr(ctx, 'started', None)
+    if started is None:
+        return
+    IN_FLIGHT_COMMANDS.dec()
+    tracing.end_trace()
+    report_trace(getattr(ctx, 'trace', None))
+    name = ctx.command.qualified_name
+    status = "error" if ctx.command_failed else "ok"
+    COMMAND_INVOCATIONS.inc(name, "prefix", status)
+    COMMAND_LATENCY.observe(time.perf_counter() - started, name, "prefix")
+
+
+@bot.event
+async def on_app_command_completion(interaction, command):
+    finish_slash_command(interaction, "ok")
+
+
+# Web server keep-alive (health + metrics), dijalankan dari setup_hook
+web = WebServer(WEB_HOST, WEB_PORT)
+
+
+@web.route('/')
+def home():
+    return "Bot is alive!"
+
+
+@web.route('/metrics')
+def metrics_endpoint():
+    return 200, registry.render(), metrics.CONTENT_TYPE
+
+
+@web.route('/healthz')
+def healthz():
+    healthy, report = health.check(
+        gateway_ready=bot.is_ready() and not bot.is_closed(),
+        gateway_latency=bot.latency,
+        in_flight=IN_FLIGHT_COMMANDS.get())
+    return 200 if healthy else 503, json.dumps(report), "application/json"
+
+
+storage = make_storage(STORAGE_BACKEND, DB_PATH, busy_timeout=DB_BUSY_TIMEOUT, pool_size=DB_POOL_SIZE)
+# File ekonomi per server/bucket; None = ekonomi ada di storage utama
+economies = None
+if ECONOMY_MODE == 'guild' and STORAGE_BACKEND == 'sqlite' and ECONOMY_FILES != 'shared':
+    economies = PartitionedStorage(ECONOMY_DIR, None if ECONOMY_FILES == 'guild' else int(ECONOMY_FILES),
+                                   busy_timeout=DB_BUSY_TIMEOUT, pool_size=DB_POOL_SIZE)
+# Guild command/interaksi yang sedang dilayani; job latar belakang masuk lewat in_guild()
+current_guild = contextvars.ContextVar('current_guild', default=0)
+
+
+def set_storage(new_storage):
+    """Ganti backend storage (mis. MemoryStorage untuk load test)"""
+    global storage
+    storage = new_storage
+    item_names.clear()
+
+
+@contextlib.contextmanager
+def in_guild(guild_id):
+    """Jalankan helper ekonomi untuk `guild_id` (scheduler, shutdown, dsb.)"""
+    token = current_guild.set(guild_id or 0)
+    try:
+        yield
+    finally:
+        current_guild.reset(token)
+
+
+async def economy():
+    """Storage ekonomi guild yang sedang dilayani (ECONOMY_MODE=guild), atau storage utama"""
+    if ECONOMY_MODE != 'guild':
+        return storage
+    if economies is not None:
+        return await economies.for_guild(current_guild.get())
+    return storage.scoped(current_guild.get())
+
+
+def item_key(user_id):
+    """Key cache nama barang: user, atau (guild, user) kalau ekonomi per guild"""
+    return (current_guild.get(), user_id) if ECONOMY_MODE == 'guild' else user_id
+
+
+# Helper database: semua command lewat sini, SQL-nya ada di storage.py
+@instrumented
+async def init_db():
+    await storage.init()
+    if economies is not None:
+        await economies.partitions()  # migrasi file yang sudah ada sekarang, bukan saat request pertama
+
+
+@instrumented
+async def get_meta(key):
+    return await storage.meta.get(key)
+
+
+@instrumented
+async def set_meta(key, value):
+    await storage.meta.set(key, value)
+
+
+@instrumented
+async def add_timed_mute(guild_id, user_id, unmute_at):
+    await storage.mutes.add(guild_id, user_id, unmute_at)
+
+
+@instrumented
+async def remove_timed_mute(guild_id, user_id):
+    await storage.mutes.remove(guild_id, user_id)
+
+
+@instrumented
+async def add_user_stats(rows):
+    await storage.stats.add_many(rows)
+
+
+@instrumented
+async def get_user_stats(user_id):
+    return await storage.stats.get(user_id)
+
+
+@instrumented
+async def get_timed_mutes():
+    return await storage.mutes.list()
+
+
+@instrumented
+async def save_tournament(tour, settled=False):
+    # Turnamen selesai/batal tetap aktif sampai hadiah/refund tercatat, supaya dilanjutkan setelah crash
+    await storage.tournaments.save(tour.tournament_id, tour.guild_id, tour.to_dict(),
+                                   tour.status in ('signup', 'running') or not settled)
+
+
+@instrumented
+async def get_active_tournaments():
+    return await storage.tournaments.list_active()
+
+
+@instrumented
+async def get_user(user_id):
+    store = await economy()
+    return await store.users.get(user_id)
+
+
+@instrumented
+async def get_user_profile(user_id):
+    """(balance, vip, item_count) dalam satu lookup, untuk cek kapasitas inventori"""
+    store = await economy()
+    return await store.users.get_profile(user_id)
+
+
+@instrumented
+async def update_user(user_id, balance=None, vip=None):
+    store = await economy()
+    await store.users.update(user_id, balance=balance, vip=vip)
+
+
+@instrumented
+async def adjust_balance(user_id, delta, allow_negative=True):
+    """Tambah/kurangi saldo secara atomik; None kalau saldo tidak cukup"""
+    store = await economy()
+    return await store.users.adjust_balance(user_id, delta, allow_negative)
+
+
+@instrumented
+async def transfer_balance(sender_id, receiver_id, amount):
+    """Pindahkan saldo dalam satu transaksi; None kalau saldo pengirim tidak cukup"""
+    store = await economy()
+    return await store.users.transfer(sender_id, receiver_id, amount)
+
+
+@instrumented
+async def adjust_balances(deltas, allow_negative=False, once=None):
+    """Beberapa perubahan saldo dalam satu transaksi; None (tanpa perubahan) kalau ada yang gagal
+
+    `once`: key unik, transaksi dengan key yang sama hanya diterapkan sekali
+    """
+    store = await economy()
+    return await store.users.adjust_many(deltas, allow_negative, once)
+
+
+@instrumented
+async def get_users(user_ids):
+    """{user_id: (balance, vip, item_count)} untuk user yang sudah terdaftar (preview operasi massal)"""
+    store = await economy()
+    return await store.users.get_many(user_ids)
+
+
+@instrumented
+async def bulk_update_users(deltas, vip=None, progress=None):
+    """Ubah saldo/VIP banyak user dalam satu transaksi; saldo tidak turun di bawah 0"""
+    store = await economy()
+    return await store.users.upsert_many(deltas, vip, progress)
+
+
+# Inventory management functions
+@instrumented
+async def add_to_inventory(user_id, item_name, item_category, item_value, quantity=1):
+    """Add item to user's inventory"""
+    store = await economy()
+    await store.inventory.add(user_id, item_name, item_category, item_value, quantity)
+    item_names.added(item_key(user_id), item_name, quantity)
+
+
+@instrumented
+async def get_inventory(user_id):
+    """Get user's inventory"""
+    store = await economy()
+    inventory = await store.inventory.list(user_id)
+    item_names.put(item_key(user_id), inventory)
+    return inventory
+
+
+@instrumented
+async def get_inventory_count(user_id):
+    """Get total item count in inventory (kolom users.item_count, dijaga trigger)"""
+    store = await economy()
+    return await store.inventory.count(user_id)
+
+
+@instrumented
+async def check_inventory_counts(fix=False):
+    """Bandingkan users.item_count dengan isi inventori; list (user_id, item_count, actual)"""
+    store = await economy()
+    return await store.inventory.check_counts(fix)
+
+
+@instrumented
+async def remove_from_inventory(user_id, item_name, quantity=1):
+    """Remove item from inventory"""
+    store = await economy()
+    success = await store.inventory.remove(user_id, item_name, quantity)
+    if success:
+        item_names.removed(item_key(user_id), item_name, quantity)
+    return success
+
+
+@instrumented
+async def clear_inventory(user_id):
+    """Remove all items from user's inventory, return the removed rows"""
+    store = await economy()
+    removed = await store.inventory.clear(user_id)
+    item_names.cleared(item_key(user_id))
+    return removed
+
+
+@instrumented
+async def bulk_add_to_inventory(quantities, item_name, item_category, item_value, progress=None):
+    """Beri barang yang sama ke [(user_id, quantity), ...] dalam satu transaksi"""
+    store = await economy()
+    count = await store.inventory.add_many(quantities, item_name, item_category, item_value, progress)
+    for user_id, quantity in quantities:
+        item_names.added(item_key(user_id), item_name, quantity)
+    return count
+
+
+# Daily usage tracking functions
+@instrumented
+async def get_daily_usage(user_id):
+    """Get user's daily usage count for !cari"""
+    store = await economy()
+    return await store.usage.get(user_id)
+
+
+@instrumented
+async def increment_daily_usage(user_id):
+    """Increment user's daily !cari usage count"""
+    store = await economy()
+    await store.usage.increment(user_id)
+
+
+def command_tree_hash():
+    """Hash stabil dari payload slash command global (nama, parameter, deskripsi)"""
+    payload = sorted((cmd.to_dict(bot.tree) for cmd in bot.tree.get_commands()),
+                     key=lambda c: (c.get('type', 1), c['name']))
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+async def sync_commands(force=False):
+    """Sync slash commands hanya kalau hash-nya berubah; kembalikan True kalau sync dilakukan"""
+    current = command_tree_hash()
+    # Per application id, supaya ganti token bot tetap memicu sync
+    meta_key = f'command_tree_hash:{bot.application_id}'
+    if not force and await get_meta(meta_key) == current:
+        log.info("Slash commands tidak berubah, skip sync")
+        return False
+    await bot.tree.sync()
+    await set_meta(meta_key, current)
+    log.info("Slash commands di-sync (hash %s)", current[:12])
+    return True
+
+
+@bot.event
+async def on_ready():
+    # on_ready terpanggil lagi setiap reconnect, jadi jangan taruh kerja startup di sini
+    print(f'Bot sudah online sebagai {bot.user}')
+
+
+# Event on_member_join memerlukan members intent yang privileged
+# Dinonaktifkan untuk sementara
+# @bot.event
+# async def on_member_join(member):
+#     channel = member.guild.system_channel
+#     if channel:
+#         await channel.send(f"Selamat datang di server, {member.mention}!")
+
+
+@bot.command()
+@commands.has_permissions(kick_members=True)
+async def kick(ctx, member: discord.Member, *, reason=None):
+    """Kick user dari server - !kick @user [alasan]"""
+    try:
+        await member.kick(reason=reason)
+        await ctx.send(f"{member} telah di-kick. Alasan: {reason}")
+    except Exception as e:
+        await ctx.send(f"Gagal kick: {e}")
+
+
+@bot.command()
+@commands.has_permissions(ban_members=True)
+async def ban(ctx, member: discord.Member, *, reason=None):
+    """Ban user dari server - !ban @user [alasan]"""
+    try:
+        await member.ban(reason=reason)
+        await ctx.send(f"{member} telah di-ban. Alasan: {reason}")
+    except Exception as e:
+        await ctx.send(f"Gagal ban: {e}")
+
+
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_duration(text):
+    """Ubah '30s', '10m', '2h', '1d' jadi detik; None kalau bukan durasi"""
+    if not text or len(text) < 2 or text[-1].lower() not in DURATION_UNITS or not text[:-1].isdigit():
+        return None
+    return int(text[:-1]) * DURATION_UNITS[text[-1].lower()]
+
+
+def find_mute_role(guild):
+    """Ambil role Muted dari cache; lookup by name hanya saat cache miss"""
+    role_id = mute_roles.get(guild.id)
+    role = guild.get_role(role_id) if role_id else None
+    if role is None:
+        role = discord.utils.get(guild.roles, name=MUTE_ROLE_NAME)
+        if role is not None:
+            mute_roles[guild.id] = role.id
+    return role
+
+
+async def get_mute_role(guild, channel):
+    """Ambil atau buat role Muted; overwrite channel disiapkan di background"""
+    role = find_mute_role(guild)
+    first_lookup = guild.id not in mute_jobs
+    if role is None:
+        role = await guild.create_role(name=MUTE_ROLE_NAME)
+        mute_roles[guild.id] = role.id
+        first_lookup = True
+    if first_lookup:
+        # Sekali per proses: lengkapi channel yang belum punya overwrite
+        mute_jobs[guild.id] = asyncio.create_task(provision_mute_role(guild, role, channel))
+    return role
+
+
+async def provision_mute_role(guild, role, channel):
+    """Pasang overwrite Muted ke semua channel dengan concurrency terbatas + progress"""
+    pending = [c for c in guild.channels if c.overwrites_for(role) != MUTE_OVERWRITE]
+    if not pending:
+        return
+    total = len(pending)
+    done = 0
+    failed = 0
+    semaphore = asyncio.Semaphore(MUTE_PROVISION_CONCURRENCY)
+    progress = await channel.send(f"🔧 **Menyiapkan role {MUTE_ROLE_NAME}...** 0/{total} channel")
+    last_edit = time.monotonic()
+
+    async def apply(target):
+        nonlocal done, failed, last_edit
+        async with semaphore:
+            try:
+                await target.set_permissions(role, overwrite=MUTE_OVERWRITE, reason="Setup role Muted")
+            except discord.HTTPException:
+                failed += 1
+        done += 1
+        # Edit progress maksimal tiap 2 detik supaya tidak kena rate limit
+        if time.monotonic() - last_edit >= 2:
+            last_edit = time.monotonic()
+            await edit_progress(f"🔧 **Menyiapkan role {MUTE_ROLE_NAME}...** {done}/{total} channel")
+
+    async def edit_progress(content):
+        try:
+            await progress.edit(content=content)
+        except discord.HTTPException:
+            pass  # pesan progress dihapus; job tetap jalan
+
+    await asyncio.gather(*(apply(c) for c in pending))
+    failed_text = f" ({failed} gagal)" if failed else ""
+    await edit_progress(f"✅ **Role {MUTE_ROLE_NAME} siap!** {total - failed}/{total} channel{failed_text}")
+
+
+def schedule_unmute(guild_id, user_id, unmute_at):
+    async def job():
+        await expire_mute(guild_id, user_id)
+    scheduler.schedule(('unmute', guild_id, user_id), unmute_at, job)
+
+
+async def expire_mute(guild_id, user_id):
+    """Lepas role Muted setelah durasi habis (tanpa butuh member cache)"""
+    # Mute yang jatuh tempo saat startup harus menunggu cache guild terisi
+    await bot.wait_until_ready()
+    guild = bot.get_guild(guild_id)
+    role = find_mute_role(guild) if guild else None
+    try:
+        if role is not None:
+            await bot.http.remove_role(guild_id, user_id, role.id, reason="Durasi mute habis")
+    except discord.NotFound:
+        pass  # member sudah keluar
+    finally:
+        await remove_timed_mute(guild_id, user_id)
+
+
+@bot.event
+async def on_guild_channel_create(channel):
+    # Channel baru langsung dapat overwrite kalau guild sudah punya role Muted
+    role = find_mute_role(channel.guild)
+    if role is not None:
+        try:
+            await channel.set_permissions(role, overwrite=MUTE_OVERWRITE, reason="Setup role Muted")
+        except discord.HTTPException:
+            log.warning("Gagal set overwrite Muted di channel %s", channel.id)
+
+
+@bot.event
+async def on_guild_role_delete(role):
+    if mute_roles.get(role.guild.id) == role.id:
+        del mute_roles[role.guild.id]
+        mute_jobs.pop(role.guild.id, None)
+
+
+@bot.command()
+@commands.has_permissions(manage_roles=True)
+async def mute(ctx, member: discord.Member, *, reason=None):
+    """Mute user, opsional dengan durasi - !mute @user [10m|2h|1d] [alasan]"""
+    duration = None
+    if reason:
+        first, _, rest = reason.partition(' ')
+        duration = parse_duration(first)
+        if duration is not None:
+            reason = rest or None
+
+    guild = ctx.guild
+    mute_role = await get_mute_role(guild, ctx.channel)
+    try:
+        await member.add_roles(mute_role, reason=reason)
+    except Exception as e:
+        await ctx.send(f"Gagal mute: {e}")
+        return
+
+    if duration is None:
+        await ctx.send(f"{member} telah di-mute. Alasan: {reason}")
+        return
+
+    unmute_at = time.time() + duration
+    await add_timed_mute(guild.id, member.id, unmute_at)
+    schedule_unmute(guild.id, member.id, unmute_at)
+    await ctx.send(f"{member} telah di-mute sampai <t:{int(unmute_at)}:R>. Alasan: {reason}")
+
+
+@bot.command()
+@commands.has_permissions(manage_roles=True)
+async def unmute(ctx, member: discord.Member):
+    """Lepas mute user (juga membatalkan timed mute) - !unmute @user"""
+    mute_role = find_mute_role(ctx.guild)
+    scheduler.cancel(('unmute', ctx.guild.id, member.id))
+    await remove_timed_mute(ctx.guild.id, member.id)
+    if mute_role is None or mute_role not in member.roles:
+        await ctx.send(f"{member} tidak sedang di-mute.")
+        return
+    try:
+        await member.remove_roles(mute_role)
+        await ctx.send(f"{member} telah di-unmute.")
+    except Exception as e:
+        await ctx.send(f"Gagal unmute: {e}")
+
+
+@bot.command()
+async def vip(ctx, member: discord.Member = None):
+    """Berikan status VIP (owner only) - !vip @user"""
+    if member is None:
+        await ctx.send(
+            "❌ **Error:** Tag user yang mau dikasih VIP!\n📝 **Contoh:** `!vip @username`"
+        )
+        return
+
+    if ctx.author.id != OWNER_ID:
+        await ctx.send(
+            "🔒 **Akses ditolak!** Hanya owner bot yang bisa menambahkan VIP.")
+        return
+    await get_user(member.id)  # pastikan row user ada
+    await update_user(member.id, vip=True)
+    bus.publish(events.VipGranted(member.id, ctx.author.id))
+    await ctx.send(
+        f"💎 **VIP GRANTED!** {member.mention} sekarang adalah VIP!\n🎉 **Selamat!** Kamu bisa akses semua fitur premium!"
+    )
+
+
+@bot.command()
+async def cekitem(ctx, mode: str = None):
+    """Cek konsistensi users.item_count dengan inventori (owner only) - !cekitem [fix]"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa cek konsistensi.")
+        return
+    fix = mode == "fix"
+    mismatches = await check_inventory_counts(fix=fix)
+    if not mismatches:
+        await ctx.send("✅ **item_count konsisten!** Semua user cocok dengan inventori.")
+        return
+    lines = [f"• `{user_id}`: tercatat {stored}, sebenarnya {actual}"
+             for user_id, stored, actual in mismatches[:15]]
+    if len(mismatches) > 15:
+        lines.append(f"... (+{len(mismatches) - 15} lainnya)")
+    status = "🔧 **Sudah diperbaiki!**" if fix else "💡 Gunakan `!cekitem fix` untuk memperbaiki."
+    await ctx.send(f"⚠️ **{len(mismatches)} user tidak konsisten:**\n" + "\n".join(lines) + f"\n\n{status}")
+
+
+@bot.command(name='sync')
+async def sync_(ctx):
+    """Paksa sync slash commands ke Discord (owner only) - !sync"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa sync command.")
+        return
+    await sync_commands(force=True)
+    await ctx.send(f"✅ **Slash commands di-sync!** ({len(bot.tree.get_commands())} command)")
+
+
+@bot.command()
+async def ping(ctx):
+    """Test bot responsif"""
+    latency = round(bot.latency * 1000)
+    await ctx.send(f"🏓 Pong! Latency: {latency}ms\nBot online dan berfungsi!")
+
+
+async def database_stores():
+    """[(prefix backup, SQLiteStorage)]: userdata.db lalu file ekonomi per guild/bucket (kalau ada)"""
+    stores = [('userdata', storage)]
+    if economies is not None:
+        for store in await economies.partitions():
+            stores.append((os.path.splitext(os.path.basename(store.path))[0], store))
+    return stores
+
+
+async def database_files():
+    """[(prefix backup, path)] untuk semua file database"""
+    return [(prefix, store.path) for prefix, store in await database_stores()]
+
+
+async def run_backup():
+    """Snapshot userdata.db (dan file ekonomi) sekarang; None kalau backend bukan SQLite"""
+    if getattr(storage, 'path', None) is None:
+        return None
+    results = []
+    try:
+        for prefix, db_path in await database_files():
+            results.append(await backup.backup(db_path, BACKUP_DIR, prefix=prefix, pages=BACKUP_PAGES,
+                                               keep=BACKUP_KEEP, busy_timeout=DB_BUSY_TIMEOUT))
+    except Exception:
+        BACKUP_FAILURES.inc()
+        raise
+    result = dict(results[0], files=len(results))
+    for key in ('seconds', 'bytes', 'raw_bytes'):
+        result[key] = sum(item[key] for item in results)
+    result['worst_step_seconds'] = max(item['worst_step_seconds'] for item in results)
+    BACKUP_DURATION.set(result['seconds'])
+    BACKUP_WORST_STEP.set(result['worst_step_seconds'])
+    BACKUP_BYTES.set(result['bytes'])
+    BACKUP_LAST_SUCCESS.set(time.time())
+    log.info("Backup %s (%d file): %.2fs, worst step %.4fs", result['path'], result['files'],
+             result['seconds'], result['worst_step_seconds'])
+    return result
+
+
+def schedule_backup():
+    async def job():
+        try:
+            await run_backup()
+        finally:
+            schedule_backup()
+    scheduler.schedule('backup', time.time() + BACKUP_INTERVAL, job)
+
+
+async def run_maintenance():
+    """Retensi + compaction sekarang; None kalau backend bukan SQLite"""
+    if getattr(storage, 'path', None) is None:
+        return None
+    # Semua file berbagi satu anggaran waktu; sisa pekerjaan lanjut di jadwal berikutnya
+    deadline = time.monotonic() + MAINTENANCE_BUDGET
+    result = None
+    for _, db_path in await database_files():
+        report = await maintenance.maintain(db_path, budget=max(0.0, deadline - time.monotonic()),
+                                            archive_days=ARCHIVE_AFTER_DAYS,
+                                            busy_timeout=DB_BUSY_TIMEOUT)
+        if result is None:
+            result = report
+            continue
+        for key in ('usage_pruned', 'users_archived', 'pages_freed', 'pages', 'free_pages', 'seconds'):
+            result[key] += report[key]
+        result['complete'] = result['complete'] and report['complete']
+    MAINTENANCE_DURATION.set(result['seconds'])
+    MAINTENANCE_ROWS.inc("usage_pruned", amount=result['usage_pruned'])
+    MAINTENANCE_ROWS.inc("users_archived", amount=result['users_archived'])
+    DB_PAGES.set(result['pages'])
+    DB_FREE_PAGES.set(result['free_pages'])
+    log.info("Maintenance: %d usage rows pruned, %d users archived, %d pages freed in %.2fs%s",
+             result['usage_pruned'], result['users_archived'], result['pages_freed'],
+             result['seconds'], "" if result['complete'] else " (budget habis)")
+    return result
+
+
+def schedule_maintenance():
+    async def job():
+        try:
+            await run_maintenance()
+        finally:
+            schedule_maintenance()
+    scheduler.schedule('maintenance', maintenance.next_run(time.time(), MAINTENANCE_HOUR), job)
+
+
+@bot.command(name='maintenance')
+async def maintenance_(ctx, mode: str = None):
+    """Jalankan maintenance database sekarang (owner only) - !maintenance now"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa menjalankan maintenance.")
+        return
+    if getattr(storage, 'path', None) is None:
+        await ctx.send("❌ **Maintenance hanya tersedia untuk storage SQLite!**")
+        return
+    if mode != "now":
+        await ctx.send("📝 **Contoh:** `!maintenance now`")
+        return
+
+    await ctx.send("🧹 **Maintenance dimulai...**")
+    result = await run_maintenance()
+    vacuum = (f"{result['pages_freed']} halaman dikembalikan" if result['vacuum']
+              else "nonaktif (database lama, butuh VACUUM sekali)")
+    await ctx.send(
+        f"✅ **Maintenance selesai!**{'' if result['complete'] else ' (anggaran waktu habis, dilanjutkan besok)'}\n"
+        f"🗑️ **daily_usage dihapus:** {result['usage_pruned']}\n"
+        f"📦 **User diarsipkan:** {result['users_archived']}\n"
+        f"💽 **Vacuum:** {vacuum} • {result['pages']} halaman ({result['free_pages']} kosong)\n"
+        f"⏱️ **Durasi:** {result['seconds']:.2f}s"
+    )
+
+
+def backup_path(name):
+    # basename: cegah path di luar BACKUP_DIR
+    return os.path.join(BACKUP_DIR, os.path.basename(name))
+
+
+@bot.command(name='backup')
+async def backup_(ctx, mode: str = None, name: str = None, confirm: str = None):
+    """Backup database (owner only) - !backup now|list|verify <file>|restore <file> confirm"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa backup.")
+        return
+    if getattr(storage, 'path', None) is None:
+        await ctx.send("❌ **Backup hanya tersedia untuk storage SQLite!**")
+        return
+
+    if mode == "now":
+        await ctx.send("💾 **Backup dimulai...**")
+        result = await run_backup()
+        extra = f" + {result['files'] - 1} file ekonomi" if result['files'] > 1 else ""
+        await ctx.send(
+            f"✅ **Backup selesai!** `{os.path.basename(result['path'])}`{extra}\n"
+            f"📦 **Ukuran:** {result['bytes'] // 1024} KB (raw {result['raw_bytes'] // 1024} KB)\n"
+            f"⏱️ **Durasi:** {result['seconds']:.2f}s • step terlama {result['worst_step_seconds'] * 1000:.1f}ms"
+        )
+    elif mode == "list":
+        paths = [path for prefix, _ in await database_files() for path in backup.list_backups(BACKUP_DIR, prefix)]
+        if not paths:
+            await ctx.send("📦 **Belum ada backup!** Gunakan `!backup now`")
+            return
+        lines = [f"• `{os.path.basename(path)}` ({os.path.getsize(path) // 1024} KB)" for path in paths]
+        await ctx.send("💾 **Daftar backup:**\n" + "\n".join(lines))
+    elif mode == "verify" and name:
+        path = backup_path(name)
+        if not os.path.exists(path):
+            await ctx.send(f"❌ **Backup tidak ditemukan:** `{name}`")
+            return
+        report = await backup.verify(path)
+        rows = ", ".join(f"{table}: {count}" for table, count in report['rows'].items())
+        status = "✅ **Backup valid!**" if report['ok'] else f"❌ **Backup rusak!** `{report['integrity']}`"
+        await ctx.send(f"{status}\n📊 **Isi:** {rows}")
+    elif mode == "restore" and name:
+        path = backup_path(name)
+        if not os.path.exists(path):
+            await ctx.send(f"❌ **Backup tidak ditemukan:** `{name}`")
+            return
+        # Backup file ekonomi (guild-<id>/bucket-<n>) hanya kembali ke filenya sendiri; prefix yang
+        # tidak dikenal (file dari host lain, partisi yang tidak ada) ditolak, bukan ditimpakan ke userdata.db
+        prefix = os.path.basename(path).rsplit('-', 2)[0]
+        store = dict(await database_stores()).get(prefix)
+        if store is None:
+            await ctx.send(f"❌ **Restore dibatalkan:** `{prefix}` bukan file database di host ini.")
+            return
+        if confirm != "confirm":
+            await ctx.send(
+                f"⚠️ **Restore akan menimpa SELURUH database `{prefix}` dengan `{name}`!**\n"
+                f"📝 **Lanjutkan:** `!backup restore {name} confirm`")
+            return
+        try:
+            # Koneksi pool lama tidak boleh memakai file yang sedang ditimpa; dibuka ulang setelahnya
+            async with store.exclusive():
+                report = await backup.restore(path, store.path, pages=BACKUP_PAGES,
+                                              busy_timeout=DB_BUSY_TIMEOUT)
+        except ValueError as e:
+            await ctx.send(f"❌ **Restore dibatalkan:** {e}")
+            return
+        item_names.clear()
+        await ctx.send(f"✅ **Database di-restore dari** `{name}` ({report['steps']} step)")
+    else:
+        await ctx.send("📝 **Contoh:** `!backup now`, `!backup list`, `!backup verify <file>`, `!backup restore <file> confirm`")
+
+
+async def edit_progress(message, task, render):
+    """Tunggu `task` sambil mengedit `message` dengan render() tiap PROGRESS_INTERVAL detik"""
+    while not task.done():
+        await asyncio.wait({task}, timeout=PROGRESS_INTERVAL)
+        if not task.done():
+            try:
+                await message.edit(content=render())
+            except discord.HTTPException:
+                pass
+    return task.result()
+
+
+def summarize_dump(reports):
+    """Jumlah baris per tabel dari beberapa report dump (satu per file database)"""
+    totals = {}
+    for report in reports:
+        for table, rows in report['tables'].items():
+            totals[table] = totals.get(table, 0) + rows
+    return ", ".join(f"{table}: {rows}" for table, rows in totals.items()) or "kosong"
+
+
+@bot.command(name='export')
+async def export_(ctx, fmt: str = 'jsonl'):
+    """Export data ekonomi ke JSONL/CSV gzip (owner only) - !export [jsonl|csv]"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa export data.")
+        return
+    if getattr(storage, 'path', None) is None:
+        await ctx.send("❌ **Export hanya tersedia untuk storage SQLite!**")
+        return
+    if fmt not in dump.FORMATS:
+        await ctx.send("📝 **Contoh:** `!export jsonl` atau `!export csv`")
+        return
+
+    name = time.strftime('export-%Y%m%d-%H%M%S')
+    progress = {}
+    message = await ctx.send("📤 **Export dimulai...**")
+
+    async def run():
+        # Satu folder per file database: userdata, lalu guild-<id>/bucket-<n> kalau ekonomi dipisah
+        reports = []
+        for prefix, db_path in await database_files():
+            reports.append(await dump.export(
+                db_path, os.path.join(EXPORT_DIR, name, prefix), fmt, busy_timeout=DB_BUSY_TIMEOUT,
+                progress=lambda table, rows, prefix=prefix: progress.update(file=prefix, table=table, rows=rows)))
+        return reports
+
+    reports = await edit_progress(message, asyncio.create_task(run()), lambda: (
+        f"📤 **Export berjalan...** `{progress.get('file')}` • {progress.get('table')}: {progress.get('rows', 0)} baris"))
+    await message.edit(content=(
+        f"✅ **Export selesai!** `{name}` ({len(reports)} file database)\n"
+        f"📊 **Baris:** {summarize_dump(reports)}\n"
+        f"📦 **Ukuran:** {sum(report['bytes'] for report in reports) // 1024} KB • "
+        f"⏱️ {sum(report['seconds'] for report in reports):.2f}s"))
+
+
+@bot.command(name='import')
+async def import_(ctx, name: str = None, confirm: str = None):
+    """Import hasil !export (owner only) - !import <nama> confirm"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa import data.")
+        return
+    if getattr(storage, 'path', None) is None:
+        await ctx.send("❌ **Import hanya tersedia untuk storage SQLite!**")
+        return
+    if not name:
+        await ctx.send("📝 **Contoh:** `!import export-20250101-120000 confirm`")
+        return
+    # basename: cegah path di luar EXPORT_DIR
+    path = os.path.join(EXPORT_DIR, os.path.basename(name))
+    if not os.path.isdir(path):
+        await ctx.send(f"❌ **Export tidak ditemukan:** `{name}`")
+        return
+    if confirm != "confirm":
+        await ctx.send(
+            f"⚠️ **Import akan menimpa user/barang yang sama dengan isi `{name}`!**\n"
+            f"📝 **Lanjutkan:** `!import {name} confirm`")
+        return
+
+    targets = dict(await database_files())
+    sources = sorted(os.listdir(path))
+    skipped = [prefix for prefix in sources if prefix not in targets]
+    progress = {}
+    message = await ctx.send("📥 **Import dimulai...**")
+
+    async def run():
+        reports = []
+        for prefix in sources:
+            if prefix in targets:
+                reports.append(await dump.import_(
+                    targets[prefix], os.path.join(path, prefix), busy_timeout=DB_BUSY_TIMEOUT,
+                    progress=lambda table, rows, prefix=prefix: progress.update(file=prefix, table=table, rows=rows)))
+        return reports
+
+    reports = await edit_progress(message, asyncio.create_task(run()), lambda: (
+        f"📥 **Import berjalan...** `{progress.get('file')}` • {progress.get('table')}: {progress.get('rows', 0)} baris"))
+    item_names.clear()
+    lines = [f"✅ **Import selesai!** `{name}`",
+             f"📊 **Baris:** {summarize_dump(reports)}",
+             f"⏱️ **Durasi:** {sum(report['seconds'] for report in reports):.2f}s"]
+    if skipped:
+        # Mis. file ekonomi guild-<id> yang belum ada di host ini: pakai `python dump.py import`
+        lines.append(f"⚠️ **Dilewati (database tidak ada):** {', '.join(skipped)}")
+    await message.edit(content="\n".join(lines))
+
+
+BULK_LABELS = {'vip': "Grant VIP", 'unvip': "Cabut VIP", 'kredit': "Kredit saldo",
+               'debit': "Debit saldo", 'item': "Bagi barang"}
+BULK_USAGE = (
+    "📝 **Contoh:**\n"
+    "• `!massal vip @Role` / `!massal unvip @user1 @user2`\n"
+    "• `!massal kredit @Role 500` / `!massal debit @user 100`\n"
+    "• `!massal item @Role <jumlah> <nilai> <nama barang>`\n"
+    "🎯 **Target:** mention role, mention user, dan/atau lampiran CSV `user_id[,jumlah]`\n"
+    "✅ Tambahkan `confirm` di akhir untuk menjalankan (tanpa itu hanya preview)")
+
+
+async def bulk_targets(ctx, default):
+    """({user_id: jumlah}, baris CSV dilewati) dari role/mention/lampiran CSV pesan command"""
+    targets, skipped = {}, 0
+    if ctx.message.role_mentions and MEMBERS_INTENT and not ctx.guild.chunked:
+        await ctx.guild.chunk()
+    members = [member for role in ctx.message.role_mentions for member in role.members]
+    for member in members + ctx.message.mentions:
+        if not member.bot and default is not None:
+            targets[member.id] = default
+    for attachment in ctx.message.attachments:
+        if attachment.filename.lower().endswith('.csv'):
+            rows, bad = bulk.parse_csv((await attachment.read()).decode('utf-8-sig', errors='replace'), default)
+            for user_id, amount in rows.items():
+                targets[user_id] = targets.get(user_id, 0) + amount
+            skipped += bad
+    return targets, skipped
+
+
+@bot.command(name='massal')
+async def massal(ctx, action: str = None, *, args: str = ''):
+    """Operasi massal ke role/mention/CSV (owner only) - !massal <vip|unvip|kredit|debit|item> <target> ... [confirm]"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa operasi massal.")
+        return
+    if action not in bulk.ACTIONS:
+        await ctx.send(BULK_USAGE)
+        return
+
+    # Mention dibaca dari ctx.message; sisanya angka (jumlah, nilai), nama barang dan "confirm"
+    words = [word for word in args.split() if not (word.startswith('<@') and word.endswith('>'))]
+    confirm = bool(words) and words[-1] == "confirm"
+    if confirm:
+        words.pop()
+    numbers = []
+    while words and words[0].isdigit() and len(numbers) < 2:
+        numbers.append(int(words.pop(0)))
+    item_name = " ".join(words)
+
+    if action in ('vip', 'unvip'):
+        default = 1  # jumlah tidak dipakai
+    elif action in ('kredit', 'debit'):
+        default = numbers[0] if numbers else None  # None: jumlah harus dari kolom CSV
+    elif len(numbers) < 2 or not item_name:
+        await ctx.send(BULK_USAGE)
+        return
+    else:
+        default, item_value = numbers
+
+    targets, skipped = await bulk_targets(ctx, default)
+    if not targets:
+        note = "" if MEMBERS_INTENT or not ctx.message.role_mentions else (
+            "\n💡 **Target role butuh** `MEMBERS_INTENT=1` (dan Server Members Intent di developer portal)")
+        await ctx.send(f"❌ **Tidak ada target!** Cek mention/CSV dan jumlahnya.{note}\n\n{BULK_USAGE}")
+        return
+
+    label = BULK_LABELS[action]
+    if action == 'item':
+        label = f"Bagi {item_name} ({item_value} uang)"
+    if not confirm:
+        summary = bulk.preview(action, targets, await get_users(list(targets)), DEFAULT_BALANCE)
+        lines = [f"🔍 **Preview {label}** (belum dijalankan)",
+                 f"🎯 **Target:** {summary['targets']} user ({summary['new']} belum terdaftar, dibuat otomatis)"]
+        if action in ('vip', 'unvip'):
+            lines.append(f"💎 **Status berubah:** {summary['changed']} user")
+        elif action == 'kredit':
+            lines.append(f"💰 **Total kredit:** {summary['total']} uang")
+        elif action == 'debit':
+            lines.append(f"💸 **Total debit:** {summary['total']} uang ({summary['emptied']} user saldonya jadi 0)")
+        else:
+            lines.append(f"📦 **Total barang:** {summary['total']} "
+                         f"({summary['over_capacity']} user melewati kapasitas inventori)")
+        if skipped:
+            lines.append(f"⚠️ **Baris CSV dilewati:** {skipped}")
+        lines.append("📝 **Lanjutkan:** kirim ulang command yang sama (dengan lampiran CSV) ditambah `confirm`")
+        await ctx.send("\n".join(lines))
+        return
+
+    progress = {'done': 0}
+    message = await ctx.send(f"⏳ **{label} dimulai...** 0/{len(targets)} user")
+
+    def on_progress(done):
+        progress['done'] = done
+
+    if action in ('vip', 'unvip'):
+        work = bulk_update_users([(user_id, 0) for user_id in targets], vip=action == 'vip', progress=on_progress)
+    elif action in ('kredit', 'debit'):
+        sign = 1 if action == 'kredit' else -1
+        work = bulk_update_users([(user_id, sign * amount) for user_id, amount in targets.items()],
+                                 progress=on_progress)
+    else:
+        work = bulk_add_to_inventory(list(targets.items()), item_name, bulk.ITEM_CATEGORY, item_value,
+                                     progress=on_progress)
+    started = time.perf_counter()
+    count = await edit_progress(message, asyncio.create_task(work), lambda: (
+        f"⏳ **{label} berjalan...** {progress['done']}/{len(targets)} user"))
+    # Tidak publish event per user: ribuan VipGranted akan membanjiri channel pengumuman
+    log.info("massal %s oleh %s: %d user", action, ctx.author.id, count)
+    await message.edit(content=f"✅ **{label} selesai!** {count} user • ⏱️ {time.perf_counter() - started:.2f}s")
+
+
+@bot.command()
+async def profile(ctx, mode: str = None, seconds: int = PROFILE_DEFAULT_SECONDS):
+    """Profiling on/off untuk cari hot path (owner only) - !profile on [detik] / !profile off"""
+    if ctx.author.id != OWNER_ID:
+        await ctx.send("🔒 **Akses ditolak!** Hanya owner bot yang bisa profiling.")
+        return
+
+    if mode == "on":
+        if profiler.running:
+            await ctx.send("⚠️ **Profiler sudah berjalan!** Gunakan `!profile off` untuk berhenti.")
+            return
+        seconds = max(1, min(seconds, 600))
+
+        async def send_report(report):
+            await send_profile_report(ctx, report)
+
+        profiler.start(seconds, on_stop=send_report)
+        await ctx.send(f"🔬 **Profiler ON** ({profiler.backend}) selama {seconds} detik...")
+    elif mode == "off":
+        if not profiler.running:
+            await ctx.send("❌ **Profiler tidak sedang berjalan!**")
+            return
+        await send_profile_report(ctx, profiler.stop())
+    else:
+        await ctx.send("📝 **Contoh:** `!profile on 30` atau `!profile off`")
+
+
+async def send_profile_report(ctx, report):
+    path, summary = report
+    # Batas pesan Discord 2000 karakter
+    await ctx.send(f"🔬 **Profiler OFF** - disimpan di `{path}`\n```\n{summary[:1800]}\n```")
+
+
+async def cari_response(author):
+    """Logika !cari dan /cari; kembalikan teks balasan"""
+    balance, vip, current_items = await get_user_profile(author.id)
+
+    # Check daily usage limits
+    current_usage = await get_daily_usage(author.id)
+
+    # Determine usage limit based on user status
+    if author.id == OWNER_ID:
+        # Owner has unlimited usage
+        daily_limit = float('inf')
+        status_text = "👑 **OWNER** (Unlimited)"
+    elif vip:
+        daily_limit = 50
+        status_text = "💎 **VIP** (50/hari)"  
+    else:
+        daily_limit = 25
+        status_text = "👤 **Regular** (25/hari)"
+
+    # Check if user has reached daily limit
+    if current_usage >= daily_limit:
+        return (
+            f"⏰ **Daily limit tercapai!** ({current_usage}/{int(daily_limit)})\n\n"
+            f"📊 **Status:** {status_text}\n"
+            f"🔄 **Reset:** Besok jam 00:00 WIB\n\n"
+            f"💡 **Upgrade ke VIP untuk limit 50x/hari:** `!vip @{author.name}`"
+        )
+
+    # Check inventory capacity
+    max_capacity = 25 if vip else 15
+
+    if current_items >= max_capacity:
+        return f"🗑️ **Inventori penuh!** ({current_items}/{max_capacity})\n💡 **Tip:** Gunakan `!sell [barang]` untuk jual barang terlebih dahulu"
+
+    # Define possible items found in trash with NEW RARITIES
+    trash_items = {
+        # Trash items (auto-deleted, no value)
+        "trash": [
+            ("Makanan Busuk", 0), ("Sayuran Basi", 0), ("Roti Berjamur", 0),
+            ("Daging Busuk", 0), ("Buah Busuk", 0), ("Nasi Basi", 0)
+        ],
+
+        # Recyclable items (5-20 value)
+        "recyclable": [
+            ("Botol Plastik", random.randint(5, 20)), ("Kaleng Soda", random.randint(5, 20)),
+            ("Kardus Bekas", random.randint(5, 20)), ("Koran Lama", random.randint(5, 20)),
+            ("Botol Kaca", random.randint(5, 20)), ("Plastik Kemasan", random.randint(5, 20)),
+            ("Kertas Bekas", random.randint(5, 20)), ("Kantong Plastik", random.randint(5, 20))
+        ],
+
+        # Electronics (50-90 value) - rare
+        "electronics": [
+            ("HP Rusak", random.randint(50, 90)), ("Kabel USB", random.randint(50, 90)),
+            ("Headphone Bekas", random.randint(50, 90)), ("Charger Lama", random.randint(50, 90)),
+            ("Remote Rusak", random.randint(50, 90)), ("Baterai Bekas", random.randint(50, 90)),
+            ("Flashdisk Rusak", random.randint(50, 90))
+        ],
+
+        # NEW: Legendary items (very rare, high value)
+        "legendary": [
+            ("Silver Ring", random.randint(120, 150)), ("Silver Chain", random.randint(120, 150)),
+            ("Gold Coin", random.randint(155, 200)), ("Gold Bracelet", random.randint(155, 200)),
+            ("Diamond Earring", random.randint(210, 260)), ("Diamond Ring", random.randint(210, 260))
+        ],
+
+        # NEW: Mythical meme items (ultra rare, viral content)
+        "mythical": [
+            ("🐸 Pepe Sticker", random.randint(300, 500)), ("😎 Chad Sticker", random.randint(300, 500)),
+            ("🐕 Doge Sticker", random.randint(300, 500)), ("🚀 To The Moon Sticker", random.randint(300, 500)),
+            ("🔥 This is Fine Sticker", random.randint(300, 500)), ("💎 Diamond Hands Sticker", random.randint(300, 500)),
+            ("🌙 Mooning Sticker", random.randint(300, 500)), ("⚡ Sigma Grindset Sticker", random.randint(300, 500)),
+            ("🎮 Among Us Sticker", random.randint(300, 500)), ("🍌 Minion Sticker", random.randint(300, 500))
+        ]
+    }
+
+    # NEW PROBABILITY SYSTEM with all rarities
+    find_chance = random.random() * 100
+
+    if find_chance < 35:  # 35% chance trash (auto-deleted)
+        category = "trash"
+    elif find_chance < 70:  # 35% chance recyclable items
+        category = "recyclable"
+    elif find_chance < 90:  # 20% chance electronics
+        category = "electronics"  
+    elif find_chance < 97:  # 7% chance legendary
+        category = "legendary"
+    else:  # 3% chance mythical (ultra rare!)
+        category = "mythical"
+
+    # Select random item from category
+    item_name, item_value = random.choice(trash_items[category])
+
+    # Handle trash items (auto-deleted)
+    if category == "trash":
+        trash_messages = [
+            f"🗑️ **Yuck!** {author.mention} menemukan **{item_name}** tapi langsung dibuang lagi! 🤢",
+            f"🤮 **Eww!** {author.mention} mendapat **{item_name}** - langsung ke tempat sampah!",
+            f"😷 **Gross!** {author.mention} nemu **{item_name}** tapi tidak bisa diambil (terlalu busuk!)"
+        ]
+        return random.choice(trash_messages)
+
+    # Increment daily usage counter
+    await increment_daily_usage(author.id)
+
+    # Add valuable items to inventory
+    await add_to_inventory(author.id, item_name, category, item_value)
+    bus.publish(events.ItemFound(author.id, item_name, category, item_value))
+
+    # Response messages and styling based on category
+    if category == "recyclable":
+        emoji = "♻️"
+        category_name = "barang daur ulang"
+        rarity = "🟢 **UMUM**"
+    elif category == "electronics":
+        emoji = "⚡"
+        category_name = "elektronik bekas"
+        rarity = "🟡 **LANGKA**"
+    elif category == "legendary":
+        emoji = "💎"
+        category_name = "treasure legendary"
+        rarity = "🟠 **LEGENDARY**"
+    else:  # mythical
+        emoji = "🌟"
+        category_name = "meme mythical"
+        rarity = "🔮 **MYTHICAL**"
+
+    # Special messages for rare finds
+    if category == "legendary":
+        success_messages = [
+            f"{emoji} **TREASURE FOUND!** {author.mention} menggali **{item_name}** yang berharga!",
+            f"{emoji} **LEGENDARY DROP!** {author.mention} menemukan **{item_name}** di kedalaman sampah!",
+            f"{emoji} **JACKPOT!** {author.mention} beruntung dapat **{item_name}**!"
+        ]
+    elif category == "mythical":
+        success_messages = [
+            f"{emoji} **MYTHICAL MEME!** {author.mention} menemukan sticker viral **{item_name}**! 🔥",
+            f"{emoji} **ULTRA RARE!** {author.mention} dapat meme legendaris **{item_name}**! 🚀",
+            f"{emoji} **VIRAL CONTENT!** {author.mention} nemu **{item_name}** yang lagi trending! 💫"
+        ]
+    else:
+        success_messages = [
+            f"{emoji} **Nice find!** {author.mention} mendapat **{item_name}** dari tong sampah!",
+            f"{emoji} **Lucky!** {author.mention} nemu **{item_name}** yang masih bisa dijual!"
+        ]
+
+    # Dari pembacaan di awal, tanpa round-trip tambahan: satu barang dan satu pemakaian baru
+    new_count = current_items + 1
+    new_usage = current_usage + 1
+
+    # Special notification for rare items
+    rare_bonus = ""
+    if category in ["legendary", "mythical"]:
+        rare_bonus = f"\n🎉 **RARE ITEM ALERT!** Kamu beruntung banget nih!"
+
+    # Usage counter display
+    if author.id == OWNER_ID:
+        usage_text = "👑 **Unlimited**"
+    else:
+        limit = 50 if vip else 25
+        usage_text = f"📊 **Usage:** {new_usage}/{limit} hari ini"
+
+    return (
+        f"{random.choice(success_messages)}\n\n"
+        f"📦 **Item:** {item_name}\n"
+        f"💰 **Nilai:** {item_value} uang\n"
+        f"🏷️ **Kategori:** {category_name.title()}\n"
+        f"⭐ **Rarity:** {rarity}\n"
+        f"📊 **Inventori:** {new_count}/{max_capacity}\n"
+        f"{usage_text}{rare_bonus}\n\n"
+        f"💡 **Tip:** Gunakan `!sell {item_name}` untuk menjual barang ini!"
+    )
+
+
+@bot.command()
+async def cari(ctx):
+    """Cari barang di tong sampah - !cari"""
+    await ctx.send(await cari_response(ctx.author))
+
+
+@bot.command()
+async def balance(ctx):
+    """Cek saldo kamu"""
+    balance, vip = await get_user(ctx.author.id)
+    vip_status = "💎 VIP" if vip else "👤 Regular"
+    await ctx.send(
+        f"💰 **Saldo {ctx.author.mention}:** {balance} uang\n🏆 **Status:** {vip_status}"
+    )
+
+
+async def inventori_response(author):
+    """Logika !inventori dan /inventori; kembalikan teks balasan"""
+    balance, vip = await get_user(author.id)
+    inventory = await get_inventory(author.id)
+
+    if not inventory:
+        return f"📦 **Inventori {author.mention} kosong!**\n💡 **Tip:** Gunakan `!cari` untuk mencari barang di tong sampah"
+
+    # Group items by category
+    categories = {}
+    total_value = 0
+    item_count = 0
+
+    for item_name, item_category, item_value, quantity in inventory:
+        if item_category not in categories:
+            categories[item_category] = []
+        categories[item_category].append((item_name, item_value, quantity))
+        total_value += item_value * quantity
+        item_count += quantity
+
+    max_capacity = 25 if vip else 15
+
+    # Build inventory display
+    inventory_text = f"📦 **INVENTORI {author.name.upper()}**\n"
+    inventory_text += f"📊 **Slot:** {item_count}/{max_capacity}\n"
+    inventory_text += f"💰 **Total Nilai:** {total_value} uang\n\n"
+
+    category_emojis = {
+        "recyclable": "♻️",
+        "electronics": "⚡",
+        "legendary": "💎",
+        "mythical": "🌟"
+    }
+
+    category_names = {
+        "recyclable": "BARANG DAUR ULANG",
+        "electronics": "ELEKTRONIK BEKAS",
+        "legendary": "TREASURE LEGENDARY",
+        "mythical": "MEME MYTHICAL"
+    }
+
+    for category, items in categories.items():
+        emoji = category_emojis.get(category, "📦")
+        category_name = category_names.get(category, category.upper())
+        inventory_text += f"{emoji} **{category_name}:**\n"
+
+        for item_name, item_value, quantity in items:
+            if quantity > 1:
+                inventory_text += f"• **{item_name}** x{quantity} - {item_value} uang each\n"
+            else:
+                inventory_text += f"• **{item_name}** - {item_value} uang\n"
+        inventory_text += "\n"
+
+    inventory_text += "💡 **Tips:**\n"
+    inventory_text += "• `!sell [nama barang]` - Jual barang tertentu\n"
+    inventory_text += "• `!give [user] [barang]` - Beri barang ke user lain\n"
+    inventory_text += "• `!cari` - Cari barang baru di tong sampah"
+
+    return inventory_text
+
+
+@bot.command(aliases=['statistik'])
+async def stats(ctx, member: discord.Member = None):
+    """Statistik lifetime kamu atau user lain - !stats [@user]"""
+    member = member or ctx.author
+    values = await user_stats.get(member.id)
+    if not values:
+        await ctx.send(f"📊 **{member.mention} belum punya statistik!**\n💡 **Tip:** Mulai dengan `!cari`")
+        return
+
+    def stat(name):
+        return values.get(name, 0)
+
+    found_total = sum(stat(f"found_{category}") for category in ("recyclable", "electronics", "legendary", "mythical"))
+    gamble_net = stat("gamble_won") - stat("gamble_lost")
+    roulette_net = stat("roulette_won") - stat("roulette_lost")
+    await ctx.send(
+        f"📊 **STATISTIK {member.name.upper()}**\n\n"
+        f"🔍 **Barang ditemukan:** {found_total}\n"
+        f"♻️ {stat('found_recyclable')} • ⚡ {stat('found_electronics')} • "
+        f"💎 {stat('found_legendary')} • 🌟 {stat('found_mythical')}\n\n"
+        f"💰 **Barang terjual:** {stat('items_sold')} ({stat('sell_earned')} uang)\n\n"
+        f"🎰 **Gamble:** {stat('gamble_wins')} menang / {stat('gamble_losses')} kalah / {stat('gamble_ties')} seri "
+        f"({gamble_net:+d} uang)\n"
+        f"🔫 **Roulette:** {stat('roulette_wins')} menang / {stat('roulette_losses')} kalah / {stat('roulette_ties')} seri "
+        f"({roulette_net:+d} uang)"
+    )
+
+
+@bot.command(aliases=['inv', 'inventory'])
+async def inventori(ctx):
+    """Cek inventori kamu - !inventori atau !inv"""
+    await ctx.send(await inventori_response(ctx.author))
+
+
+async def sell_response(author, item_name):
+    """Logika !sell dan /sell; kembalikan teks balasan"""
+    balance, vip = await get_user(author.id)
+    inventory = await get_inventory(author.id)
+
+    if not inventory:
+        return f"📦 **Inventori kosong!** Gunakan `!cari` untuk mencari barang dulu"
+
+    # Find the item (case insensitive)
+    item_found = None
+    for inv_item in inventory:
+        if inv_item[0].lower() == item_name.lower():
+            item_found = inv_item
+            break
+
+    if not item_found:
+        # Show available items if item not found
+        available_items = [item[0] for item in inventory]
+        available_text = ", ".join(available_items[:10])  # Show max 10 items
+        if len(available_items) > 10:
+            available_text += f"... (+{len(available_items) - 10} lainnya)"
+
+        return (
+            f"❌ **Barang tidak ditemukan:** `{item_name}`\n\n"
+            f"📦 **Barang yang tersedia:**\n{available_text}\n\n"
+            f"💡 **Tip:** Gunakan `!inventori` untuk lihat semua barang"
+        )
+
+    # Extract item details
+    found_name, found_category, found_value, found_quantity = item_found
+
+    # Remove 1 quantity from inventory
+    success = await remove_from_inventory(author.id, found_name, 1)
+
+    if not success:
+        return "❌ **Error sistem inventori!** Coba lagi."
+
+    # Add money to balance (VIP gets 2x bonus!)
+    final_value = found_value * 2 if vip else found_value
+    balance = await adjust_balance(author.id, final_value)
+    bus.publish(events.ItemSold(author.id, found_name, found_category, 1, final_value))
+
+    # Category-specific responses with NEW RARITIES
+    if found_category == "recyclable":
+        emoji = "♻️"
+        sell_messages = [
+            f"{emoji} **Dijual ke pengepul!** {author.mention} menjual **{found_name}** seharga {found_value} uang!",
+            f"{emoji} **Eco-friendly sale!** {author.mention} daur ulang **{found_name}** dan dapat {found_value} uang!"
+        ]
+    elif found_category == "electronics":
+        emoji = "⚡"
+        sell_messages = [
+            f"{emoji} **Terjual ke tukang servis!** {author.mention} jual **{found_name}** seharga {found_value} uang!",
+            f"{emoji} **Spare parts money!** {author.mention} berhasil jual **{found_name}** ke bengkel!"
+        ]
+    elif found_category == "legendary":
+        emoji = "💎"
+        sell_messages = [
+            f"{emoji} **TREASURE SOLD!** {author.mention} jual **{found_name}** ke kolektor seharga {found_value} uang!",
+            f"{emoji} **HIGH VALUE SALE!** {author.mention} berhasil jual **{found_name}** dengan harga premium!"
+        ]
+    else:  # mythical
+        emoji = "🌟"
+        sell_messages = [
+            f"{emoji} **VIRAL MEME SOLD!** {author.mention} jual **{found_name}** ke meme collector seharga {found_value} uang!",
+            f"{emoji} **LEGENDARY TRADE!** {author.mention} berhasil jual **{found_name}** dengan harga fantastis!"
+        ]
+
+    # Check remaining quantity for display
+    remaining_quantity = found_quantity - 1
+    quantity_text = f" (masih ada {remaining_quantity}x)" if remaining_quantity > 0 else ""
+
+    vip_bonus_text = f"💎 **VIP BONUS 2x!** ({found_value} → {final_value})\n" if vip else ""
+
+    return (
+        f"{random.choice(sell_messages)}\n\n"
+        f"💰 **Dapat:** {final_value} uang\n"
+        f"{vip_bonus_text}"
+        f"💵 **Saldo baru:** {balance}\n"
+        f"📦 **Item:** {found_name}{quantity_text}"
+    )
+
+
+@bot.command()
+async def sell(ctx, *, item_name: str = None):
+    """Jual barang dari inventori - !sell [nama barang]"""
+    if item_name is None:
+        await ctx.send(
+            "❌ **Error:** Masukkan nama barang yang ingin dijual!\n"
+            "📝 **Contoh:** `!sell Botol Plastik`\n"
+            "💡 **Tip:** Gunakan `!inventori` untuk lihat barang yang kamu punya"
+        )
+        return
+
+    await ctx.send(await sell_response(ctx.author, item_name))
+
+
+async def give_response(author, user, item_name):
+    """Logika !give dan /give; kembalikan teks balasan"""
+    giver_id = author.id
+    receiver_id = user.id
+
+    # Can't give to yourself
+    if giver_id == receiver_id:
+        return "❌ **Error:** Tidak bisa memberi barang ke diri sendiri!"
+
+    # Can't give to bots
+    if user.bot:
+        return "❌ **Error:** Tidak bisa memberi barang ke bot!"
+
+    # Check giver's inventory
+    giver_inventory = await get_inventory(giver_id)
+    if not giver_inventory:
+        return "📦 **Inventori kosong!** Tidak ada barang untuk diberikan."
+
+    # Find the item
+    item_found = None
+    for inv_item in giver_inventory:
+        if inv_item[0].lower() == item_name.lower():
+            item_found = inv_item
+            break
+
+    if not item_found:
+        available_items = [item[0] for item in giver_inventory]
+        available_text = ", ".join(available_items[:8])
+        if len(available_items) > 8:
+            available_text += f"... (+{len(available_items) - 8} lainnya)"
+
+        return (
+            f"❌ **Barang tidak ditemukan:** `{item_name}`\n\n"
+            f"📦 **Barang yang kamu punya:**\n{available_text}"
+        )
+
+    found_name, found_category, found_value, found_quantity = item_found
+
+    # Check receiver's inventory capacity
+    receiver_balance, receiver_vip, receiver_current_items = await get_user_profile(receiver_id)
+    receiver_max_capacity = 25 if receiver_vip else 15
+
+    if receiver_current_items >= receiver_max_capacity:
+        vip_status = "💎 VIP" if receiver_vip else "👤 Regular"
+        return (
+            f"❌ **{user.mention} inventori penuh!** ({receiver_current_items}/{receiver_max_capacity})\n"
+            f"👤 **Status:** {vip_status}\n"
+            f"💡 **Tip:** User tersebut harus jual barang dulu untuk memberi ruang"
+        )
+
+    # Remove item from giver
+    success = await remove_from_inventory(giver_id, found_name, 1)
+    if not success:
+        return "❌ **Error sistem inventori!** Coba lagi."
+
+    # Add item to receiver
+    await add_to_inventory(receiver_id, found_name, found_category, found_value, 1)
+
+    # Category emojis for display
+    category_emojis = {
+        "recyclable": "♻️",
+        "electronics": "⚡", 
+        "legendary": "💎",
+        "mythical": "🌟"
+    }
+
+    emoji = category_emojis.get(found_category, "📦")
+
+    # Special messages for rare items
+    if found_category == "legendary":
+        give_messages = [
+            f"{emoji} **TREASURE GIFT!** {author.mention} memberikan **{found_name}** kepada {user.mention}!",
+            f"{emoji} **LEGENDARY PRESENT!** {user.mention} dapat hadiah berharga dari {author.mention}!"
+        ]
+    elif found_category == "mythical":
+        give_messages = [
+            f"{emoji} **MYTHICAL GIFT!** {author.mention} sharing meme viral **{found_name}** ke {user.mention}! 🔥",
+            f"{emoji} **ULTRA RARE PRESENT!** {user.mention} dapat sticker legendaris dari {author.mention}! 🚀"
+        ]
+    else:
+        give_messages = [
+            f"{emoji} **Gift delivered!** {author.mention} memberikan **{found_name}** kepada {user.mention}!",
+            f"{emoji} **Generous act!** {user.mention} dapat hadiah dari {author.mention}!"
+        ]
+
+    # Check remaining quantity for giver
+    remaining_quantity = found_quantity - 1
+    giver_remaining_text = f" (kamu masih ada {remaining_quantity}x)" if remaining_quantity > 0 else " (barang terakhir kamu!)"
+
+    return (
+        f"{random.choice(give_messages)}\n\n"
+        f"🎁 **Item:** {found_name}\n"
+        f"💰 **Nilai:** {found_value} uang\n"
+        f"📦 **Status:** Transfer berhasil{giver_remaining_text}\n"
+        f"🎉 **{user.mention}** sekarang memiliki **{found_name}**!"
+    )
+
+
+@bot.command()
+async def give(ctx, user: discord.Member = None, *, item_name: str = None):
+    """Beri barang dari inventori ke user lain - !give [user] [nama barang]"""
+    if user is None or item_name is None:
+        await ctx.send(
+            "❌ **Error:** Format tidak lengkap!\n"
+            "📝 **Contoh:** `!give @username Botol Plastik`\n"
+            "💡 **Tip:** Tag user dan masukkan nama barang yang ingin diberikan"
+        )
+        return
+
+    await ctx.send(await give_response(ctx.author, user, item_name))
+
+
+async def jualall_response(author):
+    """Logika !jualall dan /jualall; kembalikan teks balasan"""
+    balance, vip = await get_user(author.id)
+    # Kosongkan dulu lalu jual persis barang yang terhapus, supaya barang yang
+    # masuk bersamaan (mis. !give dari user lain) tidak hilang tanpa dibayar
+    inventory = await clear_inventory(author.id)
+
+    if not inventory:
+        return f"📦 **Inventori kosong!** Tidak ada barang untuk dijual.\n💡 **Tip:** Gunakan `!cari` untuk mencari barang"
+
+    # Calculate total value and build sell summary
+    total_base_value = 0
+    item_count = 0
+    categories = {"recyclable": [], "electronics": [], "legendary": [], "mythical": []}
+
+    for item_name, item_category, item_value, quantity in inventory:
+        total_base_value += item_value * quantity
+        item_count += quantity
+
+        if item_category in categories:
+            categories[item_category].append((item_name, item_value, quantity))
+
+    # Apply VIP bonus
+    final_total = total_base_value * 2 if vip else total_base_value
+
+    # Update user balance
+    balance = await adjust_balance(author.id, final_total)
+    multiplier = 2 if vip else 1
+    for item_name, item_category, item_value, quantity in inventory:
+        bus.publish(events.ItemSold(author.id, item_name, item_category, quantity,
+                                    item_value * quantity * multiplier))
+
+    # Build response message with special flair for rare items
+    has_rare_items = len(categories["legendary"]) > 0 or len(categories["mythical"]) > 0
+
+    if has_rare_items:
+        sell_messages = [
+            "🌟 **EPIC MASS LIQUIDATION!** Koleksi rare items terjual habis dengan harga fantastis!",
+            "💫 **LEGENDARY GARAGE SALE!** Semua treasure dan meme viral berhasil dijual!",
+            "🔥 **ULTRA BULK SALE!** Kolektor dari seluruh dunia membayar mahal untuk items kamu!"
+        ]
+    else:
+        sell_messages = [
+            "🏪 **MASS LIQUIDATION!** Semua barang terjual habis!",
+            "💸 **GARAGE SALE SUCCESS!** Inventori dikosongkan total!",
+            "🎉 **BULK SALE COMPLETE!** Semua item berhasil dijual!"
+        ]
+
+    response = f"{random.choice(sell_messages)}\n\n"
+    response += f"📦 **Total Items:** {item_count} barang\n"
+    response += f"💰 **Base Value:** {total_base_value} uang\n"
+
+    if vip:
+        response += f"💎 **VIP BONUS 2x!** {total_base_value} → {final_total} uang\n"
+
+    response += f"💵 **Saldo baru:** {balance}\n\n"
+
+    # Show breakdown by category with new rarities
+    category_count = 0
+    if categories["recyclable"]:
+        response += f"♻️ **Barang Daur Ulang:** {len(categories['recyclable'])} jenis\n"
+        category_count += 1
+    if categories["electronics"]:
+        response += f"⚡ **Elektronik Bekas:** {len(categories['electronics'])} jenis\n"
+        category_count += 1
+    if categories["legendary"]:
+        response += f"💎 **Treasure Legendary:** {len(categories['legendary'])} jenis ✨\n"
+        category_count += 1
+    if categories["mythical"]:
+        response += f"🌟 **Meme Mythical:** {len(categories['mythical'])} jenis 🔥\n"
+        category_count += 1
+
+    response += f"\n🎯 **Inventori sekarang:** 0/{'25' if vip else '15'}"
+
+    if has_rare_items:
+        response += f"\n🌟 **RARE COLLECTION BONUS!** Kamu telah menjual {category_count} kategori items yang berbeda!"
+
+    return response
+
+
+@bot.command(aliases=['sellall', 'sell-all'])
+async def jualall(ctx):
+    """Jual semua barang di inventori - !jualall atau !sellall"""
+    await ctx.send(await jualall_response(ctx.author))
+
+
+@bot.command()
+async def gamble(ctx, amount: int = None):
+    """Gambling sederhana (VIP only) - !gamble [jumlah]"""
+    if amount is None:
+        await ctx.send(
+            "❌ **Error:** Masukkan jumlah taruhan!\n📝 **Contoh:** `!gamble 50`"
+        )
+        return
+
+    balance, vip = await get_user(ctx.author.id)
+    if not vip:
+        await ctx.send(
+            "🔒 **Maaf,** hanya VIP yang bisa menggunakan fitur gambling.\n💎 **Minta owner untuk VIP:** `!vip @kamu`"
+        )
+        return
+    if amount <= 0:
+        await ctx.send(
+            "❌ **Error:** Masu�kkan jumlah taruhan yang valid (lebih dari 0)!")
+        return
+    if balance < amount:
+        await ctx.send(
+            f"💸 **Saldo tidak cukup!** Kamu butuh {amount} tapi hanya punya {balance} uang.\n💰 **Cari uang dulu:** `!cari`"
+        )
+        return
+
+    # Taruhan dipotong dulu secara atomik: saldo di atas bisa sudah basi kalau ada taruhan bersamaan
+    balance = await adjust_balance(ctx.author.id, -amount, allow_negative=False)
+    if balance is None:
+        await ctx.send(f"💸 **Saldo tidak cukup!** Kamu butuh {amount} uang.\n💰 **Cari uang dulu:** `!cari`")
+        return
+
+    menang = random.choice([True, False])
+    bus.publish(events.BetSettled(ctx.author.id, "gamble", amount, amount if menang else -amount))
+    if menang:
+        balance = await adjust_balance(ctx.author.id, 2 * amount)
+        await ctx.send(
+            f"🎉 **MENANG!** {ctx.author.mention} mendapat {amount} uang!\n💰 **Saldo sekarang:** {balance}"
+        )
+    else:
+        await ctx.send(
+            f"😢 **Kalah!** {ctx.author.mention} kehilangan {amount} uang.\n💰 **Saldo sekarang:** {balance}"
+        )
+
+
+@bot.command()
+async def roulette(ctx, bet: int = None):
+    """🎲 Russian Roulette - Interactive Choice-Based Game!"""
+    if bet is None:
+        await ctx.send(
+            "🎯 **RUSSIAN ROULETTE - CHOICE-BASED!**\n❌ **Error:** Masukkan taruhan!\n📝 **Contoh:** `!roulette 100`\n\n🎮 **Aturan Interactive:**\n🤖 **Bot vs Player** - strategic decisions!\n🎯 **Kepala** (tombol / `!kepala`) - tembak diri sendiri (empty = extra turn!)\n🔫 **Lawan** (tombol / `!lawan`) - tembak lawan (safe play)\n❤️ **3 nyawa per ronde**, reset setiap ronde\n💰 **Menang = taruhan x3**"
+        )
+        return
+
+    # Check if player already has active game
+    if ctx.author.id in active_games:
+        await ctx.send(
+            "❌ **Kamu sudah punya game aktif!**\n🔄 **Selesaikan dulu atau ketik** `!surrender` **untuk menyerah**"
+        )
+        return
+
+    balance, vip = await get_user(ctx.author.id)
+
+    if bet <= 0:
+        await ctx.send("❌ **Error:** Taruhan harus lebih dari 0!")
+        return
+    if balance < bet:
+        await ctx.send(
+            f"💸 **Saldo tidak cukup!** Butuh {bet} tapi hanya punya {balance} uang."
+        )
+        return
+
+    # Klaim lintas shard supaya player tidak main di dua server sekaligus
+    if not await game_registry.claim(f"roulette:{ctx.author.id}"):
+        await ctx.send(
+            "❌ **Kamu sudah punya game aktif di server lain!**\n🔄 **Selesaikan dulu atau ketik** `!surrender` **di sana**"
+        )
+        return
+    # Taruhan ditahan sejak awal; end_game/surrender membayar balik sesuai hasil
+    if await adjust_balance(ctx.author.id, -bet, allow_negative=False) is None:
+        await game_registry.release(f"roulette:{ctx.author.id}")
+        await ctx.send(f"💸 **Saldo tidak cukup!** Butuh {bet} uang.")
+        return
+
+    # Initialize game state
+    game_state = {
+        'player_id': ctx.author.id,
+        'guild_id': current_guild.get(),
+        'channel_id': ctx.channel.id,
+        'bet': bet,
+        'round': 1,
+        'max_rounds': 3,
+        'player_wins': 0,
+        'bot_wins': 0,
+        'player_lives': 3,
+        'bot_lives': 3,
+        'turn_player': True,  # True = player, False = bot
+        'chambers': 0,
+        'bullets': 0,
+        'revolver': [],
+        'current_chamber': 0,
+        'waiting_for_choice': False,
+        # Tombol pilihan membawa game_id; acak supaya tombol lama dari proses sebelumnya tidak nyasar
+        'game_id': os.urandom(6).hex(),
+        'ctx': ctx,
+        'prompt': None,
+    }
+
+    active_games[ctx.author.id] = game_state
+    roulette_games[game_state['game_id']] = game_state
+
+    await ctx.send(
+        f"🎲 **RUSSIAN ROULETTE - STRATEGIC DUEL!**\n\n👤 **Player:** {ctx.author.mention}\n🤖 **Opponent:** 🤖 Alpha D\n💰 **Taruhan:** {bet} uang\n\n🔫 **Mempersiapkan revolver...**"
+    )
+
+    await start_new_round(ctx, game_state)
+
+
+async def start_new_round(ctx, game_state):
+    """Start a new round of Russian Roulette"""
+    round_num = game_state['round']
+
+    await ctx.send(
+        f"\n🔥 **═══ RONDE {round_num} ═══**\n\n🔄 **RESET!** Kedua pemain kembali memiliki 3 nyawa\n🎯 **Player:** <@{game_state['player_id']}> ❤️❤️❤️\n🤖 **Bot:** 🤖 Alpha D ❤️❤️❤️"
+    )
+
+    await tracing.sleep(2)
+
+    # Reset lives for this round
+    game_state['player_lives'] = 3
+    game_state['bot_lives'] = 3
+
+    # Setup realistic revolver with progressive difficulty
+    chambers = random.randint(6, 9)
+
+    # Progressive difficulty system
+    if round_num == 1:
+        bullets = random.randint(1, 3)  # Round 1: 1-3 bullets (easier)
+    elif round_num == 2:
+        bullets = random.randint(3, 4)  # Round 2: 3-4 bullets (medium)
+    else:  # round 3
+        bullets = random.randint(4, 5)  # Round 3: 4-5 bullets (harder)
+
+    # Ensure bullets don't exceed chambers
+    bullets = min(bullets, chambers - 1)
+
+    # Create revolver with random bullet positions
+    revolver = [False] * chambers
+    bullet_positions = random.sample(range(chambers), bullets)
+    for pos in bullet_positions:
+        revolver[pos] = True
+
+    game_state['chambers'] = chambers
+    game_state['bullets'] = bullets
+    game_state['revolver'] = revolver
+    game_state['current_chamber'] = 0
+
+    # Difficulty indicator
+    if round_num == 1:
+        difficulty = "🟢 **MUDAH**"
+    elif round_num == 2:
+        difficulty = "🟡 **MEDIUM**"
+    else:
+        difficulty = "🔴 **SULIT**"
+
+    await ctx.send(
+        f"🔫 **REVOLVER SETUP:**\n📊 **Chambers:** {chambers}\n💥 **Bullets:** {bullets}\n🎲 **Bullet positions:** *Hidden*\n⚡ **Difficulty:** {difficulty}\n\n🎯 **Starting chamber:** 1/{chambers}"
+    )
+
+    await tracing.sleep(1)
+
+    # Determine who goes first randomly
+    game_state['turn_player'] = random.choice([True, False])
+
+    if game_state['turn_player']:
+        await ctx.send("🎲 **Koin dilempar...** 🪙\n\n✨ **PLAYER MULAI DULUAN!**"
+                       )
+        await tracing.sleep(1)
+        await prompt_player_choice(ctx, game_state)
+    else:
+        await ctx.send("🎲 **Koin dilempar...** 🪙\n\n🤖 **BOT MULAI DULUAN!**")
+        await tracing.sleep(1)
+        await bot_turn(ctx, game_state)
+
+
+class RouletteChoiceButton(discord.ui.DynamicItem[discord.ui.Button],
+                           template=r'roulette:(?P<action>kepala|lawan):(?P<game_id>[0-9a-f]+)'):
+    """Tombol Kepala/Lawan; custom_id membawa game_id jadi klik langsung diarahkan ke game_state
+
+    Didaftarkan sekali lewat add_dynamic_items, jadi tetap dikenali tanpa
+    View per pesan (dan tanpa message_content intent).
+    """
+
+    def __init__(self, action, game_id, disabled=False):
+        label, emoji, style = {
+            'kepala': ("Kepala", "🎯", discord.ButtonStyle.danger),
+            'lawan': ("Lawan", "🔫", discord.ButtonStyle.primary),
+        }[action]
+        super().__init__(discord.ui.Button(label=label, emoji=emoji, style=style, disabled=disabled,
+                                           custom_id=f"roulette:{action}:{game_id}"))
+        self.action = action
+        self.game_id = game_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(match['action'], match['game_id'])
+
+    async def callback(self, interaction):
+        await roulette_button(interaction, self.game_id, self.action)
+
+
+def roulette_choice_view(game_id, disabled=False):
+    view = discord.ui.View(timeout=None)
+    view.add_item(RouletteChoiceButton('kepala', game_id, disabled))
+    view.add_item(RouletteChoiceButton('lawan', game_id, disabled))
+    return view
+
+
+async def prompt_player_choice(ctx, game_state):
+    """Prompt player to make a choice"""
+    current_chamber = game_state['current_chamber'] % game_state['chambers']
+
+    game_state['prompt'] = await ctx.send(
+        f"\n🎯 **GILIRAN ANDA!**\n\n🔫 **Chamber {current_chamber + 1}/{game_state['chambers']}**\n❤️ **Nyawa Player:** {game_state['player_lives']} | **Bot:** {game_state['bot_lives']}\n\n🤔 **Pilih tindakan:**\n🎯 **Kepala** - Tembak diri sendiri (berisiko, tapi bisa extra turn!)\n🔫 **Lawan** - Tembak lawan (bermain aman)\n\n⏰ **Waktu 30 detik untuk memilih...**",
+        view=roulette_choice_view(game_state['game_id'])
+    )
+
+    game_state['waiting_for_choice'] = True
+
+
+def take_player_turn(game_state):
+    """Ambil giliran player; None kalau boleh memilih, selain itu pesan error
+
+    Sinkron (tanpa await) supaya klik tombol dan !kepala/!lawan yang datang
+    bersamaan tidak sama-sama lolos.
+    """
+    if not game_state['waiting_for_choice']:
+        return "❌ **Bukan giliran kamu atau sudah memilih!**"
+    if not game_state['turn_player']:
+        return "❌ **Ini giliran bot, bukan kamu!**"
+    game_state['waiting_for_choice'] = False
+    return None
+
+
+async def disable_choice_buttons(game_state):
+    prompt, game_state['prompt'] = game_state['prompt'], None
+    if prompt is not None:
+        try:
+            await prompt.edit(view=roulette_choice_view(game_state['game_id'], disabled=True))
+        except discord.HTTPException:
+            pass
+
+
+async def player_shot(game_state, shoot_self):
+    ctx = game_state['ctx']
+    if shoot_self:
+        await ctx.send("🎯 **PILIHAN BERANI!** Menembak kepala sendiri...")
+    else:
+        await ctx.send("🔫 **PILIHAN AMAN!** Menembak lawan...")
+    await execute_shot(ctx, game_state, shoot_self, True)  # is_player=True
+
+
+async def roulette_button(interaction, game_id, action):
+    current_guild.set(interaction.guild_id or 0)
+    game_state = roulette_games.get(game_id)
+    if game_state is None:
+        await interaction.response.send_message("❌ **Game ini sudah selesai!**", ephemeral=True)
+        return
+    if interaction.user.id != game_state['player_id']:
+        await interaction.response.send_message("❌ **Ini bukan game kamu!**", ephemeral=True)
+        return
+    error = take_player_turn(game_state)
+    if error:
+        await interaction.response.send_message(error, ephemeral=True)
+        return
+    # Ack sekaligus menonaktifkan tombol di pesan yang sama
+    game_state['prompt'] = None
+    await interaction.response.edit_message(view=roulette_choice_view(game_id, disabled=True))
+    await player_shot(game_state, action == 'kepala')
+
+
+async def bot_turn(ctx, game_state):
+    """Handle bot's turn with AI decision making"""
+    current_chamber = game_state['current_chamber'] % game_state['chambers']
+
+    await ctx.send(
+        f"\n🤖 **GILIRAN BOT**\n\n🔫 **Chamber {current_chamber + 1}/{game_state['chambers']}**\n❤️ **Nyawa Player:** {game_state['player_lives']} | **Bot:** {game_state['bot_lives']}\n\n🎲 **Bot sedang menganalisis...**"
+    )
+
+    await tracing.sleep(2)
+
+    # Advanced Bot AI decision making
+    chambers_left = game_state['chambers'] - game_state['current_chamber']
+    bullets_left = sum(game_state['revolver'][game_state['current_chamber']:])
+    bullet_chance = bullets_left / chambers_left if chambers_left > 0 else 0
+
+    # Smart bot strategy based on multiple factors
+    shoot_self = False
+
+    # Factor 1: Life advantage/disadvantage
+    life_advantage = game_state['bot_lives'] - game_state['player_lives']
+
+    # Factor 2: Round progression (more aggressive in later rounds)
+    round_aggression = 0.1 * game_state['round']  # 0.1, 0.2, 0.3
+
+    # Factor 3: Bullet risk assessment
+    safe_threshold = 0.25 + round_aggression  # Gets more aggressive each round
+
+    # Decision matrix
+    if bullet_chance <= safe_threshold:
+        # Relatively safe - consider shooting self for extra turn
+        if life_advantage >= 0:
+            # Bot is ahead or tied - play for extra turns
+            shoot_self = True
+        else:
+            # Bot is behind - 70% chance to risk it for extra turn
+            shoot_self = random.random() < 0.7
+
+    elif game_state['player_lives'] == 1:
+        # Player has 1 life - always go for the kill
+        shoot_self = False
+
+    elif life_advantage > 1:
+        # Bot has significant life advantage - play it safe
+        shoot_self = False
+
+    elif life_advantage < -1:
+        # Bot is significantly behind - take risks
+        if bullet_chance < 0.5:
+            shoot_self = True
+        else:
+            # Even risky, but desperate
+            shoot_self = random.random() < 0.4
+
+    else:
+        # Close game - balanced strategy
+        if bullet_chance < 0.35:
+            shoot_self = random.random(
+            ) < 0.6  # 60% chance to risk for extra turn
+        else:
+            shoot_self = random.random(
+            ) < 0.3  # 30% chance to risk with high danger
+
+    if shoot_self:
+        # Bot shoots self - various strategic reasons
+        if bullet_chance <= 0.2:
+            bot_thoughts = [
+                "🤖 *\"Probabilitas sangat aman, ambil extra turn...\"*",
+                "🤖 *\"Risiko minimal, keuntungan maksimal...\"*",
+                "�🤖 *\"Matematika mendukung keputusan ini...\"*"
+            ]
+        elif life_advantage < 0:
+            bot_thoughts = [
+                "🤖 *\"Situasi sulit, harus ambil risiko...\"*",
+                "🤖 *\"Desperate times, desperate measures...\"*",
+                "🤖 *\"All-in untuk comeback!\"*"
+            ]
+        else:
+            bot_thoughts = [
+                "🤖 *\"Strategi agresif untuk dominasi...\"*",
+                "🤖 *\"Kalkulasi risiko vs reward...\"*",
+                "🤖 *\"Confidence level: optimal...\"*"
+            ]
+
+        await ctx.send(
+            f"{random.choice(bot_thoughts)}\n\n🎯 **Bot memilih: TEMBAK DIRI SENDIRI!**\n📊 **Bullet chance:** {bullet_chance:.1%}"
+        )
+        await tracing.sleep(1)
+        await execute_shot(ctx, game_state, True,
+                           False)  # shoot_self=True, is_player=False
+    else:
+        # Bot shoots player - offensive strategy
+        if game_state['player_lives'] == 1:
+            bot_thoughts = [
+                "🤖 *\"Target dalam mode critical - eliminasi!\"*",
+                "🤖 *\"Finishing move activated...\"*",
+                "🤖 *\"Saatnya mengakhiri permainan ini...\"*"
+            ]
+        elif bullet_chance > 0.5:
+            bot_thoughts = [
+                "🤖 *\"Terlalu berisiko untuk diri sendiri...\"*",
+                "🤖 *\"Safety first, attack second...\"*",
+                "🤖 *\"Bermain konservatif lebih bijak...\"*"
+            ]
+        else:
+            bot_thoughts = [
+                "🤖 *\"Strategi ofensif langsung...\"*",
+                "🤖 *\"Pressure is the key to victory...\"*",
+                "🤖 *\"Eliminate atau be eliminated...\"*"
+            ]
+
+        await ctx.send(
+            f"{random.choice(bot_thoughts)}\n\n🔫 **Bot memilih: TEMBAK PLAYER!**\n📊 **Bullet chance:** {bullet_chance:.1%}"
+        )
+        await tracing.sleep(1)
+        await execute_shot(ctx, game_state, False,
+                           False)  # shoot_self=False, is_player=False
+
+
+async def execute_shot(ctx, game_state, shoot_self, is_player):
+    """Execute the shot and handle the consequences"""
+    current_chamber = game_state['current_chamber'] % game_state['chambers']
+    is_bullet = game_state['revolver'][current_chamber]
+
+    await tracing.sleep(2)
+
+    if is_bullet:
+        # Hit bullet
+        if shoot_self:
+            if is_player:
+                game_state['player_lives'] -= 1
+                await ctx.send(
+                    f"💥 **BANG!** 💀\n\n☠️ **Player menembak diri sendiri dan kena peluru!**\n❤️ **Nyawa tersisa:** {game_state['player_lives']}"
+                )
+            else:
+                game_state['bot_lives'] -= 1
+                await ctx.send(
+                    f"💥 **BANG!** 🔥\n\n🤖 **Bot menembak diri sendiri dan kena peluru!**\n❤️ **Nyawa tersisa:** {game_state['bot_lives']}"
+                )
+        else:
+            if is_player:
+                game_state['bot_lives'] -= 1
+                await ctx.send(
+                    f"💥 **BANG!** 🎯\n\n🔫 **Player menembak bot dan kena sasaran!**\n❤️ **Bot nyawa tersisa:** {game_state['bot_lives']}"
+                )
+            else:
+                game_state['player_lives'] -= 1
+                await ctx.send(
+                    f"💥 **BANG!** 🎯\n\n🤖 **Bot menembak player dan kena sasaran!**\n❤️ **Player nyawa tersisa:** {game_state['player_lives']}"
+                )
+
+        # Switch turns (bullet = end turn)
+        game_state['turn_player'] = not game_state['turn_player']
+
+    else:
+        # Empty chamber
+        if shoot_self:
+            if is_player:
+                await ctx.send(
+                    f"🔫 **KLIK** ✨\n\n😎 **Player berani dan beruntung!** Chamber kosong!\n🎉 **BONUS TURN! Player bisa menembak lagi!**"
+                )
+                # Don't switch turns - player gets extra turn
+            else:
+                await ctx.send(
+                    f"🔫 **KLIK** ⚡\n\n🤖 *\"Perhitungan yang tepat!\"* Chamber kosong!\n🎉 **Bot mendapat giliran tambahan!**"
+                )
+                # Don't switch turns - bot gets extra turn
+        else:
+            if is_player:
+                await ctx.send(
+                    f"🔫 **KLIK** 😤\n\n💔 **Chamber kosong! Bot selamat!**\n🔄 **Giliran berganti ke bot...**"
+                )
+            else:
+                await ctx.send(
+                    f"🔫 **KLIK** 😅\n\n💚 **Chamber kosong! Player selamat!**\n🔄 **Giliran berganti ke player...**"
+                )
+
+            # Switch turns (missed shot = opponent's turn)
+            game_state['turn_player'] = not game_state['turn_player']
+
+    game_state['current_chamber'] += 1
+    await tracing.sleep(1)
+
+    # Check for round end
+    if game_state['player_lives'] <= 0:
+        await end_round(ctx, game_state, 'bot')
+    elif game_state['bot_lives'] <= 0:
+        await end_round(ctx, game_state, 'player')
+    else:
+        # Continue game
+        if game_state['turn_player']:
+            await prompt_player_choice(ctx, game_state)
+        else:
+            await bot_turn(ctx, game_state)
+
+
+async def end_round(ctx, game_state, winner):
+    """End the current round and start next or end game"""
+    if winner == 'player':
+        game_state['player_wins'] += 1
+        await ctx.send(f"🎉 **PLAYER MENANG RONDE {game_state['round']}!**")
+    else:
+        game_state['bot_wins'] += 1
+        await ctx.send(f"🤖 **BOT MENANG RONDE {game_state['round']}!**")
+
+    await tracing.sleep(2)
+
+    if game_state['round'] < game_state['max_rounds']:
+        await ctx.send(
+            f"\n📊 **SKOR SEMENTARA:**\n🎯 **Player:** {game_state['player_wins']} ronde\n🤖 **Bot:** {game_state['bot_wins']} ronde\n\n⏭️ **Lanjut ke ronde berikutnya...**"
+        )
+        game_state['round'] += 1
+        await tracing.sleep(2)
+        await start_new_round(ctx, game_state)
+    else:
+        await end_game(ctx, game_state)
+
+
+async def end_game(ctx, game_state):
+    """End the entire game and distribute rewards"""
+    player_id = game_state['player_id']
+    bet = game_state['bet']
+
+    await ctx.send(
+        f"\n🏁 **═══ HASIL AKHIR ═══**\n\n📊 **SKOR FINAL:**\n🎯 **Player:** {game_state['player_wins']}/{game_state['max_rounds']} ronde\n🤖 **Bot:** {game_state['bot_wins']}/{game_state['max_rounds']} ronde"
+    )
+
+    # Taruhan sudah dipotong saat game dimulai
+    if game_state['player_wins'] > game_state['bot_wins']:
+        # Player wins
+        winnings = bet * 3
+        balance = await adjust_balance(player_id, bet + winnings)
+        bus.publish(events.BetSettled(player_id, "roulette", bet, winnings))
+        await ctx.send(
+            f"🏆 **KEMENANGAN STRATEGIC!** 🎉\n\n🎯 **PLAYER MENANG!**\n💰 **Hadiah:** {winnings} uang (3x taruhan!)\n💵 **Saldo baru:** {balance}\n\n🤖 *\"Strategi yang mengesankan, manusia...\"*"
+        )
+    elif game_state['bot_wins'] > game_state['player_wins']:
+        # Bot wins
+        balance, vip = await get_user(player_id)
+        bus.publish(events.BetSettled(player_id, "roulette", bet, -bet))
+        await ctx.send(
+            f"💀 **KEKALAHAN STRATEGIC!** 😱\n\n🤖 **BOT MENANG!**\n💸 **Kehilangan:** {bet} uang\n💵 **Saldo baru:** {balance}\n\n🤖 *\"Artificial Intelligence > Human Intuition!\"*"
+        )
+    else:
+        # Tie
+        await adjust_balance(player_id, bet)
+        bus.publish(events.BetSettled(player_id, "roulette", bet, 0))
+        await ctx.send(
+            f"🤝 **SERI STRATEGIC!** ⚖️\n\nBattle of minds berakhir seri!\n💰 **Taruhan dikembalikan:** {bet} uang\n\n🤖 *\"Kemampuan strategis yang setara...\"*"
+        )
+
+    # Remove from active games
+    del active_games[player_id]
+    roulette_games.pop(game_state['game_id'], None)
+    await game_registry.release(f"roulette:{player_id}")
+
+    await ctx.send(
+        f"\n🎲 **Main lagi?** `!roulette {bet}`\n🔄 **Atau ubah taruhan:** `!roulette [jumlah_baru]`"
+    )
+
+
+@bot.command()
+async def kepala(ctx):
+    """Tembak kepala sendiri - berisiko tapi bisa dapat extra turn! (sama dengan tombol Kepala)"""
+    await choice_command(ctx, True)
+
+
+@bot.command()
+async def lawan(ctx):
+    """Tembak lawan - bermain aman (sama dengan tombol Lawan)"""
+    await choice_command(ctx, False)
+
+
+async def choice_command(ctx, shoot_self):
+    duel = duels.for_player(ctx.author.id)
+    if duel is not None and ctx.author.id not in active_games:
+        await duel_command(ctx, duel, shoot_self)
+        return
+    if ctx.author.id not in active_games:
+        await ctx.send(
+            "❌ **Tidak ada game aktif!**\n🎲 **Mulai game:** `!roulette [taruhan]`"
+        )
+        return
+
+    game_state = active_games[ctx.author.id]
+    error = take_player_turn(game_state)
+    if error:
+        await ctx.send(error)
+        return
+    await disable_choice_buttons(game_state)
+    await player_shot(game_state, shoot_self)
+
+
+@bot.command()
+async def surrender(ctx):
+    """Menyerah dari game aktif"""
+    if ctx.author.id not in active_games:
+        await ctx.send("❌ **Tidak ada game aktif untuk diserahkan!**")
+        return
+
+    game_state = active_games[ctx.author.id]
+    bet = game_state['bet']
+
+    # Lose half the bet when surrendering (taruhan sudah ditahan, sisanya dikembalikan)
+    penalty = bet // 2
+    balance = await adjust_balance(ctx.author.id, bet - penalty)
+
+    del active_games[ctx.author.id]
+    roulette_games.pop(game_state['game_id'], None)
+    await game_registry.release(f"roulette:{ctx.author.id}")
+    await disable_choice_buttons(game_state)
+
+    await ctx.send(
+        f"🏳️ **SURRENDER!**\n\n😔 **{ctx.author.mention} menyerah dari Russian Roulette**\n💸 **Penalty:** {penalty} uang (50% taruhan)\n💵 **Saldo baru:** {balance}\n\n🤖 *\"Keputusan yang bijak... atau pengecut?\"*"
+    )
+
+
+@bot.command(name='pvp')
+async def pvp_(ctx, bet: str = None):
+    """⚔️ Roulette PvP - cari lawan dengan taruhan serupa (`!pvp batal` untuk keluar antrean)"""
+    if ctx.guild is None:
+        await ctx.send("❌ **Roulette PvP hanya bisa dimainkan di server!**")
+        return
+    queue = pvp_queues.setdefault(ctx.guild.id, pvp.MatchQueue(PVP_TOLERANCE))
+    if bet == 'batal':
+        if queue.leave(ctx.author.id):
+            await game_registry.release(f"pvp:{ctx.author.id}")
+            await ctx.send("🚪 **Keluar dari antrean PvP.**")
+        else:
+            await ctx.send("❌ **Kamu tidak sedang di antrean PvP!**")
+        return
+    if bet is None or not bet.isdigit() or int(bet) <= 0:
+        await ctx.send(
+            f"⚔️ **ROULETTE PvP**\n❌ **Error:** Masukkan taruhan!\n📝 **Contoh:** `!pvp 100`\n\n🎮 **Aturan:**\n🤝 Dipasangkan dengan user lain yang taruhannya mirip (±{PVP_TOLERANCE:.0%})\n🔒 Taruhan kedua pemain ditahan sampai duel selesai\n❤️ **3 nyawa per ronde**, menang 2 dari 3 ronde\n🏆 **Pemenang mengambil seluruh pot**\n⏰ **{PVP_TURN_TIMEOUT:.0f} detik per giliran**, lewat = kalah"
+        )
+        return
+    bet = int(bet)
+    if ctx.author.id in queue or duels.for_player(ctx.author.id) is not None:
+        await ctx.send("❌ **Kamu sudah di antrean atau sedang duel!**\n🚪 **Keluar antrean:** `!pvp batal`")
+        return
+    tour = tournaments.get(ctx.guild.id)
+    if tour is not None and tour.alive(ctx.author.id):
+        await ctx.send("❌ **Kamu masih ikut turnamen!** Selesaikan dulu turnamennya.")
+        return
+    balance, _ = await get_user(ctx.author.id)
+    if balance < bet:
+        await ctx.send(f"💸 **Saldo tidak cukup!** Butuh {bet} tapi hanya punya {balance} uang.")
+        return
+    # Klaim lintas shard: satu antrean/duel PvP per user di semua server
+    if not await game_registry.claim(f"pvp:{ctx.author.id}"):
+        await ctx.send("❌ **Kamu sudah di antrean atau sedang duel PvP di server lain!**")
+        return
+
+    match = queue.join(ctx.author.id, bet, ctx)
+    if match is None:
+        await ctx.send(
+            f"⏳ **Mencari lawan...** {ctx.author.mention} • Taruhan: {bet} uang (±{PVP_TOLERANCE:.0%})\n🚪 **Batal:** `!pvp batal`"
+        )
+        return
+    await start_duel(ctx, bet, *match)
+
+
+async def start_duel(ctx, bet, opponent_id, opponent_bet, opponent_ctx):
+    players = (opponent_id, ctx.author.id)
+    stake = min(bet, opponent_bet)
+    # Escrow: taruhan kedua pemain dipotong dalam satu transaksi, atau tidak sama sekali
+    if await adjust_balances([(player, -stake) for player in players]) is None:
+        for player in players:
+            await game_registry.release(f"pvp:{player}")
+        text = "💸 **Duel batal!** Saldo salah satu pemain sudah tidak cukup. Coba `!pvp` lagi."
+        await ctx.send(text)
+        if opponent_ctx.channel.id != ctx.channel.id:
+            await opponent_ctx.send(text)
+        return
+
+    duel = pvp.Duel(players, stake)
+    duel.guild_id = ctx.guild.id
+    duels.add(duel)
+    duel.message = await ctx.send(duel_content(duel), view=duel_choice_view(duel.game_id))
+    if opponent_ctx.channel.id != ctx.channel.id:
+        await opponent_ctx.send(
+            f"⚔️ <@{opponent_id}> **lawan ditemukan!** Duel berjalan di {ctx.channel.mention}")
+    schedule_duel_timeout(duel)
+
+
+def duel_content(duel, note=None, balance=None):
+    """Isi pesan duel; pesan yang sama diedit setiap tembakan"""
+    first, second = duel.players
+    if duel.tournament is None:
+        header = f"⚔️ **ROULETTE PvP** • <@{first}> vs <@{second}> • Pot: {2 * duel.stake} uang"
+    else:
+        header = f"🏟️ **TURNAMEN** • {tournament_label(duel)} • <@{first}> vs <@{second}>"
+    lines = [
+        header,
+        f"🔥 **Ronde {duel.round}/{duel.max_rounds}** • Skor: {duel.wins[first]} - {duel.wins[second]}",
+    ]
+    if note:
+        lines.append(note)
+    if duel.finished and duel.tournament is not None:
+        lines.append(f"🏆 <@{duel.winner}> **MENANG dan lolos!**")
+    elif duel.finished:
+        lines.append(f"🏆 <@{duel.winner}> **MENANG!** +{2 * duel.stake} uang • Saldo: {balance}")
+    else:
+        lines.append(f"❤️ <@{first}>: {duel.lives[first]} | <@{second}>: {duel.lives[second]}")
+        lines.append(f"🔫 **Chamber {duel.chamber % len(duel.revolver) + 1}/{len(duel.revolver)}**")
+        lines.append(f"🎯 **Giliran <@{duel.turn}>** • ⏰ {PVP_TURN_TIMEOUT:.0f} detik")
+    return "\n".join(lines)
+
+
+class DuelChoiceButton(discord.ui.DynamicItem[discord.ui.Button],
+                       template=r'pvp:(?P<action>kepala|lawan):(?P<game_id>[0-9a-f]+)'):
+    """Tombol Kepala/Lawan untuk duel PvP; custom_id membawa game_id seperti RouletteChoiceButton"""
+
+    def __init__(self, action, game_id):
+        label, emoji, style = {
+            'kepala': ("Kepala", "🎯", discord.ButtonStyle.danger),
+            'lawan': ("Lawan", "🔫", discord.ButtonStyle.primary),
+        }[action]
+        super().__init__(discord.ui.Button(label=label, emoji=emoji, style=style,
+                                           custom_id=f"pvp:{action}:{game_id}"))
+        self.action = action
+        self.game_id = game_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(match['action'], match['game_id'])
+
+    async def callback(self, interaction):
+        await duel_button(interaction, self.game_id, self.action)
+
+
+def duel_choice_view(game_id):
+    view = discord.ui.View(timeout=None)
+    view.add_item(DuelChoiceButton('kepala', game_id))
+    view.add_item(DuelChoiceButton('lawan', game_id))
+    return view
+
+
+def take_duel_shot(duel, user_id, shoot_self):
+    """Tembakan satu pemain; (error, None) atau (None, catatan tembakan)
+
+    Sinkron seperti take_player_turn, jadi dua input bersamaan tidak sama-sama lolos.
+    """
+    if duel.finished or user_id != duel.turn:
+        return "❌ **Bukan giliran kamu!**", None
+    wins = dict(duel.wins)
+    is_bullet, target = duel.shoot(user_id, shoot_self)
+    victim = "kepala sendiri" if shoot_self else f"<@{target}>"
+    if is_bullet:
+        note = f"💥 <@{user_id}> menembak {victim}... **DOR!** -1 nyawa"
+    elif shoot_self:
+        note = f"😮‍💨 <@{user_id}> menembak {victim}... *klik* kosong! **Giliran tambahan!**"
+    else:
+        note = f"🔫 <@{user_id}> menembak {victim}... *klik* kosong"
+    round_winner = next((player for player in duel.players if duel.wins[player] > wins[player]), None)
+    if round_winner is not None:
+        note += f"\n🏁 **Ronde dimenangkan <@{round_winner}>!**"
+        if not duel.finished:
+            note += " 🔄 Revolver diisi ulang, nyawa kembali 3."
+    return None, note
+
+
+async def duel_button(interaction, game_id, action):
+    current_guild.set(interaction.guild_id or 0)
+    duel = duels.get(game_id)
+    if duel is None:
+        await interaction.response.send_message("❌ **Duel ini sudah selesai!**", ephemeral=True)
+        return
+    if interaction.user.id not in duel.players:
+        await interaction.response.send_message("❌ **Ini bukan duel kamu!** Cari lawan dengan `!pvp`.", ephemeral=True)
+        return
+    error, note = take_duel_shot(duel, interaction.user.id, action == 'kepala')
+    if error:
+        await interaction.response.send_message(error, ephemeral=True)
+        return
+    if duel.finished:
+        await interaction.response.defer()
+        await settle_duel(duel, note)
+        return
+    schedule_duel_timeout(duel)
+    await interaction.response.edit_message(content=duel_content(duel, note), view=duel_choice_view(game_id))
+
+
+async def duel_command(ctx, duel, shoot_self):
+    """!kepala / !lawan saat sedang duel PvP"""
+    error, note = take_duel_shot(duel, ctx.author.id, shoot_self)
+    if error:
+        await ctx.send(error)
+        return
+    if duel.finished:
+        await settle_duel(duel, note)
+        return
+    schedule_duel_timeout(duel)
+    try:
+        await duel.message.edit(content=duel_content(duel, note), view=duel_choice_view(duel.game_id))
+    except discord.HTTPException:
+        pass
+
+
+def schedule_duel_timeout(duel):
+    async def job():
+        if duels.get(duel.game_id) is duel and not duel.finished:
+            loser = duel.turn
+            duel.forfeit(loser)
+            await settle_duel(duel, f"⏰ <@{loser}> **kehabisan waktu!**")
+    scheduler.schedule(('pvp', duel.game_id), time.time() + PVP_TURN_TIMEOUT, job)
+
+
+async def settle_duel(duel, note):
+    """Bayar pot ke pemenang; taruhan kedua pemain sudah di-escrow saat duel dimulai"""
+    if not duels.remove(duel):
+        return  # sudah diselesaikan jalur lain
+    scheduler.cancel(('pvp', duel.game_id))
+    if duel.tournament is not None:
+        await finish_tournament_match(duel, note)
+        return
+    loser = duel.opponent(duel.winner)
+    # Seluruh pot dikredit dalam satu UPDATE, jadi tidak ada pembayaran setengah jalan
+    with in_guild(duel.guild_id):  # timeout datang dari scheduler, bukan dari interaksi guild ini
+        balance = await adjust_balance(duel.winner, 2 * duel.stake)
+    bus.publish(events.BetSettled(duel.winner, "roulette", duel.stake, duel.stake))
+    bus.publish(events.BetSettled(loser, "roulette", duel.stake, -duel.stake))
+    for player in duel.players:
+        await game_registry.release(f"pvp:{player}")
+    try:
+        await duel.message.edit(content=duel_content(duel, note, balance), view=None)
+    except discord.HTTPException:
+        pass
+
+
+async def close_roulette():
+    """Kembalikan taruhan roulette yang belum selesai saat bot shutdown"""
+    for game_state in list(active_games.values()):
+        del active_games[game_state['player_id']]
+        roulette_games.pop(game_state['game_id'], None)
+        with in_guild(game_state['guild_id']):
+            await adjust_balance(game_state['player_id'], game_state['bet'])
+        await game_registry.release(f"roulette:{game_state['player_id']}")
+
+
+async def close_duels():
+    """Kembalikan taruhan duel yang belum selesai saat bot shutdown"""
+    for duel in duels:
+        duels.remove(duel)
+        if duel.tournament is not None:
+            # Bracket tersimpan; match ini dimulai ulang saat bot kembali
+            try:
+                await duel.message.edit(content=f"🏟️ **TURNAMEN** • {tournament_label(duel)}\n"
+                                                f"🔌 **Bot restart!** Match ini akan dimulai ulang.", view=None)
+            except discord.HTTPException:
+                pass
+            continue
+        with in_guild(duel.guild_id):
+            await adjust_balances([(player, duel.stake) for player in duel.players], allow_negative=True)
+        for player in duel.players:
+            await game_registry.release(f"pvp:{player}")
+        try:
+            await duel.message.edit(
+                content=f"⚔️ **ROULETTE PvP** • <@{duel.players[0]}> vs <@{duel.players[1]}>\n"
+                        f"🔌 **Bot restart!** Duel dibatalkan, taruhan {duel.stake} uang dikembalikan ke kedua pemain.",
+                view=None)
+        except discord.HTTPException:
+            pass
+
+
+TOURNAMENT_HELP = (
+    "🏟️ **TURNAMEN ROULETTE**\n"
+    "📝 **Organizer** (Manage Server):\n"
+    "`!turnamen buat <biaya> [maks_peserta] [menit]` - buka pendaftaran\n"
+    "`!turnamen mulai` - mulai sekarang • `!turnamen batal` - batalkan (biaya dikembalikan)\n"
+    "👤 **Peserta:** `!turnamen daftar` • `!turnamen keluar` • `!turnamen` - lihat bracket\n\n"
+    "🎮 Bracket gugur; semua match satu ronde berjalan bersamaan dengan tombol Kepala/Lawan\n"
+    f"⏰ {PVP_TURN_TIMEOUT:.0f} detik per giliran, lewat = kalah\n"
+    "💰 Hadiah dari pot biaya masuk: juara 60%, finalis 25%, semifinalis 15% (dibagi)"
+)
+
+
+def find_tournament(tournament_id):
+    # Turnamen aktif paling banyak satu per guild, jadi scan ini kecil
+    return next((tour for tour in tournaments.values() if tour.tournament_id == tournament_id), None)
+
+
+def tournament_label(duel):
+    tournament_id, round_index, match_index = duel.tournament
+    tour = find_tournament(tournament_id)
+    name = tournament.round_name(round_index, tour.total_rounds) if tour else "Turnamen"
+    return f"{name} • Match {match_index + 1}"
+
+
+def can_organize(member):
+    return member.id == OWNER_ID or member.guild_permissions.manage_guild
+
+
+def tournament_status(tour):
+    lines = [f"🏟️ **TURNAMEN ROULETTE** • Biaya: {tour.entry_fee} uang • Pot: {tour.pool} uang"]
+    if tour.status == 'signup':
+        lines.append(f"📝 **Pendaftaran:** {len(tour.players)}/{tour.max_players} peserta • "
+                     f"mulai <t:{int(tour.starts_at)}:R>")
+        lines.append("✍️ **Daftar:** `!turnamen daftar`")
+        return "\n".join(lines)
+    matches = tour.rounds[-1]
+    done = sum(1 for match in matches if match[2] is not None)
+    lines.append(f"🔥 **{tournament.round_name(len(tour.rounds) - 1, tour.total_rounds)}** • "
+                 f"{done}/{len(matches)} match selesai")
+    pending = tour.pending()
+    for _, index, a, b in pending[:15]:
+        lines.append(f"⚔️ Match {index + 1}: <@{a}> vs <@{b}>")
+    if len(pending) > 15:
+        lines.append(f"... dan {len(pending) - 15} match lain")
+    return "\n".join(lines)
+
+
+@bot.command()
+async def turnamen(ctx, action: str = None, entry_fee: int = None, max_players: int = None, minutes: int = None):
+    """🏟️ Turnamen roulette - buat, daftar, keluar, mulai, batal atau lihat bracket"""
+    if ctx.guild is None:
+        await ctx.send("❌ **Turnamen hanya bisa di server!**")
+        return
+    tour = tournaments.get(ctx.guild.id)
+
+    if action == 'buat':
+        if not can_organize(ctx.author):
+            await ctx.send("🔒 **Akses ditolak!** Butuh permission Manage Server.")
+            return
+        if tour is not None:
+            await ctx.send("❌ **Masih ada turnamen aktif di server ini!**")
+            return
+        max_players = max_players or TOURNAMENT_MAX_PLAYERS
+        minutes = TOURNAMENT_SIGNUP_MINUTES if minutes is None else minutes
+        if entry_fee is None or entry_fee < 0 or not 2 <= max_players <= TOURNAMENT_MAX_PLAYERS or minutes < 0:
+            await ctx.send(f"📝 **Contoh:** `!turnamen buat 100 64 15` "
+                           f"(biaya, maks peserta 2-{TOURNAMENT_MAX_PLAYERS}, menit pendaftaran)")
+            return
+        tour = tournament.Tournament(os.urandom(6).hex(), ctx.guild.id, ctx.channel.id, entry_fee,
+                                     max_players, time.time() + minutes * 60, ctx.author.id)
+        tournaments[ctx.guild.id] = tour
+        await save_tournament(tour)
+        schedule_tournament_start(tour)
+        await ctx.send(
+            f"🏟️ **TURNAMEN ROULETTE DIBUKA!**\n💰 **Biaya masuk:** {entry_fee} uang (masuk pot hadiah)\n"
+            f"👥 **Maks peserta:** {max_players}\n⏰ **Mulai:** <t:{int(tour.starts_at)}:R> atau saat penuh\n"
+            f"✍️ **Daftar:** `!turnamen daftar`")
+        return
+
+    if tour is None:
+        await ctx.send(TOURNAMENT_HELP)
+        return
+
+    if action == 'daftar':
+        await join_tournament(ctx, tour)
+    elif action == 'keluar':
+        if not tour.leave(ctx.author.id):
+            await ctx.send("❌ **Kamu tidak terdaftar, atau turnamen sudah dimulai!**")
+            return
+        balance = await adjust_balance(ctx.author.id, tour.entry_fee)
+        await save_tournament(tour)
+        await ctx.send(f"🚪 **Keluar dari turnamen.** Biaya {tour.entry_fee} uang dikembalikan • Saldo: {balance}")
+    elif action in ('mulai', 'batal'):
+        if not (can_organize(ctx.author) or ctx.author.id == tour.organizer_id):
+            await ctx.send("🔒 **Akses ditolak!** Hanya organizer turnamen.")
+            return
+        if action == 'mulai':
+            if tour.status != 'signup':
+                await ctx.send("❌ **Turnamen sudah berjalan!**")
+                return
+            await start_tournament(tour)
+        else:
+            await cancel_tournament(tour, f"dibatalkan oleh {ctx.author.mention}")
+    else:
+        await ctx.send(tournament_status(tour))
+
+
+async def join_tournament(ctx, tour):
+    user_id = ctx.author.id
+    if tour.status != 'signup':
+        await ctx.send("❌ **Pendaftaran sudah ditutup!**")
+        return
+    if user_id in tour.players:
+        await ctx.send("❌ **Kamu sudah terdaftar!**")
+        return
+    if len(tour.players) >= tour.max_players:
+        await ctx.send("🚫 **Turnamen sudah penuh!**")
+        return
+    queue = pvp_queues.get(ctx.guild.id)
+    if duels.for_player(user_id) is not None or (queue is not None and user_id in queue):
+        await ctx.send("❌ **Selesaikan duel PvP / keluar antrean dulu** (`!pvp batal`)")
+        return
+    await get_user(user_id)  # pastikan row user ada
+    # Biaya masuk ditahan sekarang dan masuk pot; dikembalikan kalau keluar atau batal
+    if await adjust_balance(user_id, -tour.entry_fee, allow_negative=False) is None:
+        await ctx.send(f"💸 **Saldo tidak cukup!** Biaya masuk {tour.entry_fee} uang.")
+        return
+    if not tour.join(user_id):  # penuh/dimulai selagi saldo dipotong
+        await adjust_balance(user_id, tour.entry_fee)
+        await ctx.send("🚫 **Pendaftaran sudah penuh atau ditutup!** Biaya dikembalikan.")
+        return
+    await save_tournament(tour)
+    await ctx.send(f"✅ {ctx.author.mention} **terdaftar!** ({len(tour.players)}/{tour.max_players}) • "
+                   f"Pot: {tour.pool} uang")
+    if len(tour.players) >= tour.max_players:
+        await start_tournament(tour)
+
+
+def schedule_tournament_start(tour):
+    async def job():
+        await bot.wait_until_ready()
+        await start_tournament(tour)
+    scheduler.schedule(('tournament', tour.tournament_id), tour.starts_at, job)
+
+
+async def start_tournament(tour):
+    if tour.status != 'signup' or tournaments.get(tour.guild_id) is not tour:
+        return
+    scheduler.cancel(('tournament', tour.tournament_id))
+    if len(tour.players) < 2:
+        await cancel_tournament(tour, "peserta kurang dari 2")
+        return
+    tour.start()
+    await save_tournament(tour)
+    channel = bot.get_channel(tour.channel_id)
+    if channel is not None:
+        await channel.send(f"🏟️ **TURNAMEN DIMULAI!** {len(tour.players)} peserta • "
+                           f"{tour.total_rounds} ronde • Pot: {tour.pool} uang")
+    await start_tournament_round(tour)
+
+
+async def start_tournament_round(tour):
+    """Buka semua match ronde sekarang sekaligus; giliran dan timeout lewat scheduler bersama"""
+    channel = bot.get_channel(tour.channel_id)
+    if channel is None:
+        log.warning("Channel turnamen %s tidak ditemukan", tour.channel_id)
+        return
+    pending = tour.pending()
+    await channel.send(f"🔥 **{tournament.round_name(len(tour.rounds) - 1, tour.total_rounds)}** • "
+                       f"{len(pending)} match berjalan bersamaan!")
+    for round_index, match_index, a, b in pending:
+        duel = pvp.Duel((a, b), 0)
+        duel.guild_id = tour.guild_id
+        duel.tournament = (tour.tournament_id, round_index, match_index)
+        duels.add(duel)
+        duel.message = await channel.send(duel_content(duel), view=duel_choice_view(duel.game_id))
+        schedule_duel_timeout(duel)
+
+
+async def resume_tournament(tour):
+    await bot.wait_until_ready()
+    if tour.status == 'finished':
+        await award_tournament(tour)
+    elif tour.status == 'cancelled':
+        await refund_tournament(tour)
+    else:
+        await start_tournament_round(tour)
+
+
+async def finish_tournament_match(duel, note):
+    try:
+        await duel.message.edit(content=duel_content(duel, note), view=None)
+    except discord.HTTPException:
+        pass
+    tournament_id, round_index, match_index = duel.tournament
+    tour = find_tournament(tournament_id)
+    if tour is None or not tour.report(round_index, match_index, duel.winner):
+        return
+    await save_tournament(tour)
+    if tour.status == 'finished':
+        await award_tournament(tour)
+    elif len(tour.rounds) - 1 > round_index:
+        await start_tournament_round(tour)
+
+
+async def settle_tournament(tour, deltas):
+    """Bayar hadiah/refund turnamen tepat sekali, lalu simpan turnamen sebagai tidak aktif
+
+    State selesai/batal sudah tersimpan (masih aktif) sebelum ini dipanggil.
+    Kalau bot crash di tengah, resume_tournament memanggil ini lagi; key
+    `once` mencegah pembayaran ganda.
+    """
+    if deltas:
+        with in_guild(tour.guild_id):
+            await adjust_balances(deltas, allow_negative=True, once=f"tournament:{tour.tournament_id}")
+    await save_tournament(tour, settled=True)
+
+
+async def award_tournament(tour):
+    tournaments.pop(tour.guild_id, None)
+    prizes = tour.prizes()
+    # Semua hadiah dalam satu transaksi
+    await settle_tournament(tour, [(user_id, amount) for user_id, amount in prizes.items() if amount])
+    lines = [f"🏆 **JUARA TURNAMEN: <@{tour.champion}>!** 🎉"]
+    for user_id, amount in sorted(prizes.items(), key=lambda item: -item[1]):
+        lines.append(f"💰 <@{user_id}>: +{amount} uang")
+    channel = bot.get_channel(tour.channel_id)
+    if channel is not None:
+        await channel.send("\n".join(lines))
+
+
+async def cancel_tournament(tour, reason):
+    """Batalkan turnamen (pendaftaran atau berjalan) dan kembalikan semua biaya masuk"""
+    tournaments.pop(tour.guild_id, None)
+    scheduler.cancel(('tournament', tour.tournament_id))
+    tour.status = 'cancelled'
+    for duel in duels:
+        if duel.tournament is not None and duel.tournament[0] == tour.tournament_id:
+            duels.remove(duel)
+            scheduler.cancel(('pvp', duel.game_id))
+            try:
+                await duel.message.edit(content="🏟️ **Turnamen dibatalkan.**", view=None)
+            except discord.HTTPException:
+                pass
+    await save_tournament(tour)
+    await refund_tournament(tour, reason)
+
+
+async def refund_tournament(tour, reason=None):
+    deltas = [(user_id, tour.entry_fee) for user_id in tour.players] if tour.entry_fee else []
+    await settle_tournament(tour, deltas)
+    channel = bot.get_channel(tour.channel_id)
+    if channel is not None:
+        reason = f" ({reason})" if reason else ""
+        await channel.send(f"🏟️ **Turnamen dibatalkan**{reason}. "
+                           f"Biaya masuk {tour.entry_fee} uang dikembalikan ke {len(tour.players)} peserta.")
+
+
+@bot.tree.command(name="ping", description="Test bot responsif")
+async def ping_slash(interaction: discord.Interaction):
+    latency = round(bot.latency * 1000)
+    await interaction.response.send_message(f"🏓 Pong! Latency: {latency}ms\nBot online dan berfungsi!")
+
+
+@bot.tree.command(name="balance", description="Cek saldo kamu")
+async def balance_slash(interaction: discord.Interaction):
+    user_id = interaction.user.id
+    balance, vip = await get_user(user_id)
+    vip_status = "💎 VIP" if vip else "👤 Regular"
+    await interaction.response.send_message(
+        f"💰 **Saldo {interaction.user.mention}:** {balance} uang\n🏆 **Status:** {vip_status}")
+
+
+@bot.tree.command(name="help", description="Menampilkan daftar command dan panduan penggunaan bot.")
+async def help_slash(interaction: discord.Interaction):
+    await interaction.response.send_message(help_text())
+
+
+def help_text():
+    """Daftar command dibangun dari command tree dan prefix command, jadi selalu sama dengan yang terdaftar"""
+    lines = ["**Panduan Bot Alpha D**", ""]
+    slash_names = set()
+    for command in bot.tree.get_commands():
+        slash_names.add(command.name)
+        params = "".join(f" [{param.name}]" for param in command.parameters)
+        lines.append(f"/{command.name}{params} - {command.description}")
+    lines.append("")
+    for command in sorted(bot.commands, key=lambda command: command.name):
+        if command.name not in slash_names and not command.hidden:
+            # Docstring prefix command sudah memuat contoh pemakaian setelah " - "
+            lines.append(f"!{command.name} - {command.short_doc.split(' - ')[0]}")
+    lines += ["", "Command bertanda `!` hanya tersedia sebagai prefix command."]
+    return "\n".join(lines)
+
+
+# Command ekonomi: defer dulu sebelum kerja DB supaya tidak lewat batas ack
+# 3 detik Discord, lalu balas lewat followup dengan logika yang sama seperti prefix
+@bot.tree.command(name="cari", description="Cari barang di tong sampah")
+async def cari_slash(interaction: discord.Interaction):
+    await interaction.response.defer()
+    await interaction.followup.send(await cari_response(interaction.user))
+
+
+@bot.tree.command(name="inventori", description="Lihat inventori kamu")
+async def inventori_slash(interaction: discord.Interaction):
+    await interaction.response.defer()
+    await interaction.followup.send(await inventori_response(interaction.user))
+
+
+async def item_name_autocomplete(interaction: discord.Interaction, current: str):
+    """Saran nama barang dari cache; SQLite hanya disentuh sekali saat cache miss"""
+    names = item_names.suggest(item_key(interaction.user.id), current)
+    if names is None:
+        try:
+            # shield: kalau timeout, load tetap selesai dan mengisi cache untuk ketikan berikutnya
+            await asyncio.wait_for(asyncio.shield(get_inventory(interaction.user.id)),
+                                   AUTOCOMPLETE_LOAD_TIMEOUT)
+        except asyncio.TimeoutError:
+            return []
+        names = item_names.suggest(item_key(interaction.user.id), current) or []
+    return [app_commands.Choice(name=name[:100], value=name) for name in names]
+
+
+@bot.tree.command(name="sell", description="Jual barang dari inventori")
+@app_commands.describe(barang="Nama barang yang akan dijual")
+@app_commands.autocomplete(barang=item_name_autocomplete)
+async def sell_slash(interaction: discord.Interaction, barang: str):
+    await interaction.response.defer()
+    await interaction.followup.send(await sell_response(interaction.user, barang))
+
+
+@bot.tree.command(name="give", description="Beri barang dari inventori ke user lain")
+@app_commands.describe(user="User penerima", barang="Nama barang yang akan diberikan")
+@app_commands.autocomplete(barang=item_name_autocomplete)
+async def give_slash(interaction: discord.Interaction, user: discord.Member, barang: str):
+    await interaction.response.defer()
+    await interaction.followup.send(await give_response(interaction.user, user, barang))
+
+
+@bot.tree.command(name="jualall", description="Jual semua barang di inventori")
+async def jualall_slash(interaction: discord.Interaction):
+    await interaction.response.defer()
+    await interaction.followup.send(await jualall_response(interaction.user))
+
+
+@bot.tree.command(name="transfer", description="Transfer uang ke user lain.")
+@app_commands.describe(user="User tujuan", jumlah="Jumlah uang yang akan dikirim")
+async def transfer_slash(interaction: discord.Interaction, user: discord.Member, jumlah: int):
+    if user.bot:
+        await interaction.response.send_message("❌ Tidak bisa transfer ke bot!", ephemeral=True)
+        return
+    if user.id == interaction.user.id:
+        await interaction.response.send_message("❌ Tidak bisa transfer ke diri sendiri!", ephemeral=True)
+        return
+    if jumlah <= 0:
+        await interaction.response.send_message("❌ Jumlah harus lebih dari 0!", ephemeral=True)
+        return
+    balance, _ = await get_user(interaction.user.id)
+    if balance < jumlah:
+        await interaction.response.send_message(f"❌ Saldo tidak cukup! Kamu punya {balance} uang.", ephemeral=True)
+        return
+    await get_user(user.id)  # pastikan row penerima ada
+    if await transfer_balance(interaction.user.id, user.id, jumlah) is None:
+        await interaction.response.send_message("❌ Saldo tidak cukup!", ephemeral=True)
+        return
+    bus.publish(events.Transfer(interaction.user.id, user.id, jumlah))
+    await interaction.response.send_message(f"✅ {interaction.user.mention} mengirim {jumlah} uang ke {user.mention}!", ephemeral=False)
+
+BLACKJACK_RESULTS = {
+    'blackjack': "🎉 **BLACKJACK!** +{payout} uang",
+    'win': "✅ **MENANG!** +{payout} uang",
+    'push': "🤝 **SERI!** Taruhan dikembalikan",
+    'lose': "❌ **KALAH!** {payout} uang",
+}
+
+
+def blackjack_content(user_id, hand, balance=None, note=None):
+    """Isi satu pesan blackjack; pesan yang sama diedit setiap aksi"""
+    lines = [f"🃏 **BLACKJACK** • <@{user_id}> • Taruhan: {hand.bet} uang{' (double)' if hand.doubled else ''}"]
+    if hand.finished:
+        lines.append(f"🎩 **Dealer:** {blackjack.hand_str(hand.dealer)}")
+    else:
+        lines.append(f"🎩 **Dealer:** {poker.card_str(hand.dealer[0])} 🂠")
+    lines.append(f"👤 **Kamu:** {blackjack.hand_str(hand.player)}")
+    if note:
+        lines.append(note)
+    if hand.finished:
+        lines.append(BLACKJACK_RESULTS[hand.outcome].format(payout=hand.payout) + f" • Saldo: {balance}")
+    else:
+        lines.append(f"💡 **Saran basic strategy:** {blackjack.ACTION_NAMES[hand.hint()]}")
+    return "\n".join(lines)
+
+
+class BlackjackView(discord.ui.View):
+    """Tombol hit/stand/double untuk satu tangan; idle diurus scheduler, bukan timeout View"""
+
+    def __init__(self, user_id, hand, guild_id=0):
+        super().__init__(timeout=None)
+        self.user_id = user_id
+        self.hand = hand
+        self.guild_id = guild_id  # ekonomi tempat taruhan di-escrow
+        self.message = None
+        # Klik beruntun datang sebagai task terpisah; aksi satu tangan harus berurutan
+        self.lock = asyncio.Lock()
+
+    async def interaction_check(self, interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                "❌ Ini bukan meja kamu! Main sendiri dengan `/gambling blackjack`.", ephemeral=True)
+            return False
+        current_guild.set(self.guild_id)
+        return True
+
+    @discord.ui.button(label="Hit", style=discord.ButtonStyle.primary)
+    async def hit_button(self, interaction, button):
+        await blackjack_action(interaction, self, 'hit')
+
+    @discord.ui.button(label="Stand", style=discord.ButtonStyle.secondary)
+    async def stand_button(self, interaction, button):
+        await blackjack_action(interaction, self, 'stand')
+
+    @discord.ui.button(label="Double", style=discord.ButtonStyle.success)
+    async def double_button(self, interaction, button):
+        await blackjack_action(interaction, self, 'double')
+
+
+async def settle_blackjack(user_id, hand):
+    """Bayar tangan yang sudah selesai; taruhan sudah dipotong di awal (escrow)"""
+    blackjack_hands.pop(user_id)
+    scheduler.cancel(('blackjack', user_id))
+    credit = hand.bet + hand.payout  # kalah = 0
+    if credit:
+        balance = await adjust_balance(user_id, credit)
+    else:
+        balance, _ = await get_user(user_id)
+    bus.publish(events.BetSettled(user_id, "blackjack", hand.bet, hand.payout))
+    await game_registry.release(f"blackjack:{user_id}")
+    return balance
+
+
+def schedule_blackjack_expiry(user_id):
+    scheduler.schedule(('blackjack', user_id), blackjack_hands.deadline(user_id), expire_blackjack)
+
+
+async def finish_blackjack(view, note):
+    """Stand otomatis lalu bayar (tangan idle atau bot shutdown)"""
+    async with view.lock:
+        if view.hand.finished:
+            return
+        view.hand.stand()
+        with in_guild(view.guild_id):
+            balance = await settle_blackjack(view.user_id, view.hand)
+        view.stop()
+        if view.message is not None:
+            try:
+                await view.message.edit(content=blackjack_content(view.user_id, view.hand, balance, note), view=None)
+            except discord.HTTPException:
+                pass
+
+
+async def expire_blackjack():
+    for user_id, view in blackjack_hands.expired():
+        await finish_blackjack(view, "⏰ **Waktu habis!** Otomatis stand.")
+
+
+async def close_blackjack():
+    for view in blackjack_hands.values():
+        await finish_blackjack(view, "🔌 **Bot restart!** Otomatis stand.")
+
+
+async def start_blackjack(interaction, bet):
+    user_id = interaction.user.id
+    if user_id in blackjack_hands or not await game_registry.claim(f"blackjack:{user_id}"):
+        await interaction.response.send_message("❌ **Selesaikan dulu tangan blackjack kamu!**", ephemeral=True)
+        return
+    if len(blackjack_hands) >= blackjack_hands.max_sessions:
+        await game_registry.release(f"blackjack:{user_id}")
+        await interaction.response.send_message("🚫 **Meja blackjack penuh!** Coba lagi sebentar lagi.", ephemeral=True)
+        return
+    # Escrow: taruhan dipotong sekarang, dibayar balik saat tangan selesai
+    if await adjust_balance(user_id, -bet, allow_negative=False) is None:
+        await game_registry.release(f"blackjack:{user_id}")
+        await interaction.response.send_message("❌ Saldo tidak cukup!", ephemeral=True)
+        return
+
+    hand = blackjack.Hand(blackjack_shoe, bet, blackjack_rules)
+    if hand.finished:  # blackjack langsung di pembagian pertama
+        balance = await settle_blackjack(user_id, hand)
+        await interaction.response.send_message(blackjack_content(user_id, hand, balance))
+        return
+    view = BlackjackView(user_id, hand, interaction.guild_id or 0)
+    blackjack_hands.add(user_id, view)
+    await interaction.response.send_message(blackjack_content(user_id, hand), view=view)
+    view.message = await interaction.original_response()
+    schedule_blackjack_expiry(user_id)
+
+
+async def blackjack_action(interaction, view, action):
+    async with view.lock:
+        hand = view.hand
+        if hand.finished:
+            await interaction.response.send_message("❌ Tangan ini sudah selesai.", ephemeral=True)
+            return
+        blackjack_hands.get(view.user_id)  # catat aksi terakhir untuk idle timeout
+        if action == 'double':
+            if not hand.can_double:
+                await interaction.response.send_message("❌ Double hanya bisa di dua kartu pertama!", ephemeral=True)
+                return
+            if await adjust_balance(view.user_id, -hand.bet, allow_negative=False) is None:
+                await interaction.response.send_message("💸 Saldo tidak cukup untuk double!", ephemeral=True)
+                return
+            hand.double()
+        elif action == 'hit':
+            hand.hit()
+        else:
+            hand.stand()
+
+        if hand.finished:
+            balance = await settle_blackjack(view.user_id, hand)
+            view.stop()
+            await interaction.response.edit_message(content=blackjack_content(view.user_id, hand, balance), view=None)
+        else:
+            schedule_blackjack_expiry(view.user_id)
+            view.double_button.disabled = not hand.can_double
+            await interaction.response.edit_message(content=blackjack_content(view.user_id, hand), view=view)
+
+
+@bot.tree.command(name="gambling", description="Main gambling melawan agen bot.")
+@app_commands.describe(game="Pilih game: rolet, blackjack, poker, poker5", jumlah="Jumlah taruhan")
+async def gambling_slash(interaction: discord.Interaction, game: str, jumlah: int):
+    game = game.lower()
+    if game not in ["rolet", "blackjack", "poker", "poker5"]:
+        await interaction.response.send_message("❌ Game tidak tersedia! Pilih: rolet, blackjack, poker, poker5.", ephemeral=True)
+        return
+    if jumlah <= 0:
+        await interaction.response.send_message("❌ Jumlah taruhan harus lebih dari 0!", ephemeral=True)
+        return
+    balance, vip = await get_user(interaction.user.id)
+    if balance < jumlah:
+        await interaction.response.send_message(f"❌ Saldo tidak cukup! Kamu punya {balance} uang.", ephemeral=True)
+        return
+    if game != "blackjack":
+        # Taruhan dipotong dulu secara atomik, lalu dibayar balik sesuai hasil
+        balance = await adjust_balance(interaction.user.id, -jumlah, allow_negative=False)
+        if balance is None:
+            await interaction.response.send_message("❌ Saldo tidak cukup!", ephemeral=True)
+            return
+    # Rolet
+    if game == "rolet":
+        menang = random.choice([True, False])
+        if menang:
+            balance = await adjust_balance(interaction.user.id, 2 * jumlah)
+            bus.publish(events.BetSettled(interaction.user.id, game, jumlah, jumlah))
+            await interaction.response.send_message(f"🎲 **ROLET**: Kamu MENANG! +{jumlah} uang. Saldo sekarang: {balance}")
+        else:
+            bus.publish(events.BetSettled(interaction.user.id, game, jumlah, -jumlah))
+            await interaction.response.send_message(f"🎲 **ROLET**: Kamu KALAH! -{jumlah} uang. Saldo sekarang: {balance}")
+    # Blackjack
+    elif game == "blackjack":
+        await start_blackjack(interaction, jumlah)
+    # Poker: hold'em (2 kartu + 5 board) atau 5 kartu, melawan dealer
+    else:
+        variant = 'holdem' if game == "poker" else 'stud'
+        hand = poker.play(variant, POKER_MIN_DEALER[variant])
+        payout = poker.payout(hand['outcome'], jumlah)
+        if jumlah + payout:
+            balance = await adjust_balance(interaction.user.id, jumlah + payout)
+        bus.publish(events.BetSettled(interaction.user.id, "poker", jumlah, payout))
+        if hand['outcome'] == 'win':
+            hasil = f"Kamu MENANG! +{payout} uang."
+        elif hand['outcome'] == 'lose':
+            hasil = f"Kamu KALAH! {payout} uang."
+        elif not hand['qualified']:
+            hasil = "Dealer tidak lolos kualifikasi, taruhan dikembalikan."
+        else:
+            hasil = "Seri!"
+        board = f"\n🂠 **Board:** {poker.cards_str(hand['board'])}" if hand['board'] else ""
+        await interaction.response.send_message(
+            f"♠️ **POKER**: {hasil} Saldo: {balance}\n"
+            f"🃏 **Kamu:** {poker.cards_str(hand['player'])} ({poker.describe(hand['player_value'])})\n"
+            f"🎩 **Dealer:** {poker.cards_str(hand['dealer'])} ({poker.describe(hand['dealer_value'])})"
+            f"{board}"
+        )
+
+def main():
+    if TOKEN is None:
+        print("Error: DISCORD_TOKEN environment variable not found!")
+        print("Please set your Discord bot token.")
+        exit(1)
+
+    bot.run(TOKEN)
+
+
+if __name__ == '__main__':
+    main()
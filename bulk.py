@@ -0,0 +1,68 @@
+"""Operasi massal owner (!massal): parsing target dan ringkasan dry-run
+
+Tidak ada I/O di sini; bot.py mengumpulkan target (role, mention, lampiran
+CSV), menampilkan preview dan menulis lewat UserRepo.upsert_many /
+InventoryRepo.add_many.
+
+Target adalah dict {user_id: jumlah}. Untuk kredit/debit jumlah = uang,
+untuk item jumlah = quantity, untuk vip/unvip jumlah diabaikan.
+"""
+import csv
+import io
+
+ACTIONS = ('vip', 'unvip', 'kredit', 'debit', 'item')
+# Kategori barang yang dibagikan lewat `!massal item`
+ITEM_CATEGORY = 'event'
+
+
+def parse_csv(text, default=None):
+    """({user_id: jumlah}, baris_dilewati) dari CSV `user_id[,jumlah]`
+
+    Kolom jumlah kosong memakai `default`. Header (baris pertama yang bukan
+    angka) tidak dihitung sebagai baris yang dilewati. User yang muncul
+    beberapa kali dijumlahkan.
+    """
+    targets, skipped = {}, 0
+    for line, row in enumerate(csv.reader(io.StringIO(text))):
+        if not row or not row[0].strip():
+            continue
+        try:
+            # Mention yang ditempel apa adanya (<@123>) juga diterima
+            user_id = int(row[0].strip().strip('<@!>'))
+            amount = int(row[1]) if len(row) > 1 and row[1].strip() else default
+        except ValueError:
+            skipped += line > 0
+            continue
+        if amount is None or amount <= 0:
+            skipped += 1
+            continue
+        targets[user_id] = targets.get(user_id, 0) + amount
+    return targets, skipped
+
+
+def preview(action, targets, existing, default_balance):
+    """Ringkasan dry-run; `existing` = {user_id: (balance, vip, item_count)} dari UserRepo.get_many"""
+    summary = {'targets': len(targets), 'new': len(targets) - len(existing)}
+    if action == 'vip':
+        summary['changed'] = len(targets) - sum(1 for _, vip, _ in existing.values() if vip)
+    elif action == 'unvip':
+        summary['changed'] = sum(1 for _, vip, _ in existing.values() if vip)
+    elif action == 'kredit':
+        summary['total'] = sum(targets.values())
+    elif action == 'debit':
+        total = emptied = 0
+        for user_id, amount in targets.items():
+            balance = existing.get(user_id, (default_balance,))[0]
+            # Sama dengan upsert_many: saldo tidak turun di bawah 0
+            total += min(amount, max(balance, 0))
+            emptied += 0 < balance <= amount
+        summary['total'], summary['emptied'] = total, emptied
+    elif action == 'item':
+        summary['total'] = sum(targets.values())
+        # Barang massal tidak dibatasi kapasitas; hanya diinformasikan (batas sama dengan !cari)
+        over = 0
+        for user_id, quantity in targets.items():
+            _, vip, item_count = existing.get(user_id, (default_balance, False, 0))
+            over += item_count + quantity > (25 if vip else 15)
+        summary['over_capacity'] = over
+    return summary
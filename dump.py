@@ -0,0 +1,222 @@
+"""Export/import data ekonomi (users, users_archive, inventory, daily_usage) sebagai JSONL atau CSV
+
+Contoh:
+    python dump.py export userdata.db exports/migrasi --format csv
+    python dump.py import userdata.db exports/migrasi
+
+Export membaca tiap tabel lewat cursor per `chunk` baris dalam satu read
+transaction (snapshot WAL yang konsisten, writer lain tetap jalan) dan
+menulis `<dir>/<tabel>.<format>[.gz]`. Import membaca file yang sama secara
+streaming dan menulis dengan executemany per `chunk` baris, commit setiap
+`batch` chunk. Memori yang dipakai tidak bergantung pada ukuran tabel.
+
+Kolom diambil dari header file, jadi export dari skema lama (tanpa guild_id)
+tetap bisa diimport; kolom yang tidak ada memakai default tabel. Baris
+dengan primary key yang sama ditimpa. users.item_count dihitung ulang dari
+inventori setelah import, karena trigger inventori ikut menambahkannya.
+"""
+import argparse
+import asyncio
+import csv
+import gzip
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+
+TABLES = ('users', 'users_archive', 'inventory', 'daily_usage')
+# id inventori AUTOINCREMENT bentrok antar file (mis. menggabungkan bucket), jadi tidak ikut
+# diimport; baris dengan kunci alami yang sama dihapus dulu supaya import tetap idempoten
+NATURAL_KEYS = {'inventory': ('guild_id', 'user_id', 'item_name')}
+FORMATS = ('jsonl', 'csv')
+
+# json.dumps dengan argumen non-default membuat encoder baru di tiap panggilan
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _open(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='', compresslevel=6)
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def _table_columns(db, table):
+    return [row[1] for row in db.execute(f"PRAGMA table_info({table})")]
+
+
+def _export(db_path, directory, fmt, compress, chunk, busy_timeout, progress):
+    if fmt not in FORMATS:
+        raise ValueError(f"Format tidak dikenal: {fmt!r}")
+    started = time.perf_counter()
+    os.makedirs(directory, exist_ok=True)
+    report = {'path': directory, 'tables': {}, 'bytes': 0}
+    db = sqlite3.connect(db_path, timeout=busy_timeout)
+    try:
+        # Read transaction: semua tabel dari snapshot yang sama
+        db.execute("BEGIN")
+        for table in TABLES:
+            if not _table_columns(db, table):
+                continue  # database lama tanpa tabel ini
+            path = os.path.join(directory, f"{table}.{fmt}" + (".gz" if compress else ""))
+            cursor = db.execute(f"SELECT * FROM {table}")
+            columns = [column[0] for column in cursor.description]
+            rows = 0
+            with _open(path, 'w') as f:
+                writer = csv.writer(f) if fmt == 'csv' else None
+                if writer:
+                    writer.writerow(columns)
+                while batch := cursor.fetchmany(chunk):
+                    if writer:
+                        writer.writerows(batch)
+                    else:
+                        # Satu write per chunk: write kecil per baris mahal lewat TextIOWrapper + gzip
+                        f.write("".join(_encode(dict(zip(columns, row))) + "\n" for row in batch))
+                    rows += len(batch)
+                    if progress:
+                        progress(table, rows)
+            report['tables'][table] = rows
+            report['bytes'] += os.path.getsize(path)
+        db.rollback()
+    finally:
+        db.close()
+    report['seconds'] = time.perf_counter() - started
+    return report
+
+
+def _read(path):
+    """(file, kolom, iterator baris) dari file export"""
+    f = _open(path, 'r')
+    if '.csv' in os.path.basename(path):
+        reader = csv.reader(f)
+        columns = next(reader, [])
+        # CSV tidak membedakan NULL dan string kosong; kolom teks ekonomi tidak pernah kosong
+        return f, columns, ([value if value != '' else None for value in row] for row in reader)
+    lines = (json.loads(line) for line in f if line.strip())
+    first = next(lines, None)
+    if first is None:
+        return f, [], iter(())
+    columns = list(first)
+
+    def rows():
+        yield [first.get(column) for column in columns]
+        for item in lines:
+            yield [item.get(column) for column in columns]
+    return f, columns, rows()
+
+
+def _find(directory, table):
+    for fmt in FORMATS:
+        for suffix in ('.gz', ''):
+            path = os.path.join(directory, f"{table}.{fmt}{suffix}")
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def _import(db_path, directory, chunk, batch, busy_timeout, progress):
+    started = time.perf_counter()
+    report = {'path': directory, 'tables': {}}
+    db = sqlite3.connect(db_path, timeout=busy_timeout, isolation_level=None)
+    try:
+        for table in TABLES:
+            path = _find(directory, table)
+            if path is None:
+                continue
+            f, columns, rows = _read(path)
+            with f:
+                known = set(_table_columns(db, table))
+                if not known:
+                    raise ValueError(f"Tabel {table} tidak ada di database tujuan")
+                key = NATURAL_KEYS.get(table)
+                keep = [index for index, column in enumerate(columns)
+                        if column in known and not (key and column == 'id')]
+                names = ", ".join(columns[index] for index in keep)
+                sql = (f"INSERT OR REPLACE INTO {table} ({names}) "
+                       f"VALUES ({', '.join('?' * len(keep))})")
+                if key:
+                    # Export skema lama tanpa guild_id = ekonomi global (0), sama seperti migrasi
+                    key_index = [columns.index(column) if column in columns else None for column in key]
+                    delete = f"DELETE FROM {table} WHERE " + " AND ".join(f"{column} = ?" for column in key)
+                count = chunks = 0
+                db.execute("BEGIN IMMEDIATE")
+                try:
+                    while True:
+                        buffer = list(itertools.islice(rows, chunk))
+                        if not buffer:
+                            break
+                        if key:
+                            db.executemany(delete, ([row[index] if index is not None else 0 for index in key_index]
+                                                    for row in buffer))
+                        db.executemany(sql, ([row[index] for index in keep] for row in buffer))
+                        count += len(buffer)
+                        chunks += 1
+                        if chunks % batch == 0:
+                            # Commit per batch supaya writer lain tidak tertahan selama seluruh import
+                            db.execute("COMMIT")
+                            db.execute("BEGIN IMMEDIATE")
+                        if progress:
+                            progress(table, count)
+                    db.execute("COMMIT")
+                except BaseException:
+                    db.execute("ROLLBACK")
+                    raise
+            report['tables'][table] = count
+        if 'inventory' in report['tables'] or 'users' in report['tables']:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("""
+                UPDATE users SET item_count = COALESCE((SELECT SUM(quantity) FROM inventory
+                    WHERE inventory.guild_id = users.guild_id AND inventory.user_id = users.user_id), 0)
+            """)
+            db.execute("COMMIT")
+    finally:
+        db.close()
+    report['seconds'] = time.perf_counter() - started
+    return report
+
+
+async def export(db_path, directory, fmt='jsonl', compress=True, chunk=10000, busy_timeout=10.0,
+                 progress=None):
+    """Export semua tabel ekonomi; `progress(tabel, baris)` dipanggil dari thread export"""
+    return await asyncio.to_thread(_export, db_path, directory, fmt, compress, chunk, busy_timeout, progress)
+
+
+async def import_(db_path, directory, chunk=10000, batch=10, busy_timeout=10.0, progress=None):
+    """Import hasil export ke database yang skemanya sudah dibuat (Storage.init)"""
+    return await asyncio.to_thread(_import, db_path, directory, chunk, batch, busy_timeout, progress)
+
+
+async def _main(args):
+    from storage import SQLiteStorage
+
+    def progress(table, rows):
+        print(f"\r{table}: {rows} baris", end="", file=sys.stderr, flush=True)
+
+    if args.command == 'export':
+        report = await export(args.db, args.directory, args.format, not args.no_gzip, args.chunk,
+                              progress=progress)
+    else:
+        # Buat/migrasi skema tujuan dulu (database baru saat pindah host)
+        storage = SQLiteStorage(args.db)
+        await storage.init()
+        await storage.close()
+        report = await import_(args.db, args.directory, args.chunk, args.batch, progress=progress)
+    print(file=sys.stderr)
+    print(json.dumps(report, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=('export', 'import'))
+    parser.add_argument('db', help="file SQLite (mis. userdata.db)")
+    parser.add_argument('directory', help="folder hasil export / sumber import")
+    parser.add_argument('--format', choices=FORMATS, default='jsonl')
+    parser.add_argument('--no-gzip', action='store_true', help="tulis file tanpa kompresi")
+    parser.add_argument('--chunk', type=int, default=10000, help="baris per fetch/executemany")
+    parser.add_argument('--batch', type=int, default=10, help="chunk per transaksi saat import")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""Event bus in-process untuk side effect di luar hot path command
+
+Command cukup memanggil `bus.publish(event)` (sinkron, tidak pernah await);
+subscriber memproses event di task sendiri secara batch. Tiap subscriber
+punya queue terbatas: kalau penuh, event dibuang dan dicatat di metrik,
+jadi subscriber yang lambat tidak pernah memperlambat command.
+"""
+import asyncio
+import dataclasses
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class ItemFound:
+    user_id: int
+    item_name: str
+    category: str
+    value: int
+    at: float = dataclasses.field(default_factory=time.time)
+
+
+@dataclasses.dataclass(frozen=True)
+class ItemSold:
+    user_id: int
+    item_name: str
+    category: str
+    quantity: int
+    amount: int  # uang yang diterima, sudah termasuk bonus VIP
+    at: float = dataclasses.field(default_factory=time.time)
+
+
+@dataclasses.dataclass(frozen=True)
+class BetSettled:
+    user_id: int
+    game: str
+    bet: int
+    payout: int  # perubahan saldo: positif menang, negatif kalah, 0 seri
+    at: float = dataclasses.field(default_factory=time.time)
+
+
+@dataclasses.dataclass(frozen=True)
+class Transfer:
+    sender_id: int
+    receiver_id: int
+    amount: int
+    at: float = dataclasses.field(default_factory=time.time)
+
+
+@dataclasses.dataclass(frozen=True)
+class VipGranted:
+    user_id: int
+    granted_by: int
+    at: float = dataclasses.field(default_factory=time.time)
+
+
+class _Subscriber:
+    def __init__(self, name, event_types, handler, batch_size, max_wait, maxsize):
+        self.name = name
+        self.event_types = event_types
+        self.handler = handler
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue(maxsize)
+        self.task = None
+
+
+class EventBus:
+    def __init__(self, registry=None, maxsize=1000):
+        self.maxsize = maxsize
+        self._subscribers = []
+        self._closing = False
+        if registry is not None:
+            self.published = registry.counter(
+                "alphad_events_published_total", "Jumlah event yang dipublish", ("event",))
+            self.dropped = registry.counter(
+                "alphad_events_dropped_total", "Event dibuang karena queue subscriber penuh",
+                ("subscriber",))
+            self.errors = registry.counter(
+                "alphad_event_handler_errors_total", "Batch yang gagal diproses subscriber",
+                ("subscriber",))
+            self.depth = registry.gauge(
+                "alphad_event_queue_depth", "Event yang menunggu di queue subscriber",
+                ("subscriber",))
+            self.duration = registry.histogram(
+                "alphad_event_batch_duration_seconds", "Durasi memproses satu batch event",
+                ("subscriber",))
+        else:
+            self.published = self.dropped = self.errors = self.depth = self.duration = None
+
+    def subscribe(self, name, event_types, handler, batch_size=50, max_wait=1.0, maxsize=None):
+        """Daftarkan `await handler(events)` untuk event bertipe `event_types`
+
+        Handler menerima list berisi sampai `batch_size` event; batch dikirim
+        begitu penuh atau `max_wait` detik setelah event pertama masuk.
+        """
+        subscriber = _Subscriber(name, tuple(event_types), handler, batch_size, max_wait,
+                                 maxsize or self.maxsize)
+        self._subscribers.append(subscriber)
+        if self._running():
+            subscriber.task = asyncio.create_task(self._consume(subscriber))
+        return subscriber
+
+    def _running(self):
+        return any(subscriber.task is not None for subscriber in self._subscribers)
+
+    def publish(self, event):
+        if self._closing:
+            return
+        if self.published is not None:
+            self.published.inc(type(event).__name__)
+        for subscriber in self._subscribers:
+            if not isinstance(event, subscriber.event_types):
+                continue
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                if self.dropped is not None:
+                    self.dropped.inc(subscriber.name)
+                continue
+            if self.depth is not None:
+                self.depth.set(subscriber.queue.qsize(), subscriber.name)
+
+    def start(self):
+        for subscriber in self._subscribers:
+            if subscriber.task is None:
+                subscriber.task = asyncio.create_task(self._consume(subscriber))
+
+    async def stop(self, timeout=5.0):
+        """Berhenti menerima event, selesaikan yang tersisa (maks `timeout` detik)"""
+        self._closing = True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(subscriber.queue.join() for subscriber in self._subscribers)),
+                timeout)
+        except asyncio.TimeoutError:
+            log.warning("Event bus stopped with undelivered events")
+        for subscriber in self._subscribers:
+            if subscriber.task is not None:
+                subscriber.task.cancel()
+                subscriber.task = None
+
+    async def _next_batch(self, subscriber):
+        queue = subscriber.queue
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + subscriber.max_wait
+        while len(batch) < subscriber.batch_size:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _consume(self, subscriber):
+        while True:
+            batch = await self._next_batch(subscriber)
+            start = time.perf_counter()
+            try:
+                await subscriber.handler(batch)
+            except Exception:
+                log.exception("Event subscriber %s failed on %d events", subscriber.name, len(batch))
+                if self.errors is not None:
+                    self.errors.inc(subscriber.name)
+            finally:
+                for _ in batch:
+                    subscriber.queue.task_done()
+                if self.duration is not None:
+                    self.duration.observe(time.perf_counter() - start, subscriber.name)
+                    self.depth.set(subscriber.queue.qsize(), subscriber.name)
@@ -0,0 +1,91 @@
+"""Health monitor untuk endpoint /healthz
+
+Semua pengukuran diambil oleh sampler di background, jadi request /healthz
+hanya membaca nilai terakhir dan tidak menyentuh database.
+"""
+import asyncio
+import math
+import time
+
+
+class HealthMonitor:
+    def __init__(self, probe, max_loop_lag=1.0, max_db_latency=0.5,
+                 max_gateway_latency=5.0, db_interval=5.0):
+        self.probe = probe  # coroutine function, mis. storage.ping
+        self.max_loop_lag = max_loop_lag
+        self.max_db_latency = max_db_latency
+        self.max_gateway_latency = max_gateway_latency
+        self.db_interval = db_interval
+
+        self.loop_lag = 0.0
+        self.loop_lag_at = None
+        self.db_latency = None
+        self.db_error = None
+        self.db_checked_at = None
+
+    def record_loop_lag(self, lag):
+        self.loop_lag = lag
+        self.loop_lag_at = time.monotonic()
+
+    async def probe_db(self):
+        """Jalankan probe database dan catat durasinya"""
+        start = time.perf_counter()
+        try:
+            await self.probe()
+            self.db_error = None
+        except Exception as e:
+            self.db_error = f"{type(e).__name__}: {e}"
+        self.db_latency = time.perf_counter() - start
+        self.db_checked_at = time.monotonic()
+
+    async def run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.probe_db(), self.db_interval * 2)
+            except asyncio.TimeoutError:
+                self.db_error = "timeout"
+                self.db_latency = self.db_interval * 2
+                self.db_checked_at = time.monotonic()
+            await asyncio.sleep(self.db_interval)
+
+    def check(self, gateway_ready, gateway_latency, in_flight):
+        """Kembalikan (healthy, report) dari sampel terakhir"""
+        now = time.monotonic()
+        problems = []
+
+        if self.loop_lag > self.max_loop_lag:
+            problems.append("event_loop_lag")
+
+        if self.db_checked_at is None:
+            problems.append("db_not_probed")
+        else:
+            if self.db_error is not None:
+                problems.append("db_error")
+            elif self.db_latency > self.max_db_latency:
+                problems.append("db_slow")
+            # Sampler yang berhenti berarti event loop macet atau task mati
+            if now - self.db_checked_at > self.db_interval * 3:
+                problems.append("db_probe_stale")
+
+        latency_ok = gateway_latency is not None and math.isfinite(gateway_latency)
+        if not gateway_ready:
+            problems.append("gateway_not_ready")
+        elif latency_ok and gateway_latency > self.max_gateway_latency:
+            problems.append("gateway_slow")
+
+        report = {
+            "status": "ok" if not problems else "fail",
+            "problems": problems,
+            "event_loop_lag_seconds": round(self.loop_lag, 6),
+            "db": {
+                "latency_seconds": None if self.db_latency is None else round(self.db_latency, 6),
+                "error": self.db_error,
+                "age_seconds": None if self.db_checked_at is None else round(now - self.db_checked_at, 3),
+            },
+            "gateway": {
+                "ready": gateway_ready,
+                "latency_seconds": round(gateway_latency, 6) if latency_ok else None,
+            },
+            "in_flight_commands": in_flight,
+        }
+        return not problems, report
@@ -0,0 +1,158 @@
+"""State bersama antar proses shard (registry klaim, mis. game roulette aktif)
+
+Launcher menjalankan IPCServer di Unix socket; tiap proses bot memakai
+IPCRegistry untuk klaim/lepas key. Tanpa launcher (satu proses) bot memakai
+LocalRegistry dengan interface yang sama.
+
+Protokol: satu JSON per baris, request {"id", "op", "key"} dan response
+{"id", "ok"}. Klaim milik koneksi yang putus otomatis dilepas.
+"""
+import asyncio
+import itertools
+import json
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+
+class LocalRegistry:
+    """Registry klaim dalam satu proses"""
+
+    def __init__(self):
+        self._claims = {}
+
+    async def claim(self, key, owner=None):
+        if key in self._claims:
+            return False
+        self._claims[key] = owner
+        return True
+
+    async def release(self, key):
+        if key not in self._claims:
+            return False
+        del self._claims[key]
+        return True
+
+    async def count(self):
+        return len(self._claims)
+
+    async def close(self):
+        pass
+
+
+class IPCRegistry:
+    """Client registry yang berbagi klaim dengan shard lain lewat IPCServer"""
+
+    def __init__(self, path, label=None):
+        self.path = path
+        self.label = label or f"pid-{os.getpid()}"
+        self._reader = None
+        self._writer = None
+        self._pending = {}
+        self._ids = itertools.count()
+        self._reader_task = None
+        self._connect_lock = asyncio.Lock()
+
+    async def _ensure_connected(self):
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return
+            self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+            self._reader_task = asyncio.create_task(self._read_loop(self._reader))
+
+    async def _read_loop(self, reader):
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                future = self._pending.pop(message.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        finally:
+            # Koneksi putus: gagalkan semua request yang masih menunggu
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("IPC connection lost"))
+            self._pending.clear()
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    async def _request(self, op, key=None):
+        await self._ensure_connected()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        payload = {'id': request_id, 'op': op, 'key': key, 'owner': self.label}
+        self._writer.write(json.dumps(payload).encode() + b'\n')
+        await self._writer.drain()
+        return await asyncio.wait_for(future, 5)
+
+    async def claim(self, key, owner=None):
+        return (await self._request('claim', key))['ok']
+
+    async def release(self, key):
+        return (await self._request('release', key))['ok']
+
+    async def count(self):
+        return (await self._request('count'))['count']
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+
+
+class IPCServer:
+    """Server registry yang dijalankan oleh launcher"""
+
+    def __init__(self, path):
+        self.path = path
+        self.claims = {}  # key -> writer pemilik
+        self._server = None
+
+    async def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, self.path)
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def handle_request(self, request, conn):
+        op = request.get('op')
+        key = request.get('key')
+        if op == 'claim':
+            if key in self.claims:
+                return {'ok': False}
+            self.claims[key] = conn
+            return {'ok': True}
+        if op == 'release':
+            return {'ok': self.claims.pop(key, None) is not None}
+        if op == 'count':
+            return {'ok': True, 'count': len(self.claims)}
+        return {'ok': False, 'error': f'unknown op {op!r}'}
+
+    async def _handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                request = json.loads(line)
+                response = self.handle_request(request, writer)
+                response['id'] = request.get('id')
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            # Proses shard mati: lepas semua klaimnya supaya user tidak terkunci
+            stale = [key for key, owner in self.claims.items() if owner is writer]
+            for key in stale:
+                del self.claims[key]
+            if stale:
+                log.warning("Released %d claims from disconnected shard", len(stale))
+            writer.close()
@@ -0,0 +1,87 @@
+"""Cache nama barang per user di memori untuk autocomplete slash command
+
+Autocomplete dipanggil tiap ketikan dan harus dijawab dalam hitungan
+milidetik, jadi sarannya diambil dari cache ini, bukan dari SQLite. Helper
+inventori di bot.py menjaga cache tetap koheren (added/removed/cleared).
+Entry kadaluarsa setelah `ttl` detik karena proses shard lain bisa mengubah
+inventori yang sama; cache juga dibatasi `max_users` entry (LRU).
+"""
+import time
+from collections import OrderedDict
+
+
+class ItemNameCache:
+    def __init__(self, max_users=10000, ttl=60.0, clock=time.monotonic):
+        self.max_users = max_users
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()  # user_id -> (loaded_at, {item_name: quantity})
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, user_id):
+        """Dict {item_name: quantity}, atau None kalau belum dimuat/kadaluarsa"""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        loaded_at, items = entry
+        if self.clock() - loaded_at > self.ttl:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return items
+
+    def put(self, user_id, rows):
+        """Isi cache dari baris inventori (item_name, item_category, item_value, quantity)"""
+        self._entries[user_id] = (self.clock(), {row[0]: row[3] for row in rows})
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+    def added(self, user_id, item_name, quantity=1):
+        items = self.get(user_id)
+        if items is not None:
+            items[item_name] = items.get(item_name, 0) + quantity
+
+    def removed(self, user_id, item_name, quantity=1):
+        items = self.get(user_id)
+        if items is None or item_name not in items:
+            return
+        items[item_name] -= quantity
+        if items[item_name] <= 0:
+            del items[item_name]
+
+    def cleared(self, user_id):
+        self.put(user_id, [])
+
+    def invalidate(self, user_id):
+        self._entries.pop(user_id, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def suggest(self, user_id, current, limit=25):
+        """Nama barang yang cocok dengan `current`, atau None kalau user belum di cache
+
+        Urutan: awalan nama, awalan salah satu kata (mis. "this" untuk
+        "🔥 This is Fine Sticker"), lalu substring; alfabetis di tiap grup.
+        """
+        items = self.get(user_id)
+        if items is None:
+            return None
+        query = current.casefold().strip()
+        ranked = []
+        for name in items:
+            folded = name.casefold()
+            if folded.startswith(query):
+                rank = 0
+            elif any(word.startswith(query) for word in folded.split()):
+                rank = 1
+            elif query in folded:
+                rank = 2
+            else:
+                continue
+            ranked.append((rank, folded, name))
+        ranked.sort()
+        return [name for _, _, name in ranked[:limit]]
@@ -0,0 +1,89 @@
+"""Launcher multi-proses: jalankan beberapa proses bot, masing-masing memegang sebagian shard
+
+Contoh: python launcher.py --shards 4 --processes 2
+
+Tiap proses mendapat SHARD_COUNT/SHARD_IDS sendiri, port web server sendiri
+(PORT = base port + index) dan terhubung ke IPC server milik launcher untuk
+state lintas shard. Semua proses berbagi userdata.db (WAL + busy timeout).
+Proses yang crash di-restart otomatis dengan backoff.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+
+from ipc import IPCServer
+
+log = logging.getLogger('alphad.launcher')
+
+BOT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bot.py')
+
+
+def assign_shards(shard_count, processes):
+    """Bagi shard id secara round-robin ke tiap proses"""
+    return [[shard for shard in range(shard_count) if shard % processes == index]
+            for index in range(processes)]
+
+
+async def run_worker(index, shard_ids, shard_count, args, stopping):
+    env = dict(os.environ,
+               SHARD_COUNT=str(shard_count),
+               SHARD_IDS=','.join(map(str, shard_ids)),
+               IPC_SOCKET=args.socket,
+               PORT=str(args.base_port + index))
+    backoff = 1
+    while not stopping.is_set():
+        log.info("Starting worker %d with shards %s", index, shard_ids)
+        proc = await asyncio.create_subprocess_exec(sys.executable, BOT_SCRIPT, env=env)
+        stop_wait = asyncio.create_task(stopping.wait())
+        proc_wait = asyncio.create_task(proc.wait())
+        await asyncio.wait({stop_wait, proc_wait}, return_when=asyncio.FIRST_COMPLETED)
+
+        if stopping.is_set():
+            if proc.returncode is None:
+                proc.terminate()
+                try:
+                    await asyncio.wait_for(proc.wait(), 30)
+                except asyncio.TimeoutError:
+                    proc.kill()
+            return
+
+        stop_wait.cancel()
+        log.warning("Worker %d exited with code %s, restarting in %ds", index, proc.returncode, backoff)
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 60)
+
+
+async def main(args):
+    shard_count = args.shards or args.processes
+    if shard_count < args.processes:
+        raise SystemExit("--shards tidak boleh lebih kecil dari --processes")
+
+    server = IPCServer(args.socket)
+    await server.start()
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    try:
+        await asyncio.gather(*(
+            run_worker(index, shard_ids, shard_count, args, stopping)
+            for index, shard_ids in enumerate(assign_shards(shard_count, args.processes))
+        ))
+    finally:
+        await server.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Jalankan bot dalam beberapa proses shard")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--shards', type=int, default=None,
+                        help="total shard (default = jumlah proses)")
+    parser.add_argument('--socket', default=os.getenv('IPC_SOCKET', '/tmp/alphad-ipc.sock'))
+    parser.add_argument('--base-port', type=int, default=int(os.getenv('PORT', '8080')))
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,135 @@
+"""Maintenance harian userdata.db: retensi baris basi dan compaction
+
+Job dijalankan berurutan di thread terpisah dalam satu anggaran waktu:
+
+1. hapus baris daily_usage dari hari sebelumnya (row yang hilang sama
+   artinya dengan cari_count 0, UsageRepo.get membuatnya lagi)
+2. opsional: pindahkan user yang lama tidak aktif dengan saldo 0, tanpa
+   VIP dan tanpa barang ke users_archive (UserRepo.get memulihkannya
+   otomatis saat user kembali)
+3. PRAGMA incremental_vacuum untuk mengembalikan halaman kosong, lalu
+   PRAGMA optimize
+
+Hapus dilakukan per `batch` baris dengan commit sendiri-sendiri, jadi
+writer lain hanya tertahan sebentar. Kalau anggaran waktu habis, sisa
+pekerjaan dilanjutkan di jadwal berikutnya.
+"""
+import asyncio
+import contextlib
+import datetime
+import sqlite3
+import time
+
+from storage import today_iso
+
+
+def next_run(now, hour):
+    """Timestamp berikutnya pada jam lokal `hour` (jam sepi) setelah `now`"""
+    current = datetime.datetime.fromtimestamp(now)
+    target = current.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if target <= current:
+        target += datetime.timedelta(days=1)
+    return target.timestamp()
+
+
+@contextlib.contextmanager
+def _transaction(db):
+    # Koneksi autocommit (isolation_level=None), jadi transaksi tiap batch dibuka sendiri
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    db.execute("COMMIT")
+
+
+def _prune_usage(db, today, batch, deadline):
+    deleted, last_key = 0, (-2 ** 63, -2 ** 63)
+    while time.monotonic() < deadline:
+        # Jalan per (guild_id, user_id) (primary key), jadi tiap batch tidak scan ulang dari awal
+        keys = db.execute(
+            "SELECT guild_id, user_id FROM daily_usage WHERE (guild_id, user_id) > (?, ?) AND last_reset < ? "
+            "ORDER BY guild_id, user_id LIMIT ?",
+            last_key + (today, batch)).fetchall()
+        if not keys:
+            return deleted, True
+        with _transaction(db):
+            cursor = db.executemany(
+                "DELETE FROM daily_usage WHERE guild_id = ? AND user_id = ? AND last_reset < ?",
+                (key + (today,) for key in keys))
+        deleted += cursor.rowcount
+        last_key = keys[-1]
+    return deleted, False
+
+
+def _archive_users(db, before, batch, deadline):
+    archived, last_key = 0, (-2 ** 63, -2 ** 63)
+    condition = "balance = 0 AND vip = 0 AND item_count = 0 AND last_active < ?"
+    while time.monotonic() < deadline:
+        keys = db.execute(
+            f"SELECT guild_id, user_id FROM users WHERE (guild_id, user_id) > (?, ?) AND {condition} "
+            "ORDER BY guild_id, user_id LIMIT ?",
+            last_key + (before, batch)).fetchall()
+        if not keys:
+            return archived, True
+        # Kondisi dicek ulang dan baris dipindah dalam satu transaksi tulis
+        with _transaction(db):
+            db.executemany(
+                "INSERT OR REPLACE INTO users_archive (guild_id, user_id, balance, vip, last_active, archived_at) "
+                "SELECT guild_id, user_id, balance, vip, last_active, date('now') FROM users "
+                f"WHERE guild_id = ? AND user_id = ? AND {condition}",
+                (key + (before,) for key in keys))
+            cursor = db.executemany(f"DELETE FROM users WHERE guild_id = ? AND user_id = ? AND {condition}",
+                                    (key + (before,) for key in keys))
+        archived += cursor.rowcount
+        last_key = keys[-1]
+    return archived, False
+
+
+def _vacuum(db, pages, deadline):
+    mode = db.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if mode != 2:
+        # Database lama dibuat tanpa auto_vacuum=INCREMENTAL; butuh VACUUM penuh sekali (offline)
+        return 0, False
+    start = free = db.execute("PRAGMA freelist_count").fetchone()[0]
+    while free and time.monotonic() < deadline:
+        # executescript: execute() hanya menjalankan satu step, yang membebaskan satu halaman
+        db.executescript(f"PRAGMA incremental_vacuum({pages});")
+        free = db.execute("PRAGMA freelist_count").fetchone()[0]
+    return start - free, True
+
+
+def _db_pages(db):
+    return (db.execute("PRAGMA page_count").fetchone()[0],
+            db.execute("PRAGMA freelist_count").fetchone()[0])
+
+
+def _maintain(db_path, budget, archive_days, batch, vacuum_pages, busy_timeout):
+    started = time.perf_counter()
+    deadline = time.monotonic() + budget
+    db = sqlite3.connect(db_path, timeout=busy_timeout, isolation_level=None)
+    try:
+        report = {'pages_before': _db_pages(db)[0]}
+        report['usage_pruned'], complete = _prune_usage(db, today_iso(), batch, deadline)
+        report['users_archived'] = 0
+        if archive_days > 0:
+            before = (datetime.date.today() - datetime.timedelta(days=archive_days)).isoformat()
+            report['users_archived'], archived_all = _archive_users(db, before, batch, deadline)
+            complete = complete and archived_all
+        report['pages_freed'], report['vacuum'] = _vacuum(db, vacuum_pages, deadline)
+        db.execute("PRAGMA analysis_limit = 400")
+        db.execute("PRAGMA optimize")
+        report['pages'], report['free_pages'] = _db_pages(db)
+    finally:
+        db.close()
+    report['complete'] = complete and time.monotonic() < deadline
+    report['seconds'] = time.perf_counter() - started
+    return report
+
+
+async def maintain(db_path, budget=60.0, archive_days=0, batch=1000, vacuum_pages=1000,
+                   busy_timeout=10.0):
+    """Jalankan semua job maintenance, berhenti setelah `budget` detik"""
+    return await asyncio.to_thread(_maintain, db_path, budget, archive_days, batch,
+                                   vacuum_pages, busy_timeout)
@@ -0,0 +1,196 @@
+"""Engine poker: evaluator tabel lookup dan game melawan dealer
+
+Kartu adalah int 0..51: `rank * 4 + suit`, rank 0 = 2 sampai 12 = As.
+Tiap kartu punya kunci `5**rank << 12 | 1 << 3 * suit`; jumlah kunci 5-7
+kartu berisi jumlah kartu per suit (3 bit per suit, 12 bit terbawah) dan
+encoding quinary jumlah kartu per rank di atasnya. Encoding quinary unik
+untuk tiap kombinasi rank (perfect hash), jadi evaluasi satu tangan hanya
+penjumlahan plus dua lookup tabel:
+
+- FLUSH_SUIT[jumlah suit] -> suit yang punya >= 5 kartu atau -1
+- kalau flush: FLUSH_TABLE[bitmask rank suit itu], selain itu
+  RANK_TABLE[kunci quinary]
+
+Dengan 5 kartu satu suit dari 7, quads dan full house tidak mungkin, jadi
+tabel flush selalu memberi hasil terbaik. Nilai tangan berupa int; makin
+besar makin kuat (kategori * 13**5 + rank penentu dalam basis 13).
+
+Tabel dibangun sekali oleh `build_tables()` (~1 detik, jalankan di thread).
+"""
+import itertools
+import random
+
+RANKS = "23456789TJQKA"
+SUITS = "♠♥♦♣"
+
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+CATEGORY_NAMES = ["High Card", "One Pair", "Two Pair", "Three of a Kind", "Straight",
+                  "Flush", "Full House", "Four of a Kind", "Straight Flush"]
+_BASE = 13 ** 5
+
+CARD_KEYS = [(5 ** (card >> 2)) << 12 | 1 << 3 * (card & 3) for card in range(52)]
+CARD_BITS = [1 << (card >> 2) for card in range(52)]
+FLUSH_SUIT = []   # jumlah suit (12 bit) -> suit dengan >= 5 kartu, atau -1
+FLUSH_TABLE = []  # bitmask rank -> nilai flush/straight flush
+RANK_TABLE = {}   # kunci quinary -> nilai tangan tanpa flush
+
+
+def card_str(card):
+    return RANKS[card >> 2] + SUITS[card & 3]
+
+
+def cards_str(cards):
+    return " ".join(card_str(card) for card in cards)
+
+
+def _value(category, ranks):
+    value = category
+    for rank in (list(ranks) + [0] * 5)[:5]:
+        value = value * 13 + rank
+    return value
+
+
+def _straight_high(bits):
+    for high in range(12, 3, -1):
+        window = 0b11111 << (high - 4)
+        if bits & window == window:
+            return high
+    if bits & 0b1000000001111 == 0b1000000001111:
+        return 3  # A-2-3-4-5
+    return None
+
+
+def _flush_value(bits):
+    high = _straight_high(bits)
+    if high is not None:
+        return _value(STRAIGHT_FLUSH, [high])
+    return _value(FLUSH, [rank for rank in range(12, -1, -1) if bits >> rank & 1])
+
+
+def _rank_value(counts):
+    """Nilai tangan terbaik dari jumlah kartu per rank (tanpa flush)"""
+    groups = sorted(((count, rank) for rank, count in enumerate(counts) if count), reverse=True)
+    ranks = [rank for rank in range(12, -1, -1) if counts[rank]]
+    top_count, top_rank = groups[0]
+    if top_count == 4:
+        return _value(QUADS, [top_rank, max(rank for rank in ranks if rank != top_rank)])
+    if top_count == 3 and groups[1][0] >= 2:
+        return _value(FULL_HOUSE, [top_rank, groups[1][1]])
+    high = _straight_high(sum(1 << rank for rank in ranks))
+    if high is not None:
+        return _value(STRAIGHT, [high])
+    if top_count == 3:
+        return _value(TRIPS, [top_rank] + [rank for rank in ranks if rank != top_rank][:2])
+    if top_count == 2 and groups[1][0] == 2:
+        pairs = [top_rank, groups[1][1]]
+        return _value(TWO_PAIR, pairs + [rank for rank in ranks if rank not in pairs][:1])
+    if top_count == 2:
+        return _value(PAIR, [top_rank] + [rank for rank in ranks if rank != top_rank][:3])
+    return _value(HIGH_CARD, ranks[:5])
+
+
+def _rank_multisets(size, rank=0, counts=None):
+    counts = counts if counts is not None else [0] * 13
+    if rank == 13:
+        if size == 0:
+            yield counts
+        return
+    for count in range(min(4, size) + 1):
+        counts[rank] = count
+        yield from _rank_multisets(size - count, rank + 1, counts)
+    counts[rank] = 0
+
+
+def build_tables():
+    if RANK_TABLE:
+        return
+    FLUSH_SUIT[:] = [-1] * 4096
+    for counts in itertools.product(range(8), repeat=4):
+        if sum(counts) <= 7:
+            key = sum(count << 3 * suit for suit, count in enumerate(counts))
+            FLUSH_SUIT[key] = next((suit for suit, count in enumerate(counts) if count >= 5), -1)
+    FLUSH_TABLE[:] = [_flush_value(bits) if bin(bits).count("1") >= 5 else 0 for bits in range(1 << 13)]
+    table = {}
+    for size in (5, 6, 7):
+        for counts in _rank_multisets(size):
+            table[sum(count * 5 ** rank for rank, count in enumerate(counts))] = _rank_value(counts)
+    RANK_TABLE.update(table)
+
+
+def evaluate(cards):
+    """Nilai tangan terbaik dari 5-7 kartu (butuh build_tables())"""
+    key = 0
+    for card in cards:
+        key += CARD_KEYS[card]
+    suit = FLUSH_SUIT[key & 0xFFF]
+    if suit < 0:
+        return RANK_TABLE[key >> 12]
+    bits = 0
+    for card in cards:
+        if card & 3 == suit:
+            bits |= CARD_BITS[card]
+    return FLUSH_TABLE[bits]
+
+
+def category(value):
+    return value // _BASE
+
+
+def describe(value):
+    return CATEGORY_NAMES[category(value)]
+
+
+def qualifier(spec):
+    """Nilai minimum agar dealer lolos, mis. "pair-4" (sepasang 4 ke atas), "high-A", "none"
+
+    Dealer yang tidak lolos membuat taruhan seri (push).
+    """
+    if spec in (None, "", "none"):
+        return 0
+    name, _, rank = spec.partition("-")
+    categories = {"high": HIGH_CARD, "pair": PAIR, "twopair": TWO_PAIR, "trips": TRIPS}
+    if name not in categories or (rank and rank.upper() not in RANKS):
+        raise ValueError(f"Aturan kualifikasi dealer tidak dikenal: {spec!r}")
+    return _value(categories[name], [RANKS.index(rank.upper())] if rank else [])
+
+
+VARIANTS = {
+    # nama: (kartu per pemain, kartu board)
+    'holdem': (2, 5),
+    'stud': (5, 0),
+}
+# House edge dengan aturan ini (lihat benchmarks/bench_poker.py): holdem ~3.0%, stud ~4.4%
+DEFAULT_QUALIFY = {'holdem': 'high-K', 'stud': 'high-J'}
+
+
+def play(variant='holdem', min_dealer=0, rng=random):
+    """Satu tangan melawan dealer; outcome 'win', 'lose' atau 'push'"""
+    hole, board_size = VARIANTS[variant]
+    deck = rng.sample(range(52), 2 * hole + board_size)
+    player, dealer, board = deck[:hole], deck[hole:2 * hole], deck[2 * hole:]
+    player_value = evaluate(player + board)
+    dealer_value = evaluate(dealer + board)
+    qualified = dealer_value >= min_dealer
+    if not qualified or player_value == dealer_value:
+        outcome = 'push'
+    else:
+        outcome = 'win' if player_value > dealer_value else 'lose'
+    return {
+        'player': player, 'dealer': dealer, 'board': board,
+        'player_value': player_value, 'dealer_value': dealer_value,
+        'qualified': qualified, 'outcome': outcome,
+    }
+
+
+def payout(outcome, bet):
+    """Perubahan saldo: menang dibayar 1:1, seri dikembalikan"""
+    return {'win': bet, 'lose': -bet, 'push': 0}[outcome]
+
+
+def simulate(hands, variant='holdem', min_dealer=0, rng=None):
+    """Mode headless: house edge (per unit taruhan) dari `hands` tangan"""
+    rng = rng or random.Random()
+    total = 0
+    for _ in range(hands):
+        total += payout(play(variant, min_dealer, rng)['outcome'], 1)
+    return -total / hands
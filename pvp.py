@@ -0,0 +1,157 @@
+"""Roulette PvP: antrean matchmaking, registry duel dan state machine duel
+
+Tidak ada I/O di sini; bot.py memegang saldo (escrow) dan pesan Discord.
+
+- MatchQueue memasangkan user berdasarkan besar taruhan (selisih maksimal
+  `tolerance` dari taruhan masing-masing). Antrean disimpan terurut per
+  taruhan, jadi mencari lawan cukup bisect ke tetangga terdekat.
+- DuelRegistry mengindeks duel per game_id dan per peserta, jadi input dari
+  tombol maupun command dicari dengan satu lookup dict.
+- Duel memakai aturan yang sama dengan roulette melawan bot: 3 nyawa per
+  ronde, tembak diri sendiri di chamber kosong = giliran tambahan, menang
+  2 dari 3 ronde.
+"""
+import bisect
+import itertools
+import os
+import random
+
+
+class MatchQueue:
+    def __init__(self, tolerance=0.2):
+        self.tolerance = tolerance
+        self._entries = []  # terurut: (bet, seq, user_id)
+        self._by_user = {}  # user_id -> (entry, info)
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._by_user)
+
+    def __contains__(self, user_id):
+        return user_id in self._by_user
+
+    def _compatible(self, bet, other):
+        return abs(bet - other) <= self.tolerance * min(bet, other)
+
+    def join(self, user_id, bet, info=None):
+        """Pasangkan dengan lawan terdekat; (user_id, bet, info) lawan, atau None kalau masuk antrean"""
+        index = bisect.bisect_left(self._entries, (bet,))
+        candidates = []
+        if index < len(self._entries):
+            candidates.append(self._entries[index])      # taruhan >= bet, yang paling lama menunggu
+        if index > 0:
+            candidates.append(self._entries[index - 1])  # taruhan < bet terdekat
+        candidates = [entry for entry in candidates if self._compatible(bet, entry[0])]
+        if candidates:
+            # Selisih taruhan terkecil; kalau sama, yang paling lama menunggu
+            match = min(candidates, key=lambda entry: (abs(entry[0] - bet), entry[1]))
+            _, info_match = self._by_user.pop(match[2])
+            self._entries.remove(match)
+            return match[2], match[0], info_match
+        entry = (bet, next(self._seq), user_id)
+        bisect.insort(self._entries, entry)
+        self._by_user[user_id] = (entry, info)
+        return None
+
+    def leave(self, user_id):
+        item = self._by_user.pop(user_id, None)
+        if item is None:
+            return False
+        self._entries.remove(item[0])
+        return True
+
+
+class Duel:
+    def __init__(self, players, stake, rng=None, max_rounds=3, lives=3):
+        self.game_id = os.urandom(6).hex()
+        self.players = tuple(players)
+        self.stake = stake  # taruhan per pemain; pemenang mendapat 2x
+        self.rng = rng or random.Random()
+        self.max_rounds = max_rounds
+        self.start_lives = lives
+        self.wins = {player: 0 for player in self.players}
+        self.round = 0
+        self.winner = None
+        self.finished = False
+        self.last_action = None
+        self.message = None  # pesan Discord duel (diisi bot.py)
+        self.guild_id = None  # guild tempat duel berjalan (diisi bot.py)
+        self.tournament = None  # (tournament_id, ronde, index match) kalau bagian turnamen
+        self._new_round()
+
+    def _new_round(self):
+        self.round += 1
+        self.lives = {player: self.start_lives for player in self.players}
+        chambers = self.rng.randint(6, 9)
+        bullets = min({1: self.rng.randint(1, 3), 2: self.rng.randint(3, 4)}.get(
+            self.round, self.rng.randint(4, 5)), chambers - 1)
+        self.revolver = [False] * chambers
+        for position in self.rng.sample(range(chambers), bullets):
+            self.revolver[position] = True
+        self.chamber = 0
+        self.turn = self.rng.choice(self.players)
+
+    def opponent(self, player):
+        return self.players[1] if player == self.players[0] else self.players[0]
+
+    def shoot(self, player, shoot_self):
+        """Giliran `player`; kembalikan (kena peluru, target)"""
+        if self.finished or player != self.turn:
+            raise ValueError("Bukan giliran pemain ini")
+        target = player if shoot_self else self.opponent(player)
+        is_bullet = self.revolver[self.chamber % len(self.revolver)]
+        self.chamber += 1
+        if is_bullet:
+            self.lives[target] -= 1
+            self.turn = self.opponent(player)
+        elif not shoot_self:
+            self.turn = self.opponent(player)
+        # Chamber kosong saat menembak diri sendiri = giliran tambahan (turn tetap)
+        self.last_action = (player, shoot_self, is_bullet)
+        if self.lives[target] <= 0:
+            self._end_round(self.opponent(target))
+        return is_bullet, target
+
+    def _end_round(self, round_winner):
+        self.wins[round_winner] += 1
+        if self.wins[round_winner] * 2 > self.max_rounds or self.round >= self.max_rounds:
+            self.finished = True
+            self.winner = max(self.players, key=self.wins.get)
+        else:
+            self._new_round()
+
+    def forfeit(self, player):
+        """Pemain keluar/kehabisan waktu: lawan menang"""
+        self.finished = True
+        self.winner = self.opponent(player)
+
+
+class DuelRegistry:
+    def __init__(self):
+        self.games = {}      # game_id -> Duel
+        self.by_player = {}  # user_id -> Duel
+
+    def __len__(self):
+        return len(self.games)
+
+    def __iter__(self):
+        return iter(list(self.games.values()))
+
+    def add(self, duel):
+        self.games[duel.game_id] = duel
+        for player in duel.players:
+            self.by_player[player] = duel
+
+    def get(self, game_id):
+        return self.games.get(game_id)
+
+    def for_player(self, user_id):
+        return self.by_player.get(user_id)
+
+    def remove(self, duel):
+        if self.games.pop(duel.game_id, None) is None:
+            return False
+        for player in duel.players:
+            if self.by_player.get(player) is duel:
+                del self.by_player[player]
+        return True
@@ -0,0 +1,98 @@
+"""Scheduler berbasis satu timer loop untuk job yang jatuh tempo di waktu tertentu
+
+Semua job berbagi satu task dan satu heap, jadi ribuan jadwal (mis. timed
+mute) tidak butuh ribuan task yang tidur. Job diidentifikasi dengan key;
+menjadwalkan ulang key yang sama menggantikan jadwal lama.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+
+class Scheduler:
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._heap = []
+        self._entries = {}  # key -> (when, seq, callback)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._running = set()  # referensi job yang sedang jalan, supaya task tidak di-GC di tengah jalan
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def schedule(self, key, when, callback):
+        """Jalankan `await callback()` pada waktu `when` (detik, clock scheduler)"""
+        seq = next(self._seq)
+        self._entries[key] = (when, seq, callback)
+        heapq.heappush(self._heap, (when, seq, key))
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+
+    def cancel(self, key):
+        # Entry di heap dibuang secara lazy saat jatuh tempo
+        return self._entries.pop(key, None) is not None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def pop_due(self, now=None):
+        """Ambil semua callback yang sudah jatuh tempo (dipakai juga oleh mode headless)"""
+        now = self.clock() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, seq, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != seq:
+                continue  # sudah di-cancel atau dijadwalkan ulang
+            del self._entries[key]
+            due.append((key, entry[2]))
+        return due
+
+    def next_deadline(self):
+        while self._heap:
+            when, seq, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == seq:
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            for key, callback in self.pop_due():
+                task = asyncio.create_task(self._fire(key, callback))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            deadline = self.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - self.clock())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fire(self, key, callback):
+        try:
+            await callback()
+        except Exception:
+            log.exception("Scheduled job %r failed", key)
@@ -0,0 +1,81 @@
+"""Statistik lifetime per user dari event bus, ditulis ke DB secara batch
+
+Subscriber event hanya menambah counter di memori (tanpa I/O), lalu
+`run()` mem-flush semua delta yang tertunda dalam satu executemany upsert
+setiap `interval` detik. Pembacaan menggabungkan nilai tersimpan dengan
+delta yang belum di-flush, jadi !stats selalu up to date.
+"""
+import asyncio
+import logging
+
+import events
+
+log = logging.getLogger(__name__)
+
+STAT_EVENTS = (events.ItemFound, events.ItemSold, events.BetSettled)
+
+
+def increments(event):
+    """Pasangan (stat, delta) yang dihasilkan satu event"""
+    if isinstance(event, events.ItemFound):
+        return [(f"found_{event.category}", 1)]
+    if isinstance(event, events.ItemSold):
+        return [("items_sold", event.quantity), ("sell_earned", event.amount)]
+    if isinstance(event, events.BetSettled):
+        prefix = "roulette" if event.game == "roulette" else "gamble"
+        if event.payout > 0:
+            return [(f"{prefix}_wins", 1), (f"{prefix}_won", event.payout)]
+        if event.payout < 0:
+            return [(f"{prefix}_losses", 1), (f"{prefix}_lost", -event.payout)]
+        return [(f"{prefix}_ties", 1)]
+    return []
+
+
+class StatsRecorder:
+    def __init__(self, write, read, interval=5.0):
+        self.write = write  # coroutine function(rows), mis. StatsRepo.add_many
+        self.read = read    # coroutine function(user_id) -> {stat: value}
+        self.interval = interval
+        self.pending = {}   # (user_id, stat) -> delta
+        self._flush_lock = asyncio.Lock()
+
+    async def record(self, batch):
+        """Handler event bus"""
+        for event in batch:
+            for stat, delta in increments(event):
+                key = (event.user_id, stat)
+                self.pending[key] = self.pending.get(key, 0) + delta
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self.pending:
+                return 0
+            pending, self.pending = self.pending, {}
+            rows = [(user_id, stat, delta) for (user_id, stat), delta in pending.items()]
+            try:
+                await self.write(rows)
+            except Exception:
+                # Kembalikan ke pending supaya ikut di flush berikutnya
+                for key, delta in pending.items():
+                    self.pending[key] = self.pending.get(key, 0) + delta
+                raise
+            return len(rows)
+
+    async def get(self, user_id):
+        # Lock: tanpa ini delta yang sedang di-flush bisa tidak terhitung atau terhitung dua kali
+        async with self._flush_lock:
+            stats = await self.read(user_id)
+            for (pending_user, stat), delta in self.pending.items():
+                if pending_user == user_id:
+                    stats[stat] = stats.get(stat, 0) + delta
+        return stats
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                # shield: kalau task dibatalkan saat shutdown, write yang sedang jalan tetap selesai
+                # dan flush terakhir di close() menunggu lock-nya
+                await asyncio.shield(self.flush())
+            except Exception:
+                log.exception("Gagal flush user stats")
@@ -0,0 +1,1198 @@
+"""Repository penyimpanan data bot dengan dua backend: SQLite dan in-memory
+
+Command tidak menulis SQL sendiri; semuanya lewat repo di sini:
+
+- UserRepo      saldo dan status VIP
+- InventoryRepo barang milik user
+- UsageRepo     limit harian !cari
+- MetaRepo      key-value metadata bot
+- MuteRepo      timed mute yang belum selesai
+- StatsRepo     statistik lifetime per user (counter per nama stat)
+- TournamentRepo state turnamen roulette (JSON)
+
+SQLiteStorage adalah perilaku produksi (userdata.db). MemoryStorage murni
+dict/list tanpa I/O, dipakai untuk load test dan untuk memisahkan biaya
+database dari biaya logika saat profiling. Setiap method MemoryStorage
+tidak pernah await di tengah operasi, jadi atomik di event loop.
+
+Tabel ekonomi (users, inventory, daily_usage) dikunci (guild_id, user_id).
+Repo ekonomi bekerja di satu guild: `Storage.scoped(guild_id)`, dengan
+guild 0 sebagai ekonomi global. PartitionedStorage menaruh ekonomi tiap
+guild (atau tiap bucket hash guild) di file SQLite sendiri.
+"""
+import abc
+import asyncio
+import contextlib
+import datetime
+import glob
+import json
+import os
+import zlib
+
+import aiosqlite
+
+DEFAULT_BALANCE = 100
+# Baris per executemany di operasi massal (upsert_many/add_many); progress dilaporkan per chunk
+BULK_CHUNK = 1000
+
+
+def today_iso():
+    return datetime.date.today().isoformat()
+
+
+def _chunks(rows, size=BULK_CHUNK):
+    rows = list(rows)
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class UserRepo(abc.ABC):
+    @abc.abstractmethod
+    async def get(self, user_id):
+        """Return (balance, vip); buat user baru dengan saldo default kalau belum ada"""
+
+    @abc.abstractmethod
+    async def get_profile(self, user_id):
+        """Seperti get tapi ikut item_count: (balance, vip, item_count) dalam satu lookup"""
+
+    @abc.abstractmethod
+    async def update(self, user_id, balance=None, vip=None):
+        """Set saldo dan/atau status VIP"""
+
+    @abc.abstractmethod
+    async def adjust_balance(self, user_id, delta, allow_negative=True):
+        """Tambah/kurangi saldo secara atomik; None kalau saldo tidak cukup"""
+
+    @abc.abstractmethod
+    async def transfer(self, sender_id, receiver_id, amount):
+        """Pindahkan saldo secara atomik; saldo baru pengirim, None kalau tidak cukup"""
+
+    @abc.abstractmethod
+    async def adjust_many(self, deltas, allow_negative=False, once=None):
+        """Terapkan [(user_id, delta), ...] dalam satu transaksi; {user_id: saldo baru}, None kalau ada yang gagal
+
+        `once`: key unik yang dicatat di transaksi yang sama; kalau key itu
+        sudah tercatat, tidak ada yang diubah dan hasilnya {}.
+        """
+
+    @abc.abstractmethod
+    async def get_many(self, user_ids):
+        """{user_id: (balance, vip, item_count)} untuk user yang sudah ada, tanpa membuat user baru"""
+
+    @abc.abstractmethod
+    async def upsert_many(self, deltas, vip=None, progress=None):
+        """Operasi massal: [(user_id, delta), ...] dan/atau set VIP dalam satu transaksi
+
+        User yang belum ada dibuat. Debit tidak membuat saldo di bawah 0
+        (saldo yang sudah minus tidak ikut turun). progress(jumlah_selesai)
+        dipanggil per chunk. Kembalikan jumlah user yang ditulis.
+        """
+
+
+class InventoryRepo(abc.ABC):
+    @abc.abstractmethod
+    async def add(self, user_id, item_name, item_category, item_value, quantity=1):
+        """Tambah barang (menumpuk quantity kalau sudah ada)"""
+
+    @abc.abstractmethod
+    async def list(self, user_id):
+        """List (item_name, item_category, item_value, quantity) urut kategori lalu nama"""
+
+    @abc.abstractmethod
+    async def count(self, user_id):
+        """Total quantity semua barang"""
+
+    @abc.abstractmethod
+    async def check_counts(self, fix=False):
+        """List (user_id, item_count, actual) yang tidak cocok; fix=True menghitung ulang"""
+
+    @abc.abstractmethod
+    async def remove(self, user_id, item_name, quantity=1):
+        """Kurangi barang; False kalau tidak ada atau tidak cukup"""
+
+    @abc.abstractmethod
+    async def clear(self, user_id):
+        """Hapus semua barang user; kembalikan baris yang terhapus (format seperti list)"""
+
+    @abc.abstractmethod
+    async def add_many(self, quantities, item_name, item_category, item_value, progress=None):
+        """Tambah barang yang sama ke [(user_id, quantity), ...] dalam satu transaksi (user baru dibuat)"""
+
+
+class UsageRepo(abc.ABC):
+    @abc.abstractmethod
+    async def get(self, user_id):
+        """Jumlah !cari hari ini (reset otomatis kalau sudah ganti hari)"""
+
+    @abc.abstractmethod
+    async def increment(self, user_id):
+        """Tambah satu pemakaian !cari hari ini"""
+
+
+class MetaRepo(abc.ABC):
+    @abc.abstractmethod
+    async def get(self, key):
+        pass
+
+    @abc.abstractmethod
+    async def set(self, key, value):
+        pass
+
+
+class StatsRepo(abc.ABC):
+    @abc.abstractmethod
+    async def add_many(self, rows):
+        """Tambahkan delta [(user_id, stat, delta), ...] dalam satu transaksi"""
+
+    @abc.abstractmethod
+    async def get(self, user_id):
+        """Dict {stat: value} milik user"""
+
+
+class MuteRepo(abc.ABC):
+    @abc.abstractmethod
+    async def add(self, guild_id, user_id, unmute_at):
+        pass
+
+    @abc.abstractmethod
+    async def remove(self, guild_id, user_id):
+        pass
+
+    @abc.abstractmethod
+    async def list(self):
+        """List (guild_id, user_id, unmute_at)"""
+
+
+class TournamentRepo(abc.ABC):
+    @abc.abstractmethod
+    async def save(self, tournament_id, guild_id, state, active):
+        """Simpan state turnamen (dict JSON); active=False untuk turnamen yang sudah selesai/batal"""
+
+    @abc.abstractmethod
+    async def list_active(self):
+        """List state (dict) turnamen yang belum selesai"""
+
+
+class Storage(abc.ABC):
+    """Kumpulan repo satu backend"""
+    users: UserRepo
+    inventory: InventoryRepo
+    usage: UsageRepo
+    meta: MetaRepo
+    mutes: MuteRepo
+    stats: StatsRepo
+    tournaments: TournamentRepo
+
+    guild_id = 0  # scope ekonomi (users/inventory/usage); 0 = ekonomi global
+
+    @abc.abstractmethod
+    def scoped(self, guild_id):
+        """Storage yang sama dengan repo ekonomi milik `guild_id`; repo lain dipakai bersama"""
+
+    async def init(self):
+        pass
+
+    async def ping(self):
+        """Query ringan untuk health check"""
+
+    async def close(self):
+        pass
+
+
+# SQLite backend
+
+# Tabel ekonomi dikunci (guild_id, user_id); guild_id 0 = ekonomi global.
+# Dipakai oleh init dan oleh migrasi tabel lama yang hanya dikunci user_id.
+ECONOMY_TABLES = {
+    'users': """
+        CREATE TABLE IF NOT EXISTS users (
+            guild_id INTEGER NOT NULL DEFAULT 0,
+            user_id INTEGER NOT NULL,
+            balance INTEGER NOT NULL DEFAULT 100,
+            vip INTEGER NOT NULL DEFAULT 0,
+            item_count INTEGER NOT NULL DEFAULT 0,
+            last_active TEXT,
+            PRIMARY KEY (guild_id, user_id)
+        ) WITHOUT ROWID
+    """,
+    # User tidak aktif yang dipindahkan maintenance, dipulihkan saat user kembali
+    'users_archive': """
+        CREATE TABLE IF NOT EXISTS users_archive (
+            guild_id INTEGER NOT NULL DEFAULT 0,
+            user_id INTEGER NOT NULL,
+            balance INTEGER NOT NULL,
+            vip INTEGER NOT NULL,
+            last_active TEXT,
+            archived_at TEXT NOT NULL,
+            PRIMARY KEY (guild_id, user_id)
+        ) WITHOUT ROWID
+    """,
+    'inventory': """
+        CREATE TABLE IF NOT EXISTS inventory (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL DEFAULT 0,
+            user_id INTEGER NOT NULL,
+            item_name TEXT NOT NULL,
+            item_category TEXT NOT NULL,
+            item_value INTEGER NOT NULL,
+            quantity INTEGER NOT NULL DEFAULT 1,
+            FOREIGN KEY (guild_id, user_id) REFERENCES users (guild_id, user_id)
+        )
+    """,
+    # Usage tracking table for daily limits
+    'daily_usage': """
+        CREATE TABLE IF NOT EXISTS daily_usage (
+            guild_id INTEGER NOT NULL DEFAULT 0,
+            user_id INTEGER NOT NULL,
+            cari_count INTEGER NOT NULL DEFAULT 0,
+            last_reset DATE NOT NULL DEFAULT (date('now')),
+            PRIMARY KEY (guild_id, user_id),
+            FOREIGN KEY (guild_id, user_id) REFERENCES users (guild_id, user_id)
+        ) WITHOUT ROWID
+    """,
+}
+
+
+class ConnectionPool:
+    """Koneksi aiosqlite yang dipakai ulang untuk satu file database
+
+    Tiap koneksi aiosqlite punya thread sendiri, jadi membukanya per query
+    mahal. Pool menyimpan koneksi idle dan membatasi koneksi bersamaan ke
+    file ini; antrean writer di satu file tidak menghabiskan koneksi file
+    lain. Koneksi dikembalikan ke pool tanpa transaksi terbuka.
+    """
+
+    def __init__(self, path, size=8, busy_timeout=10.0):
+        self.path = path
+        self.size = size
+        self.busy_timeout = busy_timeout
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+
+    @contextlib.asynccontextmanager
+    async def connect(self):
+        async with self._slots:
+            db = self._idle.pop() if self._idle else await aiosqlite.connect(self.path, timeout=self.busy_timeout)
+            try:
+                yield db
+                if db.in_transaction:
+                    await db.rollback()
+            except BaseException:
+                # State koneksi tidak jelas (mis. query dibatalkan di tengah): jangan dipakai ulang
+                await db.close()
+                raise
+            self._idle.append(db)
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for db in idle:
+            await db.close()
+
+    @contextlib.asynccontextmanager
+    async def exclusive(self):
+        """Tahan semua slot dan tutup koneksi idle, mis. selama file database ditimpa restore
+
+        Query yang sedang jalan ditunggu selesai; query baru menunggu dan
+        membuka koneksi baru setelah blok ini selesai.
+        """
+        acquired = 0
+        try:
+            while acquired < self.size:
+                await self._slots.acquire()
+                acquired += 1
+            await self.close()
+            yield
+        finally:
+            for _ in range(acquired):
+                self._slots.release()
+
+
+class SQLiteStorage(Storage):
+    def __init__(self, path, busy_timeout=10.0, pool_size=8, guild_id=0, pool=None):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.guild_id = guild_id  # scope ekonomi repo users/inventory/usage
+        self.pool = pool or ConnectionPool(path, pool_size, busy_timeout)
+        self.users = SQLiteUserRepo(self)
+        self.inventory = SQLiteInventoryRepo(self)
+        self.usage = SQLiteUsageRepo(self)
+        self.meta = SQLiteMetaRepo(self)
+        self.mutes = SQLiteMuteRepo(self)
+        self.stats = SQLiteStatsRepo(self)
+        self.tournaments = SQLiteTournamentRepo(self)
+        self._scopes = {guild_id: self}
+
+    def connect(self):
+        """Koneksi SQLite dari pool file ini, dengan busy timeout (aman dipakai bersama oleh beberapa proses shard)"""
+        return self.pool.connect()
+
+    def scoped(self, guild_id):
+        """Storage yang sama (file dan pool) dengan ekonomi milik `guild_id`"""
+        scope = self._scopes.get(guild_id)
+        if scope is None:
+            scope = self._scopes[guild_id] = SQLiteStorage(
+                self.path, self.busy_timeout, guild_id=guild_id, pool=self.pool)
+        return scope
+
+    async def close(self):
+        await self.pool.close()
+
+    def exclusive(self):
+        """Kosongkan pool file ini selama blok `async with` (lihat ConnectionPool.exclusive)"""
+        return self.pool.exclusive()
+
+    async def init(self):
+        async with self.connect() as db:
+            # Hanya berlaku untuk database baru (kosong); halaman kosong dikembalikan oleh maintenance
+            await db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL: pembaca tidak memblokir writer, penting saat banyak shard berbagi file
+            await db.execute("PRAGMA journal_mode=WAL")
+            for schema in ECONOMY_TABLES.values():
+                await db.execute(schema)
+
+            # Timed mute yang belum selesai (dimuat ulang ke scheduler saat startup)
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS timed_mutes (
+                    guild_id INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    unmute_at REAL NOT NULL,
+                    PRIMARY KEY (guild_id, user_id)
+                )
+            """)
+
+            # Turnamen roulette: state JSON (peserta, bracket, hasil), dimuat ulang saat startup
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS tournaments (
+                    tournament_id TEXT PRIMARY KEY,
+                    guild_id INTEGER NOT NULL,
+                    active INTEGER NOT NULL,
+                    state TEXT NOT NULL
+                )
+            """)
+
+            # Key-value metadata bot (mis. hash slash command terakhir yang di-sync)
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS bot_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+
+            # Statistik lifetime, satu baris per (user, stat) supaya stat baru tidak butuh migrasi
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS user_stats (
+                    user_id INTEGER NOT NULL,
+                    stat TEXT NOT NULL,
+                    value INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, stat)
+                ) WITHOUT ROWID
+            """)
+            await db.commit()
+            await self._migrate_guild_keys(db)
+            await self._create_item_count_triggers(db)
+            # Lookup barang selalu per (guild, user, nama barang)
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS inventory_owner ON inventory (guild_id, user_id, item_name)")
+            await db.commit()
+
+    async def _migrate_guild_keys(self, db):
+        """Bangun ulang tabel ekonomi lama (kunci user_id saja) dengan kunci (guild_id, user_id)
+
+        Data lama masuk ke guild_id 0 (ekonomi global). Kolom yang belum ada di
+        database yang sangat lama (item_count, last_active) diisi ulang di sini.
+        """
+        # IMMEDIATE: beberapa proses shard bisa menjalankan init bersamaan
+        await db.execute("BEGIN IMMEDIATE")
+        cursor = await db.execute("PRAGMA table_info(users)")
+        user_columns = [row[1] for row in await cursor.fetchall()]
+        if 'guild_id' in user_columns:
+            await db.commit()
+            return
+        # Trigger lama menunjuk users tanpa guild_id; dibuat ulang setelah migrasi
+        for trigger in ('inventory_count_insert', 'inventory_count_update', 'inventory_count_delete'):
+            await db.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        for table, schema in ECONOMY_TABLES.items():
+            cursor = await db.execute(f"PRAGMA table_info({table})")
+            old_columns = [row[1] for row in await cursor.fetchall()]
+            await db.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+            await db.execute(schema)
+            cursor = await db.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in await cursor.fetchall() if row[1] in old_columns]
+            await db.execute(f"INSERT INTO {table} ({', '.join(columns)}) "
+                             f"SELECT {', '.join(columns)} FROM {table}_old")
+            await db.execute(f"DROP TABLE {table}_old")
+        if 'item_count' not in user_columns:
+            # users.item_count = SUM(inventory.quantity), dijaga trigger supaya cek kapasitas cukup point lookup
+            await db.execute("""
+                UPDATE users SET item_count = COALESCE((SELECT SUM(quantity) FROM inventory
+                    WHERE inventory.guild_id = users.guild_id AND inventory.user_id = users.user_id), 0)
+            """)
+        if 'last_active' not in user_columns:
+            # Aktivitas lama tidak diketahui: hitung mulai dari hari migrasi
+            await db.execute("UPDATE users SET last_active = ?", (today_iso(),))
+        await db.commit()
+
+    async def _create_item_count_triggers(self, db):
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS inventory_count_insert AFTER INSERT ON inventory
+            BEGIN
+                UPDATE users SET item_count = item_count + NEW.quantity
+                WHERE guild_id = NEW.guild_id AND user_id = NEW.user_id;
+            END
+        """)
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS inventory_count_update AFTER UPDATE OF guild_id, user_id, quantity ON inventory
+            BEGIN
+                UPDATE users SET item_count = item_count - OLD.quantity
+                WHERE guild_id = OLD.guild_id AND user_id = OLD.user_id;
+                UPDATE users SET item_count = item_count + NEW.quantity
+                WHERE guild_id = NEW.guild_id AND user_id = NEW.user_id;
+            END
+        """)
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS inventory_count_delete AFTER DELETE ON inventory
+            BEGIN
+                UPDATE users SET item_count = item_count - OLD.quantity
+                WHERE guild_id = OLD.guild_id AND user_id = OLD.user_id;
+            END
+        """)
+
+    async def ping(self):
+        # Baca sqlite_master butuh shared lock, jadi DB yang terkunci ikut terdeteksi
+        async with self.connect() as db:
+            cursor = await db.execute("SELECT 1 FROM sqlite_master LIMIT 1")
+            await cursor.fetchone()
+
+
+class SQLiteUserRepo(UserRepo):
+    def __init__(self, storage):
+        self.storage = storage
+        self.guild_id = storage.guild_id
+
+    async def _restore_or_insert(self, db, user_id):
+        """Pulihkan user dari users_archive, atau buat baru dengan saldo awal"""
+        cursor = await db.execute("""
+            INSERT OR IGNORE INTO users (guild_id, user_id, balance, vip, item_count, last_active)
+            SELECT guild_id, user_id, balance, vip,
+                   COALESCE((SELECT SUM(quantity) FROM inventory
+                             WHERE inventory.guild_id = users_archive.guild_id
+                               AND inventory.user_id = users_archive.user_id), 0), ?
+            FROM users_archive WHERE guild_id = ? AND user_id = ?
+        """, (today_iso(), self.guild_id, user_id))
+        if cursor.rowcount:
+            await db.execute("DELETE FROM users_archive WHERE guild_id = ? AND user_id = ?",
+                             (self.guild_id, user_id))
+        else:
+            # OR IGNORE: shard lain bisa saja membuat row yang sama bersamaan
+            await db.execute(
+                "INSERT OR IGNORE INTO users (guild_id, user_id, balance, vip, last_active) VALUES (?, ?, ?, 0, ?)",
+                (self.guild_id, user_id, DEFAULT_BALANCE, today_iso()))
+
+    async def _create(self, db, user_id):
+        await db.execute("BEGIN IMMEDIATE")
+        await self._restore_or_insert(db, user_id)
+        cursor = await db.execute(
+            "SELECT balance, vip, item_count FROM users WHERE guild_id = ? AND user_id = ?",
+            (self.guild_id, user_id))
+        balance, vip, item_count = await cursor.fetchone()
+        await db.commit()
+        return balance, bool(vip), item_count
+
+    async def get(self, user_id):
+        async with self.storage.connect() as db:
+            cursor = await db.execute(
+                "SELECT balance, vip FROM users WHERE guild_id = ? AND user_id = ?", (self.guild_id, user_id))
+            row = await cursor.fetchone()
+            if row is None:
+                balance, vip, _ = await self._create(db, user_id)
+                return balance, vip
+            balance, vip = row
+            return balance, bool(vip)
+
+    async def get_profile(self, user_id):
+        async with self.storage.connect() as db:
+            cursor = await db.execute(
+                "SELECT balance, vip, item_count FROM users WHERE guild_id = ? AND user_id = ?",
+                (self.guild_id, user_id))
+            row = await cursor.fetchone()
+            if row is None:
+                return await self._create(db, user_id)
+            balance, vip, item_count = row
+            return balance, bool(vip), item_count
+
+    async def update(self, user_id, balance=None, vip=None):
+        async with self.storage.connect() as db:
+            key = (today_iso(), self.guild_id, user_id)
+            if balance is not None and vip is not None:
+                await db.execute(
+                    "UPDATE users SET balance = ?, vip = ?, last_active = ? WHERE guild_id = ? AND user_id = ?",
+                    (balance, int(vip)) + key)
+            elif balance is not None:
+                await db.execute("UPDATE users SET balance = ?, last_active = ? WHERE guild_id = ? AND user_id = ?",
+                                 (balance,) + key)
+            elif vip is not None:
+                await db.execute("UPDATE users SET vip = ?, last_active = ? WHERE guild_id = ? AND user_id = ?",
+                                 (int(vip),) + key)
+            await db.commit()
+
+    async def _adjust(self, db, user_id, delta, allow_negative):
+        cursor = await db.execute(
+            "UPDATE users SET balance = balance + ?, last_active = ? "
+            "WHERE guild_id = ? AND user_id = ? AND (? OR balance + ? >= 0)",
+            (delta, today_iso(), self.guild_id, user_id, int(allow_negative), delta))
+        return cursor.rowcount > 0
+
+    async def _balance(self, db, user_id):
+        cursor = await db.execute(
+            "SELECT balance FROM users WHERE guild_id = ? AND user_id = ?", (self.guild_id, user_id))
+        return (await cursor.fetchone())[0]
+
+    async def adjust_balance(self, user_id, delta, allow_negative=True):
+        async with self.storage.connect() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            if not await self._adjust(db, user_id, delta, allow_negative):
+                await db.rollback()
+                return None
+            balance = await self._balance(db, user_id)
+            await db.commit()
+            return balance
+
+    async def transfer(self, sender_id, receiver_id, amount):
+        async with self.storage.connect() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            if not await self._adjust(db, sender_id, -amount, False):
+                await db.rollback()
+                return None
+            if not await self._adjust(db, receiver_id, amount, True):
+                # Penerima bisa saja baru diarsipkan maintenance; pulihkan supaya uangnya tidak hilang
+                await self._restore_or_insert(db, receiver_id)
+                await self._adjust(db, receiver_id, amount, True)
+            balance = await self._balance(db, sender_id)
+            await db.commit()
+            return balance
+
+    async def adjust_many(self, deltas, allow_negative=False, once=None):
+        async with self.storage.connect() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            if once is not None:
+                # bot_meta ada di file yang sama dengan users, jadi penanda ikut transaksi ini
+                cursor = await db.execute("INSERT OR IGNORE INTO bot_meta (key, value) VALUES (?, ?)",
+                                          (once, today_iso()))
+                if cursor.rowcount == 0:
+                    await db.rollback()
+                    return {}
+            for user_id, delta in deltas:
+                if not await self._adjust(db, user_id, delta, allow_negative):
+                    await db.rollback()
+                    return None
+            balances = {user_id: await self._balance(db, user_id) for user_id, _ in deltas}
+            await db.commit()
+            return balances
+
+    async def _restore_many(self, db, user_ids):
+        """_restore_or_insert versi massal, bagian arsip: pulihkan user dari users_archive"""
+        keys = [(self.guild_id, user_id) for user_id in user_ids]
+        await db.executemany("""
+            INSERT OR IGNORE INTO users (guild_id, user_id, balance, vip, item_count, last_active)
+            SELECT guild_id, user_id, balance, vip,
+                   COALESCE((SELECT SUM(quantity) FROM inventory
+                             WHERE inventory.guild_id = users_archive.guild_id
+                               AND inventory.user_id = users_archive.user_id), 0), ?
+            FROM users_archive WHERE guild_id = ? AND user_id = ?
+        """, [(today_iso(),) + key for key in keys])
+        await db.executemany("DELETE FROM users_archive WHERE guild_id = ? AND user_id = ?", keys)
+
+    async def _ensure_many(self, db, user_ids):
+        """Pastikan semua user ada (dipulihkan dari arsip atau dibuat dengan saldo awal)"""
+        await self._restore_many(db, user_ids)
+        await db.executemany(
+            "INSERT OR IGNORE INTO users (guild_id, user_id, balance, vip, last_active) VALUES (?, ?, ?, 0, ?)",
+            [(self.guild_id, user_id, DEFAULT_BALANCE, today_iso()) for user_id in user_ids])
+
+    async def get_many(self, user_ids):
+        users = {}
+        async with self.storage.connect() as db:
+            for chunk in _chunks(user_ids):
+                cursor = await db.execute(
+                    "SELECT user_id, balance, vip, item_count FROM users "
+                    f"WHERE guild_id = ? AND user_id IN ({', '.join('?' * len(chunk))})",
+                    (self.guild_id, *chunk))
+                for user_id, balance, vip, item_count in await cursor.fetchall():
+                    users[user_id] = (balance, bool(vip), item_count)
+        return users
+
+    async def upsert_many(self, deltas, vip=None, progress=None):
+        vip = None if vip is None else int(vip)
+        done = 0
+        async with self.storage.connect() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            for chunk in _chunks(deltas):
+                await self._restore_many(db, [user_id for user_id, _ in chunk])
+                # vip NULL = status VIP tidak diubah
+                await db.executemany("""
+                    INSERT INTO users (guild_id, user_id, balance, vip, last_active)
+                    VALUES (?, ?, MAX(? + ?, 0), COALESCE(?, 0), ?)
+                    ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                        balance = MAX(balance + ?, MIN(balance, 0)),
+                        vip = COALESCE(?, vip),
+                        last_active = excluded.last_active
+                """, [(self.guild_id, user_id, DEFAULT_BALANCE, delta, vip, today_iso(), delta, vip)
+                      for user_id, delta in chunk])
+                done += len(chunk)
+                if progress:
+                    progress(done)
+            await db.commit()
+        return done
+
+
+class SQLiteInventoryRepo(InventoryRepo):
+    def __init__(self, storage):
+        self.storage = storage
+        self.guild_id = storage.guild_id
+
+    async def add(self, user_id, item_name, item_category, item_value, quantity=1):
+        async with self.storage.connect() as db:
+            # Kunci writer dulu supaya read-modify-write tidak balapan antar shard
+            await db.execute("BEGIN IMMEDIATE")
+            # Check if item already exists
+            cursor = await db.execute(
+                "SELECT quantity FROM inventory WHERE guild_id = ? AND user_id = ? AND item_name = ?",
+                (self.guild_id, user_id, item_name))
+            row = await cursor.fetchone()
+
+            if row:
+                # Update quantity if item exists
+                new_quantity = row[0] + quantity
+                await db.execute(
+                    "UPDATE inventory SET quantity = ? WHERE guild_id = ? AND user_id = ? AND item_name = ?",
+                    (new_quantity, self.guild_id, user_id, item_name))
+            else:
+                # Add new item
+                await db.execute(
+                    "INSERT INTO inventory (guild_id, user_id, item_name, item_category, item_value, quantity) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.guild_id, user_id, item_name, item_category, item_value, quantity))
+            await db.commit()
+
+    async def list(self, user_id):
+        async with self.storage.connect() as db:
+            cursor = await db.execute(
+                "SELECT item_name, item_category, item_value, quantity FROM inventory "
+                "WHERE guild_id = ? AND user_id = ? ORDER BY item_category, item_name",
+                (self.guild_id, user_id))
+            return await cursor.fetchall()
+
+    async def count(self, user_id):
+        async with self.storage.connect() as db:
+            cursor = await db.execute(
+                "SELECT item_count FROM users WHERE guild_id = ? AND user_id = ?", (self.guild_id, user_id))
+            result = await cursor.fetchone()
+            return result[0] if result else 0
+
+    async def check_counts(self, fix=False):
+        async with self.storage.connect() as db:
+            await db.execute("BEGIN IMMEDIATE" if fix else "BEGIN")
+            cursor = await db.execute("""
+                SELECT users.user_id, users.item_count, COALESCE(SUM(inventory.quantity), 0) AS actual
+                FROM users LEFT JOIN inventory
+                    ON inventory.guild_id = users.guild_id AND inventory.user_id = users.user_id
+                WHERE users.guild_id = ?
+                GROUP BY users.user_id
+                HAVING users.item_count != actual
+            """, (self.guild_id,))
+            mismatches = await cursor.fetchall()
+            if fix:
+                await db.executemany("UPDATE users SET item_count = ? WHERE guild_id = ? AND user_id = ?",
+                                     [(actual, self.guild_id, user_id) for user_id, _, actual in mismatches])
+            await db.commit()
+            return mismatches
+
+    async def remove(self, user_id, item_name, quantity=1):
+        async with self.storage.connect() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            key = (self.guild_id, user_id, item_name)
+            cursor = await db.execute(
+                "SELECT quantity FROM inventory WHERE guild_id = ? AND user_id = ? AND item_name = ?", key)
+            row = await cursor.fetchone()
+
+            if not row or row[0] < quantity:
+                await db.rollback()
+                return False  # Item not found / not enough items
+
+            new_quantity = row[0] - quantity
+            if new_quantity == 0:
+                # Remove item completely
+                await db.execute(
+                    "DELETE FROM inventory WHERE guild_id = ? AND user_id = ? AND item_name = ?", key)
+            else:
+                # Update quantity
+                await db.execute(
+                    "UPDATE inventory SET quantity = ? WHERE guild_id = ? AND user_id = ? AND item_name = ?",
+                    (new_quantity,) + key)
+
+            await db.commit()
+            return True
+
+    async def clear(self, user_id):
+        async with self.storage.connect() as db:
+            # Baca dan hapus dalam satu transaksi supaya barang yang masuk di tengah tidak ikut hilang
+            await db.execute("BEGIN IMMEDIATE")
+            cursor = await db.execute(
+                "SELECT item_name, item_category, item_value, quantity FROM inventory "
+                "WHERE guild_id = ? AND user_id = ? ORDER BY item_category, item_name",
+                (self.guild_id, user_id))
+            rows = await cursor.fetchall()
+            await db.execute("DELETE FROM inventory WHERE guild_id = ? AND user_id = ?", (self.guild_id, user_id))
+            await db.commit()
+            return rows
+
+    async def add_many(self, quantities, item_name, item_category, item_value, progress=None):
+        done = 0
+        async with self.storage.connect() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            for chunk in _chunks(quantities):
+                await self.storage.users._ensure_many(db, [user_id for user_id, _ in chunk])
+                # Tumpuk ke baris yang sudah ada, lalu insert untuk user yang belum punya barangnya
+                await db.executemany(
+                    "UPDATE inventory SET quantity = quantity + ? WHERE guild_id = ? AND user_id = ? AND item_name = ?",
+                    [(quantity, self.guild_id, user_id, item_name) for user_id, quantity in chunk])
+                await db.executemany(
+                    "INSERT INTO inventory (guild_id, user_id, item_name, item_category, item_value, quantity) "
+                    "SELECT ?, ?, ?, ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM inventory "
+                    "WHERE guild_id = ? AND user_id = ? AND item_name = ?)",
+                    [(self.guild_id, user_id, item_name, item_category, item_value, quantity,
+                      self.guild_id, user_id, item_name) for user_id, quantity in chunk])
+                done += len(chunk)
+                if progress:
+                    progress(done)
+            await db.commit()
+        return done
+
+
+class SQLiteUsageRepo(UsageRepo):
+    def __init__(self, storage):
+        self.storage = storage
+        self.guild_id = storage.guild_id
+
+    async def get(self, user_id):
+        async with self.storage.connect() as db:
+            # Check if we need to reset (new day)
+            cursor = await db.execute(
+                "SELECT cari_count, last_reset FROM daily_usage WHERE guild_id = ? AND user_id = ?",
+                (self.guild_id, user_id))
+            row = await cursor.fetchone()
+
+            today = today_iso()
+
+            if not row:
+                # Create new record for user
+                await db.execute(
+                    "INSERT OR IGNORE INTO daily_usage (guild_id, user_id, cari_count, last_reset) VALUES (?, ?, 0, ?)",
+                    (self.guild_id, user_id, today))
+                await db.commit()
+                return 0
+
+            cari_count, last_reset = row
+
+            # Reset count if it's a new day
+            if last_reset != today:
+                await db.execute(
+                    "UPDATE daily_usage SET cari_count = 0, last_reset = ? "
+                    "WHERE guild_id = ? AND user_id = ? AND last_reset != ?",
+                    (today, self.guild_id, user_id, today))
+                await db.commit()
+                return 0
+
+            return cari_count
+
+    async def increment(self, user_id):
+        async with self.storage.connect() as db:
+            today = today_iso()
+
+            # Insert or update usage count
+            await db.execute("""
+                INSERT INTO daily_usage (guild_id, user_id, cari_count, last_reset)
+                VALUES (?, ?, 1, ?)
+                ON CONFLICT(guild_id, user_id) DO UPDATE SET
+                cari_count = cari_count + 1,
+                last_reset = ?
+            """, (self.guild_id, user_id, today, today))
+            await db.commit()
+
+
+class SQLiteMetaRepo(MetaRepo):
+    def __init__(self, storage):
+        self.storage = storage
+
+    async def get(self, key):
+        async with self.storage.connect() as db:
+            cursor = await db.execute("SELECT value FROM bot_meta WHERE key = ?", (key,))
+            row = await cursor.fetchone()
+            return row[0] if row else None
+
+    async def set(self, key, value):
+        async with self.storage.connect() as db:
+            await db.execute(
+                "INSERT INTO bot_meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value))
+            await db.commit()
+
+
+class SQLiteStatsRepo(StatsRepo):
+    def __init__(self, storage):
+        self.storage = storage
+
+    async def add_many(self, rows):
+        async with self.storage.connect() as db:
+            await db.executemany(
+                "INSERT INTO user_stats (user_id, stat, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(user_id, stat) DO UPDATE SET value = value + excluded.value",
+                rows)
+            await db.commit()
+
+    async def get(self, user_id):
+        async with self.storage.connect() as db:
+            cursor = await db.execute(
+                "SELECT stat, value FROM user_stats WHERE user_id = ?", (user_id,))
+            return dict(await cursor.fetchall())
+
+
+class SQLiteMuteRepo(MuteRepo):
+    def __init__(self, storage):
+        self.storage = storage
+
+    async def add(self, guild_id, user_id, unmute_at):
+        async with self.storage.connect() as db:
+            await db.execute(
+                "INSERT INTO timed_mutes (guild_id, user_id, unmute_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(guild_id, user_id) DO UPDATE SET unmute_at = excluded.unmute_at",
+                (guild_id, user_id, unmute_at))
+            await db.commit()
+
+    async def remove(self, guild_id, user_id):
+        async with self.storage.connect() as db:
+            await db.execute(
+                "DELETE FROM timed_mutes WHERE guild_id = ? AND user_id = ?",
+                (guild_id, user_id))
+            await db.commit()
+
+    async def list(self):
+        async with self.storage.connect() as db:
+            cursor = await db.execute("SELECT guild_id, user_id, unmute_at FROM timed_mutes")
+            return await cursor.fetchall()
+
+
+class SQLiteTournamentRepo(TournamentRepo):
+    def __init__(self, storage):
+        self.storage = storage
+
+    async def save(self, tournament_id, guild_id, state, active):
+        async with self.storage.connect() as db:
+            await db.execute(
+                "INSERT INTO tournaments (tournament_id, guild_id, active, state) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(tournament_id) DO UPDATE SET active = excluded.active, state = excluded.state",
+                (tournament_id, guild_id, int(active), json.dumps(state)))
+            await db.commit()
+
+    async def list_active(self):
+        async with self.storage.connect() as db:
+            cursor = await db.execute("SELECT state FROM tournaments WHERE active = 1")
+            return [json.loads(state) for state, in await cursor.fetchall()]
+
+
+# In-memory backend
+
+class MemoryStorage(Storage):
+    def __init__(self):
+        self.inventory = MemoryInventoryRepo()
+        self.users = MemoryUserRepo(self.inventory)
+        self.usage = MemoryUsageRepo()
+        self.meta = MemoryMetaRepo()
+        self.mutes = MemoryMuteRepo()
+        self.stats = MemoryStatsRepo()
+        self.tournaments = MemoryTournamentRepo()
+        self._scopes = {0: self}
+
+    def scoped(self, guild_id):
+        scope = self._scopes.get(guild_id)
+        if scope is None:
+            scope = self._scopes[guild_id] = MemoryStorage()
+            scope.guild_id = guild_id
+            scope.meta, scope.mutes, scope.stats, scope.tournaments = (
+                self.meta, self.mutes, self.stats, self.tournaments)
+            scope._scopes = self._scopes
+        return scope
+
+
+class MemoryUserRepo(UserRepo):
+    def __init__(self, inventory):
+        self.rows = {}  # user_id -> [balance, vip]
+        self.inventory = inventory  # item_count dihitung langsung dari inventori
+        self.applied = set()  # key `once` dari adjust_many yang sudah diterapkan
+
+    def _row(self, user_id):
+        row = self.rows.get(user_id)
+        if row is None:
+            row = self.rows[user_id] = [DEFAULT_BALANCE, False]
+        return row
+
+    async def get(self, user_id):
+        balance, vip = self._row(user_id)
+        return balance, vip
+
+    async def get_profile(self, user_id):
+        balance, vip = self._row(user_id)
+        return balance, vip, self.inventory.item_count(user_id)
+
+    async def update(self, user_id, balance=None, vip=None):
+        row = self.rows.get(user_id)
+        if row is None:
+            return
+        if balance is not None:
+            row[0] = balance
+        if vip is not None:
+            row[1] = bool(vip)
+
+    async def adjust_balance(self, user_id, delta, allow_negative=True):
+        row = self.rows.get(user_id)
+        if row is None or (not allow_negative and row[0] + delta < 0):
+            return None
+        row[0] += delta
+        return row[0]
+
+    async def transfer(self, sender_id, receiver_id, amount):
+        sender = self.rows.get(sender_id)
+        if sender is None or sender[0] < amount:
+            return None
+        sender[0] -= amount
+        # Seperti SQLite: penerima yang belum ada dibuat dulu (saldo awal), lalu dikredit
+        self._row(receiver_id)[0] += amount
+        return sender[0]
+
+    async def adjust_many(self, deltas, allow_negative=False, once=None):
+        if once in self.applied:
+            return {}
+        balances = {}
+        for user_id, delta in deltas:
+            row = self.rows.get(user_id)
+            if row is None:
+                return None
+            balances[user_id] = balances.get(user_id, row[0]) + delta
+            if not allow_negative and balances[user_id] < 0:
+                return None
+        for user_id, balance in balances.items():
+            self.rows[user_id][0] = balance
+        if once is not None:
+            self.applied.add(once)
+        return balances
+
+    async def get_many(self, user_ids):
+        return {user_id: (self.rows[user_id][0], self.rows[user_id][1], self.inventory.item_count(user_id))
+                for user_id in user_ids if user_id in self.rows}
+
+    async def upsert_many(self, deltas, vip=None, progress=None):
+        done = 0
+        for user_id, delta in deltas:
+            row = self._row(user_id)
+            row[0] = max(row[0] + delta, min(row[0], 0))
+            if vip is not None:
+                row[1] = bool(vip)
+            done += 1
+        if progress:
+            progress(done)
+        return done
+
+
+class MemoryInventoryRepo(InventoryRepo):
+    def __init__(self):
+        self.items = {}  # user_id -> {item_name: [item_category, item_value, quantity]}
+
+    async def add(self, user_id, item_name, item_category, item_value, quantity=1):
+        items = self.items.setdefault(user_id, {})
+        entry = items.get(item_name)
+        if entry:
+            entry[2] += quantity
+        else:
+            items[item_name] = [item_category, item_value, quantity]
+
+    async def list(self, user_id):
+        items = self.items.get(user_id, {})
+        rows = [(name, category, value, quantity)
+                for name, (category, value, quantity) in items.items()]
+        rows.sort(key=lambda row: (row[1], row[0]))
+        return rows
+
+    def item_count(self, user_id):
+        return sum(entry[2] for entry in self.items.get(user_id, {}).values())
+
+    async def count(self, user_id):
+        return self.item_count(user_id)
+
+    async def check_counts(self, fix=False):
+        # Tidak ada kolom denormalisasi di backend memori
+        return []
+
+    async def remove(self, user_id, item_name, quantity=1):
+        items = self.items.get(user_id, {})
+        entry = items.get(item_name)
+        if entry is None or entry[2] < quantity:
+            return False
+        entry[2] -= quantity
+        if entry[2] == 0:
+            del items[item_name]
+        return True
+
+    async def clear(self, user_id):
+        rows = await self.list(user_id)
+        self.items.pop(user_id, None)
+        return rows
+
+    async def add_many(self, quantities, item_name, item_category, item_value, progress=None):
+        done = 0
+        for user_id, quantity in quantities:
+            entry = self.items.setdefault(user_id, {}).get(item_name)
+            if entry:
+                entry[2] += quantity
+            else:
+                self.items[user_id][item_name] = [item_category, item_value, quantity]
+            done += 1
+        if progress:
+            progress(done)
+        return done
+
+
+class MemoryUsageRepo(UsageRepo):
+    def __init__(self):
+        self.rows = {}  # user_id -> [cari_count, last_reset]
+
+    async def get(self, user_id):
+        today = today_iso()
+        row = self.rows.get(user_id)
+        if row is None:
+            self.rows[user_id] = [0, today]
+            return 0
+        if row[1] != today:
+            row[0], row[1] = 0, today
+            return 0
+        return row[0]
+
+    async def increment(self, user_id):
+        today = today_iso()
+        row = self.rows.get(user_id)
+        if row is None:
+            self.rows[user_id] = [1, today]
+        else:
+            row[0] += 1
+            row[1] = today
+
+
+class MemoryMetaRepo(MetaRepo):
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+
+class MemoryStatsRepo(StatsRepo):
+    def __init__(self):
+        self.values = {}  # user_id -> {stat: value}
+
+    async def add_many(self, rows):
+        for user_id, stat, delta in rows:
+            stats = self.values.setdefault(user_id, {})
+            stats[stat] = stats.get(stat, 0) + delta
+
+    async def get(self, user_id):
+        return dict(self.values.get(user_id, {}))
+
+
+class MemoryMuteRepo(MuteRepo):
+    def __init__(self):
+        self.rows = {}  # (guild_id, user_id) -> unmute_at
+
+    async def add(self, guild_id, user_id, unmute_at):
+        self.rows[(guild_id, user_id)] = unmute_at
+
+    async def remove(self, guild_id, user_id):
+        self.rows.pop((guild_id, user_id), None)
+
+    async def list(self):
+        return [(guild_id, user_id, unmute_at)
+                for (guild_id, user_id), unmute_at in self.rows.items()]
+
+
+class MemoryTournamentRepo(TournamentRepo):
+    def __init__(self):
+        self.rows = {}  # tournament_id -> (active, state)
+
+    async def save(self, tournament_id, guild_id, state, active):
+        # Salinan lewat JSON, sama seperti yang tersimpan di SQLite
+        self.rows[tournament_id] = (active, json.dumps(state))
+
+    async def list_active(self):
+        return [json.loads(state) for active, state in self.rows.values() if active]
+
+
+class PartitionedStorage:
+    """Ekonomi per guild yang tersebar di beberapa file SQLite
+
+    `buckets=None`: satu file per guild (`guild-<id>.db`); angka: guild
+    di-hash ke salah satu dari `buckets` file (`bucket-<n>.db`). Tiap file
+    punya pool koneksi sendiri, jadi writer guild ramai tidak membuat guild
+    di file lain ikut mengantre. File dibuat dan di-init saat pertama dipakai.
+    """
+
+    def __init__(self, directory, buckets=None, busy_timeout=10.0, pool_size=8):
+        self.directory = directory
+        self.buckets = buckets
+        self.busy_timeout = busy_timeout
+        self.pool_size = pool_size
+        self._files = {}  # path -> SQLiteStorage yang sudah di-init
+        self._lock = asyncio.Lock()
+
+    def path_for(self, guild_id):
+        if self.buckets is None:
+            name = f"guild-{guild_id}.db"
+        else:
+            # Hash stabil (bukan hash() yang diacak per proses): semua shard harus memilih file yang sama
+            name = f"bucket-{zlib.crc32(str(guild_id).encode()) % self.buckets}.db"
+        return os.path.join(self.directory, name)
+
+    async def _open(self, path):
+        store = self._files.get(path)
+        if store is None:
+            async with self._lock:
+                store = self._files.get(path)
+                if store is None:
+                    os.makedirs(self.directory, exist_ok=True)
+                    store = SQLiteStorage(path, self.busy_timeout, self.pool_size)
+                    await store.init()
+                    self._files[path] = store
+        return store
+
+    async def for_guild(self, guild_id):
+        return (await self._open(self.path_for(guild_id))).scoped(guild_id)
+
+    async def partitions(self):
+        """Semua file partisi di direktori (termasuk buatan proses shard lain), untuk backup dan maintenance"""
+        pattern = 'guild-*.db' if self.buckets is None else 'bucket-*.db'
+        paths = sorted(glob.glob(os.path.join(self.directory, pattern)))
+        return [await self._open(path) for path in paths]
+
+    async def close(self):
+        files, self._files = self._files, {}
+        for store in files.values():
+            await store.close()
+
+
+def make_storage(backend, path, busy_timeout=10.0, pool_size=8):
+    if backend == 'memory':
+        return MemoryStorage()
+    if backend == 'sqlite':
+        return SQLiteStorage(path, busy_timeout, pool_size)
+    raise ValueError(f"Unknown storage backend: {backend!r}")
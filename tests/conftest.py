@@ -0,0 +1,9 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# bot.py membaca konfigurasi saat import; test tidak butuh Discord maupun userdata.db
+os.environ.setdefault('OWNER_ID', '1')
+os.environ.setdefault('STORAGE_BACKEND', 'memory')
@@ -0,0 +1,94 @@
+import random
+from array import array
+from collections import Counter
+
+import blackjack
+
+
+def card(rank):
+    """Kartu sekop dengan rank "2".."9", "T", "J", "Q", "K", "A" """
+    return "23456789TJQKA".index(rank) * 4
+
+
+def stacked_shoe(ranks):
+    """Shoe yang membagikan kartu persis sesuai urutan: pemain, pemain, dealer, dealer, lalu hit"""
+    shoe = blackjack.Shoe(decks=1, rng=random.Random(0))
+    shoe.cards = array('B', [card(rank) for rank in ranks])
+    shoe.position = 0
+    shoe.cut = len(shoe.cards)
+    return shoe
+
+
+def test_shoe_contains_every_card_per_deck():
+    shoe = blackjack.Shoe(decks=6, penetration=0.75, rng=random.Random(1))
+    assert len(shoe) == 6 * 52
+    assert Counter(shoe.cards) == {card: 6 for card in range(52)}
+    assert shoe.cut == 234
+
+
+def test_shoe_draw_and_cut_card():
+    shoe = blackjack.Shoe(decks=1, penetration=0.5, rng=random.Random(2))
+    drawn = [shoe.draw() for _ in range(26)]
+    assert len(set(drawn)) == 26
+    assert len(shoe) == 26
+    assert shoe.needs_shuffle()
+    shoe.shuffle()
+    assert len(shoe) == 52 and not shoe.needs_shuffle()
+
+
+def test_total_soft_and_hard():
+    assert blackjack.total([card('A'), card('6')]) == (17, True)
+    assert blackjack.total([card('A'), card('6'), card('9')]) == (16, False)
+    assert blackjack.total([card('A'), card('A'), card('9')]) == (21, True)
+    assert blackjack.is_blackjack([card('A'), card('K')])
+    assert not blackjack.is_blackjack([card('7'), card('7'), card('7')])
+
+
+def test_hand_natural_blackjack_pays_3_to_2():
+    hand = blackjack.Hand(stacked_shoe("AK95"), 10)
+    assert hand.finished and hand.outcome == 'blackjack'
+    assert hand.payout == 15
+
+
+def test_hand_both_blackjack_push():
+    hand = blackjack.Hand(stacked_shoe("AKAQ"), 10)
+    assert hand.outcome == 'push' and hand.payout == 0
+
+
+def test_hand_bust_loses():
+    hand = blackjack.Hand(stacked_shoe("T697" + "K"), 10)
+    hand.hit()
+    assert hand.finished and hand.outcome == 'lose' and hand.payout == -10
+
+
+def test_hand_dealer_draws_to_17_and_busts():
+    # Pemain 20 stand; dealer 16 wajib hit, dapat T -> bust
+    hand = blackjack.Hand(stacked_shoe("TQ97T"), 10)
+    hand.stand()
+    assert blackjack.total(hand.dealer)[0] == 26
+    assert hand.outcome == 'win' and hand.payout == 10
+
+
+def test_hand_double_takes_one_card_and_doubles_bet():
+    hand = blackjack.Hand(stacked_shoe("65T7" + "9"), 10)
+    assert hand.can_double
+    hand.double()
+    assert len(hand.player) == 3 and hand.finished
+    assert hand.bet == 20 and hand.outcome == 'win' and hand.payout == 20
+
+
+def test_hint_basic_strategy():
+    assert blackjack.hint([card('6'), card('5')], card('6')) == 'D'
+    assert blackjack.hint([card('6'), card('5')], card('6'), can_double=False) == 'H'
+    assert blackjack.hint([card('T'), card('6')], card('T')) == 'H'
+    assert blackjack.hint([card('T'), card('2')], card('4')) == 'S'
+    assert blackjack.hint([card('T'), card('7')], card('A')) == 'S'
+    assert blackjack.hint([card('K'), card('Q')], card('6')) == 'S'
+    assert blackjack.hint([card('5'), card('3')], card('T')) == 'H'
+    assert blackjack.hint([card('A'), card('7')], card('9')) == 'H'
+
+
+def test_simulated_house_edge_is_small():
+    result = blackjack.simulate(20000, rng=random.Random(3))
+    # Basic strategy 6 deck S17 tanpa split: EV sekitar -0.5% sampai -1%
+    assert -0.05 < result['ev'] < 0.02
@@ -0,0 +1,33 @@
+import bulk
+
+
+def test_parse_csv_header_defaults_and_duplicates():
+    text = "user_id,jumlah\n10,5\n11\n<@12>,\n10,2\n\n"
+    targets, skipped = bulk.parse_csv(text, default=100)
+    assert targets == {10: 7, 11: 100, 12: 100}
+    assert skipped == 0
+
+
+def test_parse_csv_skips_invalid_rows():
+    text = "10,5\nabc,1\n11,x\n12,0\n13,-4\n"
+    targets, skipped = bulk.parse_csv(text)
+    assert targets == {10: 5}
+    assert skipped == 4
+
+
+def test_parse_csv_without_default_needs_amount_column():
+    targets, skipped = bulk.parse_csv("10\n11,3\n", default=None)
+    assert targets == {11: 3}
+    assert skipped == 1
+
+
+def test_preview_debit_clamps_at_zero():
+    existing = {10: (50, False, 0), 11: (500, True, 3)}
+    summary = bulk.preview('debit', {10: 80, 11: 80, 12: 80}, existing, default_balance=100)
+    assert summary == {'targets': 3, 'new': 1, 'total': 50 + 80 + 80, 'emptied': 1}
+
+
+def test_preview_item_counts_over_capacity():
+    existing = {10: (0, False, 14), 11: (0, True, 14)}
+    summary = bulk.preview('item', {10: 2, 11: 2, 12: 1}, existing, default_balance=100)
+    assert summary['total'] == 5 and summary['over_capacity'] == 1
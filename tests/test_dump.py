@@ -0,0 +1,57 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+import dump
+from storage import SQLiteStorage
+
+
+async def seed(path):
+    storage = SQLiteStorage(path)
+    await storage.init()
+    for guild_id in (0, 7):
+        store = storage.scoped(guild_id)
+        for user_id in range(1, 6):
+            await store.users.get(user_id)
+            await store.users.update(user_id, balance=user_id * 10 + guild_id, vip=user_id % 2 == 0)
+            await store.inventory.add(user_id, "Botol Kaca", "recyclable", 12, user_id)
+            await store.inventory.add(user_id, "🐸 Pepe Sticker", "mythical", 400)
+            await store.usage.increment(user_id)
+    await storage.close()
+
+
+def snapshot(path):
+    db = sqlite3.connect(path)
+    try:
+        return {
+            'users': db.execute("SELECT * FROM users ORDER BY guild_id, user_id").fetchall(),
+            'inventory': db.execute("SELECT guild_id, user_id, item_name, item_category, item_value, quantity "
+                                    "FROM inventory ORDER BY guild_id, user_id, item_name").fetchall(),
+            'daily_usage': db.execute("SELECT * FROM daily_usage ORDER BY guild_id, user_id").fetchall(),
+        }
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("fmt, compress", [('jsonl', True), ('csv', True), ('csv', False)])
+def test_export_import_round_trip(tmp_path, fmt, compress):
+    source, target = str(tmp_path / 'source.db'), str(tmp_path / 'target.db')
+    directory = str(tmp_path / 'export')
+
+    async def main():
+        await seed(source)
+        exported = await dump.export(source, directory, fmt, compress, chunk=3)
+        storage = SQLiteStorage(target)
+        await storage.init()
+        await storage.close()
+        imported = await dump.import_(target, directory, chunk=3, batch=2)
+        # Import kedua menimpa baris yang sama, tidak menggandakan barang
+        await dump.import_(target, directory, chunk=3, batch=2)
+        return exported, imported
+
+    exported, imported = asyncio.run(main())
+    assert exported['tables']['users'] == 10
+    assert exported['tables']['inventory'] == 20
+    assert imported['tables'] == exported['tables']
+    assert snapshot(target) == snapshot(source)
@@ -0,0 +1,12 @@
+import re
+
+import bot
+
+
+def test_help_lists_exactly_the_registered_commands():
+    text = bot.help_text()
+    slash = set(re.findall(r"^/(\w+)", text, re.M))
+    prefix = set(re.findall(r"^!(\w+)", text, re.M))
+    tree = {command.name for command in bot.bot.tree.get_commands()}
+    assert slash == tree
+    assert prefix == {command.name for command in bot.bot.commands} - tree
@@ -0,0 +1,72 @@
+"""Semantik inventori command !inventori, !sell dan !jualall (backend memori)"""
+import asyncio
+
+import pytest
+
+import bot
+from storage import MemoryStorage
+
+
+class Member:
+    def __init__(self, user_id):
+        self.id = user_id
+        self.name = f"user{user_id}"
+        self.mention = f"<@{user_id}>"
+
+
+@pytest.fixture
+def author():
+    bot.set_storage(MemoryStorage())
+    member = Member(42)
+
+    async def seed():
+        await bot.get_user(member.id)
+        await bot.add_to_inventory(member.id, "Botol Kaca", "recyclable", 10, 2)
+        await bot.add_to_inventory(member.id, "Gold Coin", "legendary", 150)
+    asyncio.run(seed())
+    return member
+
+
+def state(user_id):
+    async def read():
+        return await bot.get_user(user_id), await bot.get_inventory(user_id)
+    return asyncio.run(read())
+
+
+def test_inventori_leaves_inventory_intact(author):
+    before = state(author.id)
+    text = asyncio.run(bot.inventori_response(author))
+    assert "Botol Kaca" in text and "Gold Coin" in text
+    assert state(author.id) == before
+
+
+def test_sell_removes_one_item_and_pays_its_value(author):
+    asyncio.run(bot.sell_response(author, "botol kaca"))
+    (balance, _), inventory = state(author.id)
+    assert balance == bot.DEFAULT_BALANCE + 10
+    assert inventory == [("Gold Coin", "legendary", 150, 1), ("Botol Kaca", "recyclable", 10, 1)]
+
+
+def test_sell_unknown_item_changes_nothing(author):
+    before = state(author.id)
+    text = asyncio.run(bot.sell_response(author, "Diamond Ring"))
+    assert "tidak ditemukan" in text
+    assert state(author.id) == before
+
+
+def test_vip_sell_pays_double(author):
+    asyncio.run(bot.update_user(author.id, vip=True))
+    asyncio.run(bot.sell_response(author, "Gold Coin"))
+    (balance, _), inventory = state(author.id)
+    assert balance == bot.DEFAULT_BALANCE + 300
+    assert [row[0] for row in inventory] == ["Botol Kaca"]
+
+
+def test_jualall_sells_everything_exactly_once(author):
+    asyncio.run(bot.jualall_response(author))
+    (balance, _), inventory = state(author.id)
+    assert inventory == []
+    assert balance == bot.DEFAULT_BALANCE + 2 * 10 + 150
+    text = asyncio.run(bot.jualall_response(author))
+    assert "kosong" in text
+    assert state(author.id)[0][0] == bot.DEFAULT_BALANCE + 170
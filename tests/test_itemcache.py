@@ -0,0 +1,42 @@
+from itemcache import ItemNameCache
+
+ROWS = [(name, 'mythical', 300, 1) for name in (
+    "🔥 This is Fine Sticker", "Botol Kaca", "Botol Plastik", "Kantong Plastik", "Plastik Kemasan")]
+
+
+def test_suggest_ranks_prefix_then_word_then_substring():
+    cache = ItemNameCache()
+    cache.put(1, ROWS)
+    assert cache.suggest(1, "plastik") == ["Plastik Kemasan", "Botol Plastik", "Kantong Plastik"]
+    assert cache.suggest(1, "this") == ["🔥 This is Fine Sticker"]
+    assert cache.suggest(1, "TIK") == ["Botol Plastik", "Kantong Plastik", "Plastik Kemasan"]
+    assert cache.suggest(1, "") == sorted((name for name, *_ in ROWS), key=str.casefold)
+    assert cache.suggest(1, "plastik", limit=1) == ["Plastik Kemasan"]
+
+
+def test_suggest_none_when_not_cached():
+    assert ItemNameCache().suggest(1, "botol") is None
+
+
+def test_added_removed_cleared_keep_cache_coherent():
+    cache = ItemNameCache()
+    cache.put(1, ROWS[:1])
+    cache.added(1, "Botol Kaca", 2)
+    cache.removed(1, "Botol Kaca")
+    assert cache.get(1)["Botol Kaca"] == 1
+    cache.removed(1, "Botol Kaca")
+    assert "Botol Kaca" not in cache.get(1)
+    cache.cleared(1)
+    assert cache.get(1) == {}
+
+
+def test_entries_expire_and_are_lru_bounded():
+    now = [0.0]
+    cache = ItemNameCache(max_users=2, ttl=10, clock=lambda: now[0])
+    cache.put(1, ROWS)
+    cache.put(2, ROWS)
+    cache.get(1)
+    cache.put(3, ROWS)
+    assert cache.get(2) is None and cache.get(1) is not None
+    now[0] = 11
+    assert cache.get(1) is None and len(cache) == 1
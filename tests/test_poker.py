@@ -0,0 +1,92 @@
+import itertools
+import random
+from collections import Counter
+
+import pytest
+
+import poker
+
+
+@pytest.fixture(scope='module', autouse=True)
+def tables():
+    poker.build_tables()
+
+
+def reference5(cards):
+    """Ranking 5 kartu yang ditulis langsung dari aturan, untuk dibandingkan dengan evaluate()"""
+    ranks = sorted((card >> 2 for card in cards), reverse=True)
+    flush = len({card & 3 for card in cards}) == 1
+    groups = sorted(Counter(ranks).items(), key=lambda item: (item[1], item[0]), reverse=True)
+    unique = sorted(set(ranks), reverse=True)
+    straight = None
+    if len(unique) == 5 and unique[0] - unique[4] == 4:
+        straight = unique[0]
+    elif unique == [12, 3, 2, 1, 0]:
+        straight = 3
+    counts = [count for _, count in groups]
+    order = [rank for rank, _ in groups]
+    if straight is not None and flush:
+        return (poker.STRAIGHT_FLUSH, straight)
+    if counts[0] == 4:
+        return (poker.QUADS, *order)
+    if counts[:2] == [3, 2]:
+        return (poker.FULL_HOUSE, *order)
+    if flush:
+        return (poker.FLUSH, *ranks)
+    if straight is not None:
+        return (poker.STRAIGHT, straight)
+    if counts[0] == 3:
+        return (poker.TRIPS, *order)
+    if counts[:2] == [2, 2]:
+        return (poker.TWO_PAIR, *order)
+    if counts[0] == 2:
+        return (poker.PAIR, *order)
+    return (poker.HIGH_CARD, *ranks)
+
+
+def reference(cards):
+    return max(reference5(hand) for hand in itertools.combinations(cards, 5))
+
+
+def cards(text):
+    return [poker.RANKS.index(card[0]) * 4 + "shdc".index(card[1]) for card in text.split()]
+
+
+@pytest.mark.parametrize("hand, category", [
+    ("As Ks Qs Js Ts 2d 3c", poker.STRAIGHT_FLUSH),
+    ("Ah 2h 3h 4h 5h Kd Kc", poker.STRAIGHT_FLUSH),
+    ("9s 9h 9d 9c 2s", poker.QUADS),
+    ("9s 9h 9d 2c 2s 2h", poker.FULL_HOUSE),
+    ("2s 7s 9s Js Ks Kd Kh", poker.FLUSH),
+    ("As 2d 3h 4c 5s", poker.STRAIGHT),
+    ("7s 7d 7h Kc 2s", poker.TRIPS),
+    ("7s 7d Kh Kc 2s 2d", poker.TWO_PAIR),
+    ("7s 7d Kh Qc 2s", poker.PAIR),
+    ("As Kd 9h 7c 2s", poker.HIGH_CARD),
+])
+def test_evaluate_categories(hand, category):
+    assert poker.category(poker.evaluate(cards(hand))) == category
+
+
+def test_wheel_loses_to_six_high_straight():
+    assert poker.evaluate(cards("As 2d 3h 4c 5s")) < poker.evaluate(cards("2d 3h 4c 5s 6d"))
+
+
+def test_evaluate_matches_brute_force():
+    rng = random.Random(1234)
+    deck = list(range(52))
+    hands = [rng.sample(deck, rng.choice((5, 6, 7))) for _ in range(3000)]
+    values = [poker.evaluate(hand) for hand in hands]
+    expected = [reference(hand) for hand in hands]
+    for value, ref in zip(values, expected):
+        assert poker.category(value) == ref[0]
+    # Urutan antar tangan harus sama persis dengan ranking referensi (termasuk seri)
+    for (value_a, ref_a), (value_b, ref_b) in zip(zip(values, expected), zip(values[1:], expected[1:])):
+        assert (value_a > value_b) == (ref_a > ref_b)
+        assert (value_a == value_b) == (ref_a == ref_b)
+
+
+def test_payout():
+    assert poker.payout('win', 10) == 10
+    assert poker.payout('lose', 10) == -10
+    assert poker.payout('push', 10) == 0
@@ -0,0 +1,44 @@
+import pvp
+
+
+def test_join_waits_when_queue_empty():
+    queue = pvp.MatchQueue(0.2)
+    assert queue.join(1, 100) is None
+    assert 1 in queue and len(queue) == 1
+
+
+def test_join_matches_compatible_bet():
+    queue = pvp.MatchQueue(0.2)
+    queue.join(1, 100, info='ctx1')
+    assert queue.join(2, 110) == (1, 100, 'ctx1')
+    assert len(queue) == 0 and 1 not in queue
+
+
+def test_join_rejects_bet_outside_tolerance():
+    queue = pvp.MatchQueue(0.2)
+    queue.join(1, 100)
+    assert queue.join(2, 130) is None
+    assert len(queue) == 2
+
+
+def test_join_prefers_closest_bet():
+    queue = pvp.MatchQueue(0.2)
+    queue.join(1, 100)
+    queue.join(2, 125)
+    assert queue.join(3, 112)[0] == 1
+    assert queue.join(4, 120)[0] == 2
+
+
+def test_join_breaks_ties_by_waiting_time():
+    queue = pvp.MatchQueue(0.1)
+    queue.join(1, 120)
+    queue.join(2, 100)
+    assert queue.join(3, 110)[0] == 1
+
+
+def test_leave_removes_user():
+    queue = pvp.MatchQueue(0.2)
+    queue.join(1, 100)
+    assert queue.leave(1)
+    assert not queue.leave(1)
+    assert queue.join(2, 100) is None
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+
+from scheduler import Scheduler
+
+
+def noop():
+    async def callback():
+        pass
+    return callback
+
+
+def test_pop_due_in_deadline_order():
+    scheduler = Scheduler(clock=lambda: 0)
+    scheduler.schedule('b', 20, noop())
+    scheduler.schedule('a', 10, noop())
+    scheduler.schedule('c', 30, noop())
+    assert scheduler.next_deadline() == 10
+    assert [key for key, _ in scheduler.pop_due(25)] == ['a', 'b']
+    assert len(scheduler) == 1 and 'c' in scheduler
+
+
+def test_reschedule_replaces_and_cancel_removes():
+    scheduler = Scheduler(clock=lambda: 0)
+    scheduler.schedule('mute', 10, noop())
+    scheduler.schedule('mute', 50, noop())
+    scheduler.schedule('other', 20, noop())
+    assert scheduler.cancel('other')
+    assert not scheduler.cancel('other')
+    assert scheduler.pop_due(40) == []
+    assert scheduler.next_deadline() == 50
+    assert [key for key, _ in scheduler.pop_due(50)] == ['mute']
+    assert scheduler.next_deadline() is None
+
+
+def test_running_scheduler_fires_jobs_and_survives_failures(caplog):
+    async def main():
+        loop = asyncio.get_running_loop()
+        scheduler = Scheduler(clock=loop.time)
+        fired = []
+
+        async def ok():
+            await asyncio.sleep(0.01)
+            fired.append('ok')
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        scheduler.start()
+        scheduler.schedule('broken', loop.time() + 0.01, broken)
+        scheduler.schedule('ok', loop.time() + 0.02, ok)
+        await asyncio.sleep(0.01)
+        scheduler.schedule('late', loop.time() + 0.05, ok)  # dijadwalkan setelah loop tidur
+        await asyncio.sleep(0.15)
+        await scheduler.stop()
+        return fired, scheduler
+
+    with caplog.at_level(logging.ERROR, logger='scheduler'):
+        fired, scheduler = asyncio.run(main())
+    assert fired == ['ok', 'ok']
+    assert len(scheduler) == 0 and not scheduler._running
+    assert any("'broken'" in record.getMessage() for record in caplog.records)
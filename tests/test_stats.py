@@ -0,0 +1,26 @@
+import asyncio
+
+from stats import StatsRecorder
+
+
+def test_cancelled_run_finishes_write_before_final_flush():
+    async def main():
+        written = []
+
+        async def write(rows):
+            await asyncio.sleep(0.05)
+            written.extend(rows)
+
+        recorder = StatsRecorder(write, None, interval=0.01)
+        recorder.pending[(1, 'items_sold')] = 1
+        task = asyncio.create_task(recorder.run())
+        await asyncio.sleep(0.03)  # flush periodik sedang menulis
+        recorder.pending[(1, 'sell_earned')] = 40
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await recorder.flush()  # seperti MyBot.close()
+        return written, recorder.pending
+
+    written, pending = asyncio.run(main())
+    assert sorted(written) == [(1, 'items_sold', 1), (1, 'sell_earned', 40)]
+    assert pending == {}
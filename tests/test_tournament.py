@@ -0,0 +1,82 @@
+import asyncio
+import random
+
+import pytest
+
+import bot
+import tournament
+from storage import MemoryStorage
+
+
+def play(players, entry_fee=100, seed=0):
+    rng = random.Random(seed)
+    tour = tournament.Tournament('t1', 1, 2, entry_fee, 128, 0)
+    for user_id in range(1, players + 1):
+        assert tour.join(user_id)
+    tour.start(rng)
+    while tour.status == 'running':
+        round_index, match_index, a, b = tour.pending()[0]
+        assert tour.report(round_index, match_index, rng.choice((a, b)))
+    return tour
+
+
+@pytest.mark.parametrize("players", [2, 3, 5, 128])
+def test_prizes_conserve_pool(players):
+    for seed in range(5):
+        tour = play(players, seed=seed)
+        prizes = tour.prizes()
+        assert sum(prizes.values()) == tour.pool
+        assert all(prize >= 0 for prize in prizes.values())
+        assert max(prizes, key=prizes.get) == tour.champion
+
+
+def test_prize_split_for_full_bracket():
+    tour = play(4, entry_fee=100)
+    prizes = tour.prizes()
+    assert len(prizes) == 4
+    assert sorted(prizes.values()) == [30, 30, 100, 240]
+
+
+def test_bracket_size_and_byes():
+    tour = play(5)
+    assert tour.total_rounds == 3
+    assert len(tour.rounds) == 3 and len(tour.rounds[0]) == 4
+
+
+def test_report_rejects_invalid_winner():
+    tour = tournament.Tournament('t1', 1, 2, 10, 8, 0)
+    for user_id in (1, 2):
+        tour.join(user_id)
+    tour.start(random.Random(0))
+    assert not tour.report(0, 0, 99)
+    assert tour.report(0, 0, 1)
+    assert not tour.report(0, 0, 2)
+    assert tour.champion == 1
+
+
+def test_round_trip_dict():
+    tour = play(5)
+    copy = tournament.Tournament.from_dict(tour.to_dict())
+    assert copy.to_dict() == tour.to_dict()
+    assert copy.prizes() == tour.prizes()
+
+
+def test_award_after_crash_pays_exactly_once(monkeypatch):
+    async def main():
+        bot.set_storage(MemoryStorage())
+        tour = play(4)
+        for user_id in tour.players:
+            await bot.get_user(user_id)
+        # Crash setelah hadiah dibayar tapi sebelum turnamen disimpan sebagai tidak aktif
+        await bot.save_tournament(tour)
+        await bot.award_tournament(tour)
+        await bot.save_tournament(tour)
+        assert [state['tournament_id'] for state in await bot.get_active_tournaments()] == ['t1']
+        await bot.resume_tournament(tour)
+        balances = {user_id: (await bot.get_user(user_id))[0] for user_id in tour.players}
+        return tour, balances, await bot.get_active_tournaments()
+
+    monkeypatch.setattr(bot.bot, 'wait_until_ready', lambda: asyncio.sleep(0))
+    tour, balances, active = asyncio.run(main())
+    assert balances == {user_id: bot.DEFAULT_BALANCE + tour.prizes().get(user_id, 0) for user_id in tour.players}
+    assert active == []
@@ -0,0 +1,209 @@
+"""Turnamen roulette: pendaftaran, bracket single elimination dan pembagian hadiah
+
+Tidak ada I/O di sini. bot.py memegang saldo: biaya masuk ditahan saat
+daftar, dan hadiah dibayar dalam satu transaksi. bot.py juga menjalankan
+tiap match sebagai duel pvp.Duel.
+
+State turnamen berupa dict JSON (`to_dict` / `from_dict`) yang disimpan
+ulang setiap berubah, jadi peserta, bracket dan hasil match bertahan saat
+restart. Match yang sedang berjalan saat restart dimulai ulang dari awal.
+
+`simulate()` memainkan satu bracket penuh secara headless. Semua match
+dalam satu ronde berjalan bersamaan di satu Scheduler dengan clock virtual,
+sama seperti di bot (satu timer loop, bukan satu task per match).
+"""
+import asyncio
+import random
+
+import pvp
+from scheduler import Scheduler
+
+# Bagian pot: juara, finalis, semifinalis yang kalah (dibagi rata)
+PRIZE_SPLIT = (0.6, 0.25, 0.15)
+
+
+def round_name(round_index, total_rounds):
+    remaining = total_rounds - round_index
+    return {1: "Final", 2: "Semifinal", 3: "Perempat Final"}.get(remaining, f"Ronde {round_index + 1}")
+
+
+class Tournament:
+    def __init__(self, tournament_id, guild_id, channel_id, entry_fee, max_players, starts_at, organizer_id=None):
+        self.tournament_id = tournament_id
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.entry_fee = entry_fee
+        self.max_players = max_players
+        self.starts_at = starts_at
+        self.organizer_id = organizer_id
+        self.status = 'signup'  # signup -> running -> finished, atau cancelled
+        self.players = []
+        self.rounds = []  # per ronde: [[pemain_a, pemain_b, pemenang], ...]; None = bye
+
+    @property
+    def pool(self):
+        return self.entry_fee * len(self.players)
+
+    @property
+    def total_rounds(self):
+        return max(1, (len(self.players) - 1).bit_length())
+
+    @property
+    def champion(self):
+        return self.rounds[-1][0][2] if self.status == 'finished' else None
+
+    def join(self, user_id):
+        if self.status != 'signup' or user_id in self.players or len(self.players) >= self.max_players:
+            return False
+        self.players.append(user_id)
+        return True
+
+    def leave(self, user_id):
+        if self.status != 'signup' or user_id not in self.players:
+            return False
+        self.players.remove(user_id)
+        return True
+
+    def alive(self, user_id):
+        """True kalau user terdaftar dan belum tersingkir"""
+        if self.status == 'signup':
+            return user_id in self.players
+        if self.status != 'running':
+            return False
+        return any(user_id in match[:2] and match[2] in (None, user_id) for match in self.rounds[-1])
+
+    def start(self, rng=random):
+        """Acak peserta ke bracket; slot kosong sampai pangkat dua menjadi bye"""
+        if self.status != 'signup' or len(self.players) < 2:
+            raise ValueError("Turnamen butuh minimal 2 peserta")
+        slots = list(self.players)
+        rng.shuffle(slots)
+        size = 1 << self.total_rounds
+        slots += [None] * (size - len(slots))
+        # Slot i melawan slot size-1-i: bye (di ekor) tidak pernah bertemu bye
+        self.rounds = [[[slots[i], slots[size - 1 - i], None] for i in range(size // 2)]]
+        self.status = 'running'
+        self._advance()
+
+    def _advance(self):
+        while True:
+            current = self.rounds[-1]
+            for match in current:
+                if match[2] is None and None in match[:2]:
+                    match[2] = match[0] if match[1] is None else match[1]  # bye: lolos otomatis
+            if any(match[2] is None for match in current):
+                return
+            if len(current) == 1:
+                self.status = 'finished'
+                return
+            winners = [match[2] for match in current]
+            self.rounds.append([[winners[i], winners[i + 1], None] for i in range(0, len(winners), 2)])
+
+    def pending(self):
+        """Match ronde sekarang yang belum selesai: [(ronde, index, pemain_a, pemain_b), ...]"""
+        if self.status != 'running':
+            return []
+        round_index = len(self.rounds) - 1
+        return [(round_index, index, a, b) for index, (a, b, winner) in enumerate(self.rounds[-1])
+                if winner is None]
+
+    def report(self, round_index, match_index, winner):
+        """Catat pemenang match; False kalau match tidak valid atau sudah selesai"""
+        if self.status != 'running' or round_index != len(self.rounds) - 1:
+            return False
+        match = self.rounds[round_index][match_index]
+        if match[2] is not None or winner not in match[:2]:
+            return False
+        match[2] = winner
+        self._advance()
+        return True
+
+    def prizes(self):
+        """{user_id: hadiah} setelah turnamen selesai; sisa pembulatan untuk juara"""
+        if self.status != 'finished':
+            return {}
+        final = self.rounds[-1][0]
+        champion, runner_up = final[2], final[0] if final[1] == final[2] else final[1]
+        semifinalists = []
+        if len(self.rounds) >= 2:
+            semifinalists = [a if b == winner else b for a, b, winner in self.rounds[-2]
+                             if a is not None and b is not None]
+        pool = self.pool
+        prizes = {runner_up: int(pool * PRIZE_SPLIT[1])}
+        for player in semifinalists:
+            prizes[player] = int(pool * PRIZE_SPLIT[2] / len(semifinalists))
+        prizes[champion] = pool - sum(prizes.values())
+        return prizes
+
+    def to_dict(self):
+        return {
+            'tournament_id': self.tournament_id, 'guild_id': self.guild_id,
+            'channel_id': self.channel_id, 'entry_fee': self.entry_fee,
+            'max_players': self.max_players, 'starts_at': self.starts_at,
+            'organizer_id': self.organizer_id, 'status': self.status,
+            'players': self.players, 'rounds': self.rounds,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        tournament = cls(state['tournament_id'], state['guild_id'], state['channel_id'], state['entry_fee'],
+                         state['max_players'], state['starts_at'], state.get('organizer_id'))
+        tournament.status = state['status']
+        tournament.players = list(state['players'])
+        tournament.rounds = [[list(match) for match in matches] for matches in state['rounds']]
+        return tournament
+
+
+def simulate(players=128, entry_fee=100, rng=None, think_time=(1.0, 10.0)):
+    """Mode headless: mainkan satu bracket penuh dengan pilihan acak
+
+    Tiap giliran dijadwalkan di Scheduler bersama dengan jeda "berpikir"
+    acak; clock virtual langsung melompat ke jadwal berikutnya.
+    """
+    rng = rng or random.Random()
+    now = [0.0]
+    scheduler = Scheduler(clock=lambda: now[0])
+    tournament = Tournament('sim', 0, 0, entry_fee, players, 0.0)
+    for player in range(1, players + 1):
+        tournament.join(player)
+    tournament.start(rng)
+    stats = {'matches': 0, 'turns': 0, 'max_concurrent': 0}
+
+    def start_round():
+        pending = tournament.pending()
+        stats['max_concurrent'] = max(stats['max_concurrent'], len(pending))
+        for round_index, match_index, a, b in pending:
+            duel = pvp.Duel((a, b), 0, rng)
+            duel.tournament = (tournament.tournament_id, round_index, match_index)
+            schedule_turn(duel)
+
+    def schedule_turn(duel):
+        async def turn():
+            duel.shoot(duel.turn, rng.random() < 0.5)
+            stats['turns'] += 1
+            if not duel.finished:
+                schedule_turn(duel)
+                return
+            stats['matches'] += 1
+            rounds_before = len(tournament.rounds)
+            tournament.report(duel.tournament[1], duel.tournament[2], duel.winner)
+            if len(tournament.rounds) > rounds_before:
+                start_round()
+        scheduler.schedule(('turn', duel.game_id), now[0] + rng.uniform(*think_time), turn)
+
+    async def run():
+        start_round()
+        while (deadline := scheduler.next_deadline()) is not None:
+            now[0] = deadline
+            for _, callback in scheduler.pop_due():
+                await callback()
+
+    asyncio.run(run())
+    stats.update({
+        'players': players,
+        'rounds': len(tournament.rounds),
+        'champion': tournament.champion,
+        'prizes': tournament.prizes(),
+        'virtual_seconds': round(now[0], 1),
+    })
+    return stats
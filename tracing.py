@@ -0,0 +1,161 @@
+"""Tracing per command dan profiler on-demand
+
+Trace aktif disimpan di contextvar, jadi helper database, ctx.send dan
+sleep di dalam command otomatis tercatat sebagai span tanpa perlu
+meneruskan objek trace ke mana-mana.
+"""
+import asyncio
+import contextlib
+import contextvars
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+
+try:
+    import yappi
+except ImportError:  # optional dependency
+    yappi = None
+
+log = logging.getLogger(__name__)
+
+current_trace = contextvars.ContextVar('current_trace', default=None)
+
+
+class Trace:
+    __slots__ = ('name', 'started', 'spans')
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.spans = []
+
+    def add(self, name, duration):
+        self.spans.append((name, duration))
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def breakdown(self):
+        """Gabungkan span dengan nama sama: {name: (count, total_seconds)}"""
+        result = {}
+        for name, duration in self.spans:
+            count, total = result.get(name, (0, 0.0))
+            result[name] = (count + 1, total + duration)
+        return result
+
+    def format(self, total=None):
+        total = self.elapsed() if total is None else total
+        parts = []
+        tracked = 0.0
+        for name, (count, spent) in sorted(self.breakdown().items(), key=lambda kv: -kv[1][1]):
+            tracked += spent
+            parts.append(f"{name} x{count} {spent * 1000:.1f}ms")
+        parts.append(f"untracked {max(0.0, total - tracked) * 1000:.1f}ms")
+        return f"{self.name} {total * 1000:.1f}ms: " + ", ".join(parts)
+
+
+def start_trace(name):
+    trace = Trace(name)
+    current_trace.set(trace)
+    return trace
+
+
+def end_trace():
+    trace = current_trace.get()
+    current_trace.set(None)
+    return trace
+
+
+@contextlib.contextmanager
+def span(name):
+    trace = current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - start)
+
+
+async def sleep(seconds):
+    """asyncio.sleep yang tercatat sebagai span 'sleep'"""
+    with span('sleep'):
+        await asyncio.sleep(seconds)
+
+
+class Profiler:
+    """Profiler sampling on/off; pakai yappi kalau ada (wall time per coroutine), kalau tidak cProfile"""
+
+    def __init__(self, output_dir='profiles'):
+        self.output_dir = output_dir
+        self._profile = None
+        self._stop_handle = None
+        self._callbacks = set()  # task on_stop yang sedang jalan, supaya tidak di-GC
+        self.started_at = None
+
+    @property
+    def running(self):
+        return self.started_at is not None
+
+    @property
+    def backend(self):
+        return 'yappi' if yappi is not None else 'cProfile'
+
+    def start(self, duration, on_stop=None):
+        """Mulai capture; otomatis berhenti setelah `duration` detik"""
+        if self.running:
+            raise RuntimeError("Profiler sudah berjalan")
+        if yappi is not None:
+            yappi.set_clock_type('wall')
+            yappi.clear_stats()
+            yappi.start()
+        else:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self.started_at = time.time()
+
+        def auto_stop():
+            report = self.stop()
+            if on_stop is not None:
+                task = asyncio.ensure_future(on_stop(report))
+                self._callbacks.add(task)
+                task.add_done_callback(self._callback_done)
+
+        self._stop_handle = asyncio.get_running_loop().call_later(duration, auto_stop)
+
+    def _callback_done(self, task):
+        self._callbacks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Callback profiler gagal", exc_info=task.exception())
+
+    def stop(self, top=15):
+        """Hentikan capture, simpan file .pstats dan kembalikan (path, ringkasan)"""
+        if not self.running:
+            return None
+        if self._stop_handle is not None:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+        if yappi is not None:
+            yappi.stop()
+            stats = yappi.convert2pstats(yappi.get_func_stats())
+        else:
+            self._profile.disable()
+            stats = self._profile
+            self._profile = None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at))
+        path = os.path.join(self.output_dir, f'profile-{stamp}.pstats')
+        self.started_at = None
+
+        stream = io.StringIO()
+        ps = pstats.Stats(stats, stream=stream)
+        ps.dump_stats(path)
+        ps.sort_stats('cumulative').print_stats(top)
+        return path, stream.getvalue()
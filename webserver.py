@@ -0,0 +1,123 @@
+"""HTTP server kecil berbasis asyncio untuk endpoint keep-alive/health/metrics
+
+Berjalan di event loop yang sama dengan bot, jadi tidak butuh thread
+terpisah dan berhenti bersih saat bot di-close. Hanya mendukung GET/HEAD
+tanpa body, cukup untuk health check orchestrator dan scrape Prometheus.
+"""
+import asyncio
+import inspect
+import logging
+from http import HTTPStatus
+from threading import Thread
+
+log = logging.getLogger(__name__)
+
+READ_TIMEOUT = 5
+MAX_HEADER_LINES = 100
+
+
+class WebServer:
+    def __init__(self, host='0.0.0.0', port=8080):
+        self.host = host
+        self.port = port
+        self.routes = {}
+        self._server = None
+
+    def route(self, path):
+        """Daftarkan handler; handler mengembalikan str atau (status, body[, content_type])"""
+        def decorator(func):
+            self.routes[path] = func
+            return func
+        return decorator
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        sockets = self._server.sockets or ()
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+        log.info("Web server listening on %s:%s", self.host, self.port)
+
+    async def stop(self):
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def dispatch(self, path):
+        """Jalankan handler untuk path dan kembalikan (status, content_type, body)"""
+        handler = self.routes.get(path)
+        if handler is None:
+            return 404, "text/plain; charset=utf-8", "Not Found"
+        result = handler()
+        if inspect.isawaitable(result):
+            result = await result
+        if isinstance(result, str):
+            return 200, "text/plain; charset=utf-8", result
+        status, body, *rest = result
+        content_type = rest[0] if rest else "text/plain; charset=utf-8"
+        return status, content_type, body
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), READ_TIMEOUT)
+            parts = request_line.decode('latin-1').split()
+            # Buang header, kita tidak memakainya
+            for _ in range(MAX_HEADER_LINES):
+                line = await asyncio.wait_for(reader.readline(), READ_TIMEOUT)
+                if line in (b'\r\n', b'\n', b''):
+                    break
+
+            if len(parts) < 2:
+                status, content_type, body = 400, "text/plain; charset=utf-8", "Bad Request"
+            elif parts[0] not in ('GET', 'HEAD'):
+                status, content_type, body = 405, "text/plain; charset=utf-8", "Method Not Allowed"
+            else:
+                path = parts[1].split('?', 1)[0]
+                try:
+                    status, content_type, body = await self.dispatch(path)
+                except Exception:
+                    log.exception("Error handling %s", path)
+                    status, content_type, body = 500, "text/plain; charset=utf-8", "Internal Server Error"
+
+            payload = body.encode('utf-8')
+            head = (
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode('latin-1')
+            writer.write(head if parts[:1] == ['HEAD'] else head + payload)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def serve_with_flask(server, loop):
+    """Fallback opsional: sajikan route yang sama lewat Flask di thread daemon
+
+    Handler tetap dijalankan di event loop bot, Flask hanya meneruskan request.
+    """
+    from flask import Flask, Response  # optional dependency
+
+    app = Flask('')
+
+    def make_view(path):
+        def view():
+            future = asyncio.run_coroutine_threadsafe(server.dispatch(path), loop)
+            status, content_type, body = future.result(timeout=READ_TIMEOUT)
+            return Response(body, status=status, content_type=content_type)
+        return view
+
+    for path in server.routes:
+        app.add_url_rule(path, endpoint=path, view_func=make_view(path))
+
+    t = Thread(target=app.run, kwargs={'host': server.host, 'port': server.port}, daemon=True)
+    t.start()
+    return t